@@ -8,6 +8,9 @@ ttc = None
 
 tag_to_class = ttc or {}
 
+# Element classes of ElementCollection classes, filled in lazily by ElementCollection
+collection_to_class = {}
+
 #
 # Whether or not Watip should wait for an element to be found or present before taking an action.
 # Defaults to true.
@@ -21,6 +24,22 @@ relaxed_locate = True
 
 default_timeout = 30
 
+#
+# Whether or not locator filters should be evaluated for all candidate elements with a single
+# script in the browser. Filters that can not be translated are always matched in Python.
+# Defaults to true.
+#
+
+match_in_browser = True
+
+#
+# Strategy new browsers use to build element locators, either 'xpath' or 'css'. Selectors that
+# can not be expressed in CSS are always built as XPath. Can be changed per browser with
+# Browser#locator_strategy. Defaults to 'xpath'.
+#
+
+locator_strategy = 'xpath'
+
 #
 # Custom logger
 #
@@ -43,5 +62,8 @@ from . import tag_map  # noqa
 
 
 def element_class_for(tag_name, default=None):
-    from .elements.html_elements import HTMLElement
-    return tag_to_class.get(tag_name, default or HTMLElement)
+    klass = tag_to_class.get(tag_name)
+    if klass is None:
+        from .elements.html_elements import HTMLElement
+        klass = default or HTMLElement
+    return klass
@@ -34,6 +34,7 @@ class Alert(Waitable):
         """
         self.wait_for_exists()
         self.alert.accept()
+        self.browser.new_epoch()
         self.browser.after_hooks.run()
 
     def close(self):
@@ -47,6 +48,7 @@ class Alert(Waitable):
         """
         self.wait_for_exists()
         self.alert.dismiss()
+        self.browser.new_epoch()
         self.browser.after_hooks.run()
 
     def set(self, value):
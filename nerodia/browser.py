@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from importlib import import_module
 
 import six
@@ -14,6 +15,7 @@ from .capabilities import Capabilities
 from .container import Container
 from .cookies import Cookies
 from .exception import Error
+from .form_filler import FormFiller
 from .has_window import HasWindow
 from .wait.timer import Timer
 from .wait.wait import Waitable
@@ -24,7 +26,55 @@ except ImportError:
     from urllib.parse import urlparse
 
 
-class Browser(Container, HasWindow, Waitable, Scrolling):
+# Key of the objects executed scripts return for elements, so they can be wrapped without
+# asking the browser for their tag names
+TAGGED_ELEMENT = '__nerodia_element__'
+
+# Runs a script and replaces the elements in its result by TAGGED_ELEMENT objects, every
+# array and object is copied once so cyclic or shared references are not walked again
+TAGGING_SCRIPT = """var result = (function() {
+%s
+}).apply(this, arguments);
+var seen = typeof Map === 'function' ? new Map() : null;
+function tag(value, depth) {
+    if (value === null || typeof value !== 'object' || depth > 100) {
+        return value;
+    }
+    if (value.nodeType === 1 && typeof value.tagName === 'string') {
+        return {'%s': value, 'tag_name': value.tagName.toLowerCase()};
+    }
+    if (seen && seen.has(value)) {
+        return seen.get(value);
+    }
+    var tagged, i, keys;
+    if (Array.isArray(value) || value instanceof NodeList || value instanceof HTMLCollection) {
+        tagged = [];
+        if (seen) { seen.set(value, tagged); }
+        for (i = 0; i < value.length; i++) { tagged.push(tag(value[i], depth + 1)); }
+        return tagged;
+    }
+    if (Object.prototype.toString.call(value) !== '[object Object]') {
+        return value;
+    }
+    tagged = {};
+    if (seen) { seen.set(value, tagged); }
+    keys = Object.keys(value);
+    for (i = 0; i < keys.length; i++) { tagged[keys[i]] = tag(value[keys[i]], depth + 1); }
+    return tagged;
+}
+return tag(result, 0);"""
+
+# Snippets whose results never hold elements, they are run without the tagging walk
+UNTAGGED_SNIPPETS = frozenset([
+    'actionability', 'areStale', 'attributeValues', 'backgroundColor', 'countElements',
+    'elementObscured', 'elementSnapshot', 'fireEvent', 'focus', 'getElementTags',
+    'getInnerHtml', 'getInnerText', 'getOuterHtml', 'getTextContent', 'isImageLoaded',
+    'matchElements', 'optionsSnapshot', 'selectOptionsLabel', 'selectOptionsText',
+    'selectOptionsValue', 'selectText', 'selectedText', 'setText', 'setValue', 'tableCells',
+    'whereJs'])
+
+
+class Browser(Container, FormFiller, HasWindow, Waitable, Scrolling):
     def __init__(self, browser='chrome', *args, **kwargs):
         """
         Creates a nerodia.browser.Browser instance
@@ -53,7 +103,12 @@ class Browser(Container, HasWindow, Waitable, Scrolling):
         self.default_context = True
         self._original_window = None
         self._locator_namespace = locators
+        self._locator_strategy = nerodia.locator_strategy
         self._timer = Timer()
+        self._epoch = 0
+        self._epoch_confirmed_by = None
+        self.epoch_marker = False
+        self._batch = None
 
     @property
     def locator_namespace(self):
@@ -67,6 +122,21 @@ class Browser(Container, HasWindow, Waitable, Scrolling):
     def locator_namespace(self, namespace):
         self._locator_namespace = namespace
 
+    @property
+    def locator_strategy(self):
+        """
+        Strategy used to build element locators, either 'xpath' or 'css'.
+        Defaults to nerodia.locator_strategy
+        :rtype: str
+        """
+        return self._locator_strategy
+
+    @locator_strategy.setter
+    def locator_strategy(self, strategy):
+        if strategy not in ('xpath', 'css'):
+            raise ValueError("expected 'xpath' or 'css', got {!r}".format(strategy))
+        self._locator_strategy = strategy
+
     @property
     def timer(self):
         return self._timer
@@ -79,6 +149,30 @@ class Browser(Container, HasWindow, Waitable, Scrolling):
     def wd(self):
         return self.driver
 
+    @property
+    def epoch(self):
+        """
+        Returns the navigation epoch of the page, which changes whenever nerodia navigates, clicks
+        or executes a user script. Elements validated as not stale in the current epoch are not
+        checked again when used as the scope of other elements.
+
+        When epoch_marker is set, the epoch is confirmed once per action with a marker stored in
+        the page, which also detects navigation nerodia did not initiate
+        :rtype: int
+        """
+        if self.epoch_marker and \
+                (not self.timer.locked or self._epoch_confirmed_by is not self.timer):
+            self._confirm_epoch()
+        return self._epoch
+
+    def new_epoch(self):
+        """
+        Starts a new navigation epoch, so previously located elements are checked for staleness
+        again before being used as a scope. Use after the page was changed outside of nerodia.
+        """
+        self._epoch += 1
+        self._epoch_confirmed_by = None
+
     @staticmethod
     def start(url, browser='chrome', *args, **kwargs):
         """
@@ -122,17 +216,20 @@ class Browser(Container, HasWindow, Waitable, Scrolling):
             uri = 'http://{}'.format(uri)
 
         self.driver.get(uri)
+        self.new_epoch()
         self.after_hooks.run()
         return uri
 
     def back(self):
         """ Navigates back in history """
         self.driver.back()
+        self.new_epoch()
         self.after_hooks.run()
 
     def forward(self):
         """ Navigates forward in history """
         self.driver.forward()
+        self.new_epoch()
         self.after_hooks.run()
 
     @property
@@ -202,6 +299,7 @@ class Browser(Container, HasWindow, Waitable, Scrolling):
     def refresh(self):
         """ Refreshes the current page """
         self.driver.refresh()
+        self.new_epoch()
         self.after_hooks.run()
 
     def wait(self, timeout=5):
@@ -220,7 +318,7 @@ class Browser(Container, HasWindow, Waitable, Scrolling):
         Returns the readyState of the document
         :rtype: str
         """
-        return self.execute_script('return document.readyState;')
+        return self.driver.execute_script('return document.readyState;')
 
     @property
     def status(self):
@@ -228,7 +326,7 @@ class Browser(Container, HasWindow, Waitable, Scrolling):
         Returns the text of the status bar
         :return:
         """
-        return self.execute_script('return window.status;')
+        return self.driver.execute_script('return window.status;')
 
     def execute_script(self, script, *args, function_name=None):
         """
@@ -238,16 +336,62 @@ class Browser(Container, HasWindow, Waitable, Scrolling):
         :param args: Arguments will be available in the given script in the 'arguments' pseudo-array
         :param function_name: name of function being executed
         :type function_name: str or None
-        :return: result of script
+        :return: result of script, or a DeferredResult when the script is queued in Browser#batch
         """
         from .elements.element import Element
+        from .script_batch import DEFERRABLE_SNIPPETS
         args = [e.wait_until(lambda x: x.exists).wd if isinstance(e, Element) else e for e in args]
+        if self._batch is not None:
+            if function_name is None or function_name in DEFERRABLE_SNIPPETS:
+                return self._batch.queue(script, args, function_name)
+            # the result is needed right away, run it after everything queued before it
+            self._batch.flush()
         if function_name:
             nerodia.logger.info(f'Executing Script on Browser: {function_name}')
-        returned = self.driver.execute_script(script, *args)
+        else:
+            # user scripts can change the page in any way
+            self.new_epoch()
+        returned = self.driver.execute_script(self._tagging(script, function_name), *args)
 
         return self._wrap_elements_in(self, returned)
 
+    @contextmanager
+    def batch(self):
+        """
+        Queues the scripts executed in the block and runs them in order with a single call to
+        the browser when the block exits
+
+        Inside the block, Browser#execute_script returns a DeferredResult instead of the result
+        of the script, resolved once the batch is flushed, as do nerodia snippets whose results
+        are not needed (focus, fire_event, flash, setting values with JavaScript, ...). Snippets
+        whose results nerodia needs flush the queue and run right away, as do scripts executed
+        in frames. Any other command sent to the browser, like locating elements, clicks,
+        typing, navigation or switching frames and windows, first flushes the queue, so queued
+        scripts keep their order and run in the document they were executed in.
+
+        :rtype: nerodia.script_batch.ScriptBatch
+
+        :Example:
+
+        with browser.batch():
+            title = browser.execute_script('return document.title;')
+            browser.text_field(id='new_user_email').fire_event('focus')
+        title.result   #=> 'Forms'
+        """
+        from .script_batch import ScriptBatch
+        if self._batch is not None:
+            yield self._batch
+            return
+
+        self._batch = ScriptBatch(self)
+        self._batch.attach()
+        try:
+            yield self._batch
+            self._batch.flush()
+        finally:
+            self._batch.detach()
+            self._batch = None
+
     def send_keys(self, *args):
         """
         Sends sequence of keystrokes to currently active element
@@ -278,6 +422,10 @@ class Browser(Container, HasWindow, Waitable, Scrolling):
     def browser(self):
         return self
 
+    @property
+    def query_scope(self):
+        return self
+
     def locate(self):
         if self.closed:
             raise Error('browser was closed')
@@ -293,6 +441,19 @@ class Browser(Container, HasWindow, Waitable, Scrolling):
         self.default_context = True
         self.after_hooks.run()
 
+    def _confirm_epoch(self):
+        script = 'if (window.__nerodiaEpoch === arguments[0]) { return true; } ' \
+                 'window.__nerodiaEpoch = arguments[1]; return false;'
+        if not self.driver.execute_script(script, self._epoch, self._epoch + 1):
+            self._epoch += 1
+        self._epoch_confirmed_by = self.timer
+
+    @staticmethod
+    def _tagging(script, *function_names):
+        if function_names and all(name in UNTAGGED_SNIPPETS for name in function_names):
+            return script
+        return TAGGING_SCRIPT % (script, TAGGED_ELEMENT)
+
     @staticmethod
     def _wrap_elements_in(scope, obj):
         if isinstance(obj, WebElement):
@@ -300,6 +461,8 @@ class Browser(Container, HasWindow, Waitable, Scrolling):
         elif isinstance(obj, list):
             return [Browser._wrap_elements_in(scope, e) for e in obj]
         elif isinstance(obj, dict):
+            if isinstance(obj.get(TAGGED_ELEMENT), WebElement):
+                return Browser._wrap_element(scope, obj[TAGGED_ELEMENT], obj.get('tag_name'))
             for k, v in obj.items():
                 obj[k] = Browser._wrap_elements_in(scope, v)
             return obj
@@ -307,7 +470,8 @@ class Browser(Container, HasWindow, Waitable, Scrolling):
             return obj
 
     @staticmethod
-    def _wrap_element(scope, element):
+    def _wrap_element(scope, element, tag_name=None):
         from .elements.html_elements import HTMLElement
-        klass = nerodia.element_class_for(element.tag_name.lower()) or HTMLElement
+        tag_name = tag_name or element.tag_name.lower()
+        klass = nerodia.element_class_for(tag_name) or HTMLElement
         return klass(scope, {'element': element})
@@ -6,10 +6,18 @@ from selenium.common.exceptions import StaleElementReferenceException
 
 import nerodia
 from nerodia.exception import LocatorException
+from nerodia.js_regexp import translate
 from nerodia.js_snippet import JSSnippet
+from nerodia.locators import NATIVE_FINDERS
 from nerodia.locators.class_helpers import ClassHelpers
+from nerodia.locators.element.selector_builder import CSS
 from nerodia.wait.wait import Waitable
 
+try:
+    from re import Pattern
+except ImportError:
+    from re import _pattern_type as Pattern
+
 
 class ElementCollection(ClassHelpers, JSSnippet, Waitable):
 
@@ -41,14 +49,13 @@ class ElementCollection(ClassHelpers, JSSnippet, Waitable):
         from .elements.input import Input
         self.reset()
         dic = {}
+        klass = self._element_class
         for idx, (el, tag_name) in enumerate(self._elements_with_tags):
-            selector = self.selector.copy()
-            if idx != 0:
-                selector['index'] = idx
             selector = dict(self.selector, index=idx)
-            element = self._element_class(self.query_scope, selector)
-            if element.__class__ in [HTMLElement, Input]:
-                element = self._construct_subtype(element, dic, tag_name)
+            element = klass(self.query_scope, selector)
+            if element.__class__ in (HTMLElement, Input):
+                dic[tag_name] = dic.get(tag_name, 0) + 1
+                element = self._construct_subtype(element, tag_name, dic[tag_name] - 1)
             element.cache = el
             self._els.append(element)
             yield element
@@ -56,9 +63,11 @@ class ElementCollection(ClassHelpers, JSSnippet, Waitable):
     def __len__(self):
         """
         Returns the number of elements in the collection
+        Elements are counted in the browser when the selector is a plain XPath or CSS selector,
+        and are never wrapped in Element instances
         :rtype: int
         """
-        return len([_ for _ in self])
+        return self._count()
 
     def __getitem__(self, idx):
         """
@@ -107,7 +116,7 @@ class ElementCollection(ClassHelpers, JSSnippet, Waitable):
         :return: True if no elements are found
         :rtype: bool
         """
-        return len(self) == 0
+        return self._count(limit=1) == 0
 
     empty = is_empty
 
@@ -123,7 +132,7 @@ class ElementCollection(ClassHelpers, JSSnippet, Waitable):
         :return: True if at least one element is found
         :rtype: bool
         """
-        return len(self) > 0
+        return self._count(limit=1) > 0
 
     exist = exists
 
@@ -194,11 +203,178 @@ class ElementCollection(ClassHelpers, JSSnippet, Waitable):
         """
         self._els = []
 
+    def snapshot(self):
+        """
+        Locates the elements once and freezes them, with their tag names, into a snapshot
+
+        Indexing, slicing, reversing and len on the snapshot never relocate or call the
+        browser; use ElementCollectionSnapshot#is_stale to check whether it is still valid
+
+        :rtype: ElementCollectionSnapshot
+
+        :Example:
+
+        rows = browser.trs().snapshot()
+        rows[-1].text
+        rows[::-1][0] == rows[-1]   #=> True
+        rows.is_stale()             #=> False
+        """
+        pairs = list(self._elements_with_tags)
+        els, tags = zip(*pairs) if pairs else ((), ())
+        return ElementCollectionSnapshot(self, els, tags)
+
+    def where(self, **conditions):
+        """
+        Returns a snapshot of the elements matching all of the given conditions, evaluated
+        in the browser with a single script
+
+        See ElementCollectionSnapshot#where for the supported conditions
+
+        :param conditions: names and expected values
+        :rtype: ElementCollectionSnapshot
+
+        :Example:
+
+        browser.divs().where(data_state='open', visible=True)[0].click()
+        """
+        return self.snapshot().where(**conditions)
+
+    def where_js(self, expression):
+        """
+        Returns a snapshot of the elements for which the given JavaScript expression is truthy,
+        evaluated in the browser with a single script
+
+        :param expression: JavaScript expression using element and index
+        :type expression: str
+        :rtype: ElementCollectionSnapshot
+
+        :Example:
+
+        browser.lis().where_js("element.textContent.indexOf('x') === 0")
+        """
+        return self.snapshot().where_js(expression)
+
+    @property
+    def texts(self):
+        """
+        Returns the visible text of every element in the collection, read with a single script
+        Options return their label, falling back to their text, as Option#text does
+
+        :rtype: list[str]
+
+        :Example:
+
+        browser.lis().texts   #=> ['foo', 'bar']
+        """
+        return self.pluck('text')['text']
+
+    def attribute_values(self, name):
+        """
+        Returns the given attribute of every element in the collection, read with a single script
+
+        :param name: name of the attribute (e.g. 'href', 'data-id' or 'data_id')
+        :rtype: list
+
+        :Example:
+
+        browser.links().attribute_values('href')   #=> ['http://foo.com/', None]
+        """
+        return self.pluck(name)[name]
+
+    def pluck(self, *names):
+        """
+        Returns the given properties of every element in the collection, read with a single
+        script and keyed by name
+
+        Names can be anything accepted by Element#snapshot; values are converted like the
+        properties of the collection's element class
+
+        :param names: names of the properties to read
+        :rtype: dict[str, list]
+
+        :Example:
+
+        browser.text_fields().pluck('id', 'value', 'data-id')
+        #=> {'id': ['first', 'last'], 'value': ['John', 'Doe'], 'data-id': ['1', '2']}
+        """
+        klass = self._element_class
+        specs = [klass._snapshot_field(name) for name in names]
+        fields = [{'name': name, 'kind': kind, 'attribute': attribute}
+                  for name, kind, attribute, _ in specs]
+        rows = self._snapshot_rows(fields) if specs else []
+        return {name: [klass._snapshot_value(name, kind, typ, row['fields'][name])
+                       for row in rows]
+                for name, kind, _, typ in specs}
+
+    def iter_chunks(self, size=500, fields=('text',)):
+        """
+        Yields the elements of the collection as lists of at most size records, each read with
+        a single script
+
+        Records are named tuples with the index of the element in the collection and the
+        given fields, which can be anything accepted by Element#snapshot. The collection is
+        located once, and the properties of each chunk of its elements are read when the
+        chunk is reached, without creating nerodia elements for them.
+
+        :param size: maximum number of records in a chunk
+        :param fields: names of the properties to read
+        :rtype: iter[list[namedtuple]]
+        :raises: ValueError if 'index' is one of the fields, as it is the name of the index field
+
+        :Example:
+
+        for chunk in browser.ul(id='feed').lis().iter_chunks(200, fields=('text', 'data_id')):
+            for item in chunk:
+                print(item.index, item.text, item.data_id)
+        """
+        if size < 1:
+            raise ValueError('size must be positive, got {}'.format(size))
+        fields = tuple(dict.fromkeys(fields))
+        if 'index' in fields:
+            raise ValueError("'index' can not be read as a field, it is the index of the record")
+        klass = self._element_class
+        specs = [klass._snapshot_field(name) for name in fields]
+        script_fields = [{'name': name, 'kind': kind, 'attribute': attribute}
+                         for name, kind, attribute, _ in specs]
+        record = klass._snapshot_record(('index',) + fields)
+
+        els = self._elements
+        for start in range(0, len(els), size):
+            rows = self._execute_js('elementSnapshot', els[start:start + size], script_fields, [])
+            yield [record(start + idx, *[klass._snapshot_value(name, kind, typ,
+                                                               row['fields'][name])
+                                         for name, kind, _, typ in specs])
+                   for idx, row in enumerate(rows)]
+
     # private
 
+    def _snapshot_rows(self, fields):
+        retries = 0
+        while retries <= 2:
+            try:
+                els = self._elements
+                return self._execute_js('elementSnapshot', els, fields, []) if els else []
+            except StaleElementReferenceException:
+                retries += 1
+                sleep(0.5)
+
+        raise LocatorException('Unable to locate element collection from {} due to changing '
+                               'page'.format(self.selector))
+
     @property
     def _elements(self):
         self._ensure_context()
+        try:
+            return self._locate_all_in_context()
+        except (StaleElementReferenceException, LocatorException):
+            if not getattr(self.query_scope, '_validated', False):
+                raise
+            # the scope was replaced without nerodia noticing, validate it again
+            self.browser.new_epoch()
+            self._ensure_context()
+            return self._locate_all_in_context()
+
+    def _locate_all_in_context(self):
         if 'scope' in self.selector_builder.built:
             return self.query_scope._element_call(lambda: self._locate_all())
         else:
@@ -228,7 +404,7 @@ class ElementCollection(ClassHelpers, JSSnippet, Waitable):
         if isinstance(self.query_scope, Browser) or \
                 (self.query_scope._located is False and isinstance(self.query_scope, IFrame)):
             self.query_scope.browser.locate()
-        elif self.query_scope._located and self.query_scope.stale:
+        elif self.query_scope._located and self.query_scope._stale_in_epoch:
             self.query_scope.locate()
         if isinstance(self.query_scope, IFrame):
             self.query_scope.switch_to()
@@ -236,8 +412,56 @@ class ElementCollection(ClassHelpers, JSSnippet, Waitable):
     def _locate_all(self):
         return self.locator.locate_all(self.selector_builder.built)
 
+    def _count(self, limit=None):
+        if 'element' in self.selector:
+            return len(list(self))
+        count = self._count_in_browser(limit)
+        return len(self._elements) if count is None else count
+
+    def _count_in_browser(self, limit=None):
+        """
+        Returns the number of matching elements, at most limit, counted with a single script
+        Returns None when the elements have to be matched in Python
+        """
+        query = self._browser_query()
+        if query is None:
+            return None
+        how, what = query
+        return int(self._in_scope(lambda scope: self._execute_js('countElements', how, what,
+                                                                 scope, limit)))
+
+    def _browser_query(self):
+        """
+        Returns how and what to find the elements with in the browser, or None when they have
+        to be matched in Python
+        """
+        built = dict(self.selector_builder.built)
+        fast_path = built.pop('fast_path', None)
+        built.pop('scope', None)
+        if fast_path in NATIVE_FINDERS:
+            built = CSS().build({fast_path: built[fast_path]})
+        if len(built) != 1 or not set(built).issubset({'xpath', 'css'}):
+            return None
+        return next(iter(built.items()))
+
+    def _in_scope(self, script):
+        """
+        Calls script with the DOM element to query from, None for the document
+        """
+        from nerodia.elements.i_frame import IFrame
+        self._ensure_context()
+        if 'scope' not in self.selector_builder.built or isinstance(self.query_scope, IFrame):
+            return script(None)
+        return self.query_scope._element_call(lambda: script(self.query_scope.el))
+
     @property
     def _element_class(self):
+        klass = nerodia.collection_to_class.get(self.__class__)
+        if klass is None:
+            klass = nerodia.collection_to_class[self.__class__] = self._resolve_element_class()
+        return klass
+
+    def _resolve_element_class(self):
         from .elements.svg_elements import SVGElementCollection
         from .elements.html_elements import HTMLElementCollection
         from .module_mapping import map_module
@@ -255,10 +479,228 @@ class ElementCollection(ClassHelpers, JSSnippet, Waitable):
                     'element class for {} could not be determined'.format(name))
         return getattr(module, name)
 
-    def _construct_subtype(self, element, dic, tag_name):
+    def _construct_subtype(self, element, tag_name, tag_index):
         selector = element.selector
-        dic[tag_name] = dic.get(tag_name, 0)
-        dic[tag_name] += 1
         kls = nerodia.element_class_for(tag_name)
-        selector.update({'index': dic[tag_name] - 1, 'tag_name': tag_name})
+        selector.update({'index': tag_index, 'tag_name': tag_name})
         return kls(self.query_scope, selector)
+
+
+class ElementCollectionSnapshot(object):
+    """
+    Immutable view of the elements of an ElementCollection located at one point in time
+
+    Views share the located WebElements and only differ by the indices they select, so slicing
+    and reversing do not copy them; elements are wrapped lazily and only once per snapshot
+    """
+
+    def __init__(self, collection, els, tags, indices=None, wrapped=None):
+        self.collection = collection
+        self._els = tuple(els)
+        self._tags = tuple(tags)
+        self._indices = range(len(self._els)) if indices is None else indices
+        self._wrapped = {} if wrapped is None else wrapped
+        self._tag_indices = None
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __getitem__(self, idx):
+        """
+        Get the element at the given index, or a snapshot of the given slice
+
+        :param idx: index or slice of the snapshot
+        :rtype: nerodia.elements.element.Element or ElementCollectionSnapshot
+        """
+        if isinstance(idx, slice):
+            return self._view(self._indices[idx])
+        return self._wrap(self._indices[idx])
+
+    def __iter__(self):
+        for index in self._indices:
+            yield self._wrap(index)
+
+    def __reversed__(self):
+        return iter(self.reverse())
+
+    def __repr__(self):
+        return '#<{}: {} of {}>'.format(self.__class__.__name__, len(self),
+                                        self.collection.__class__.__name__)
+
+    def reverse(self):
+        """
+        Returns a snapshot of the same elements in reverse order
+
+        :rtype: ElementCollectionSnapshot
+        """
+        return self._view(self._indices[::-1])
+
+    @property
+    def indices(self):
+        """
+        Returns the index of each element of the snapshot in the located collection
+
+        :rtype: tuple[int]
+        """
+        return tuple(self._indices)
+
+    @property
+    def tag_names(self):
+        """
+        Returns the tag name of each element of the snapshot
+
+        :rtype: tuple[str]
+        """
+        return tuple(self._tags[index] for index in self._indices)
+
+    @property
+    def wd(self):
+        """
+        Returns the Selenium WebElement of each element of the snapshot
+
+        :rtype: tuple[selenium.webdriver.remote.webelement.WebElement]
+        """
+        return tuple(self._els[index] for index in self._indices)
+
+    def is_stale(self):
+        """
+        Returns True if any element of the snapshot is no longer attached to the DOM, checked
+        with a single script
+
+        :rtype: bool
+        """
+        els = self.wd
+        if not els:
+            return False
+        self.collection._ensure_context()
+        try:
+            return self.collection._execute_js('areStale', list(els))
+        except StaleElementReferenceException:
+            return True
+
+    def where(self, **conditions):
+        """
+        Returns a snapshot of the elements matching all of the given conditions, evaluated
+        for every element with a single script
+
+        Conditions can be text (the visible text), tag_name, visible, class_name, style
+        (a dict of computed style properties) and any attribute of the element (e.g. href or
+        data_foo). Values are strings or regular expressions, and a boolean for visible.
+
+        :param conditions: names and expected values
+        :rtype: ElementCollectionSnapshot
+
+        :Example:
+
+        rows = browser.trs().snapshot()
+        rows.where(text=re.compile(r'^x'), visible=True, style={'display': 'table-row'})
+        """
+        filters = self._where_filters(conditions)
+        if not filters or not self:
+            return self._view(self._indices)
+        result = self._run_filter(lambda els: self.collection._execute_js('matchElements', els,
+                                                                          filters, None, False))
+        return self._view(tuple(self._indices[idx] for idx in result['indices']))
+
+    def where_js(self, expression):
+        """
+        Returns a snapshot of the elements for which the given JavaScript expression is truthy,
+        evaluated for every element with a single script
+
+        The expression can refer to the DOM element as element and its position in this
+        snapshot as index
+
+        :param expression: JavaScript expression
+        :type expression: str
+        :rtype: ElementCollectionSnapshot
+
+        :Example:
+
+        browser.divs().snapshot().where_js('element.children.length > 2')
+        """
+        if not self:
+            return self._view(self._indices)
+        script = 'return arguments[0].reduce(function(indices, element, index) {\n' \
+                 '    return (' + expression + ') ? indices.concat([index]) : indices;\n' \
+                 '}, []);'
+        scope = self.collection.query_scope
+        indices = self._run_filter(lambda els: scope.execute_script(script, els,
+                                                                    function_name='whereJs'))
+        return self._view(tuple(self._indices[idx] for idx in indices))
+
+    # private
+
+    def _run_filter(self, script):
+        els = list(self.wd)
+        self.collection._ensure_context()
+        try:
+            return script(els)
+        except StaleElementReferenceException:
+            raise LocatorException('Unable to filter element collection from {} due to changing '
+                                   'page'.format(self.collection.selector))
+
+    def _where_filters(self, conditions):
+        from .locators.element.matcher import BROWSER_MATCH_KEYS
+        klass = self.collection._element_class
+        filters = []
+        for how, expected in conditions.items():
+            if how == 'style':
+                filters.extend({'key': 'style', 'name': name,
+                                'values': [self._where_value('style', name, value)]}
+                               for name, value in expected.items())
+                continue
+            elif how in ('class', 'class_name'):
+                how, values = 'class', list(ClassHelpers._flatten([expected]))
+            else:
+                how, values = 'visible_text' if how == 'text' else how, [expected]
+
+            if how in BROWSER_MATCH_KEYS:
+                key, name = how, how
+            else:
+                key, name = 'attribute', klass._snapshot_field(how)[2]
+            filters.append({'key': key, 'name': name,
+                            'values': [self._where_value(how, name, value) for value in values]})
+        return filters
+
+    @staticmethod
+    def _where_value(how, name, value):
+        from .locators.element.matcher import Matcher
+        if isinstance(value, Pattern):
+            regexp = translate(value)
+            return {'pattern': regexp.source, 'flags': regexp.flags}
+        translated = Matcher._browser_value(how, value)
+        if translated is not None:
+            return translated
+        raise TypeError('expected str, bool (for visible) or Pattern for {}, got '
+                        '{!r}:{}'.format(name, value, value.__class__))
+
+    def _view(self, indices):
+        return self.__class__(self.collection, self._els, self._tags, indices, self._wrapped)
+
+    def _wrap(self, index):
+        element = self._wrapped.get(index)
+        if element is None:
+            element = self._wrapped[index] = self._build(index)
+        return element
+
+    def _build(self, index):
+        from .elements.html_elements import HTMLElement
+        from .elements.input import Input
+        collection = self.collection
+        element = collection._element_class(collection.query_scope,
+                                            dict(collection.selector, index=index))
+        if element.__class__ in (HTMLElement, Input):
+            element = collection._construct_subtype(element, self._tags[index],
+                                                    self._tag_index(index))
+        element.cache = self._els[index]
+        return element
+
+    def _tag_index(self, index):
+        if self._tag_indices is None:
+            seen = {}
+            tag_indices = []
+            for tag_name in self._tags:
+                tag_indices.append(seen.get(tag_name, 0))
+                seen[tag_name] = tag_indices[-1] + 1
+            self._tag_indices = tuple(tag_indices)
+        return self._tag_indices[index]
@@ -1,8 +1,12 @@
-from inspect import getmembers, isroutine, stack
+import sys
+from collections import namedtuple
+from inspect import getmembers, isroutine
+from logging import DEBUG
 from re import search, sub
+from types import MappingProxyType
 
 import six
-from selenium.common.exceptions import ElementNotInteractableException, \
+from selenium.common.exceptions import ElementNotInteractableException, JavascriptException, \
     NoSuchWindowException, StaleElementReferenceException, NoSuchElementException
 from selenium.webdriver.common.action_chains import ActionChains
 
@@ -11,12 +15,14 @@ from nerodia.adjacent import Adjacent
 from nerodia.browser import Browser
 from nerodia.container import Container
 from nerodia.elements.scroll import Scrolling
-from nerodia.exception import Error, NoMatchingWindowFoundException, ObjectDisabledException, \
-    ObjectReadOnlyException, UnknownFrameException, UnknownObjectException
+from nerodia.exception import Error, LocatorException, NoMatchingWindowFoundException, \
+    ObjectDisabledException, ObjectReadOnlyException, UnknownFrameException, \
+    UnknownObjectException
 from nerodia.js_execution import JSExecution
 from nerodia.js_snippet import JSSnippet
 from nerodia.locators.class_helpers import ClassHelpers
 from nerodia.locators.element.selector_builder import SelectorBuilder
+from nerodia.meta_elements import convert_attr
 from nerodia.user_editable import UserEditable
 from nerodia.wait.wait import TimeoutError, Waitable
 from nerodia.window import Dimension, Point
@@ -34,7 +40,19 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
                                    'valign', 'valuetype', 'vlink']
     keyword = None
 
+    SNAPSHOT_FIELDS = {'text': 'text', 'tag_name': 'tag_name', 'visible': 'visible',
+                       'enabled': 'enabled', 'focused': 'focused', 'location': 'rect',
+                       'size': 'rect', 'height': 'rect', 'width': 'rect', 'classes': 'classes',
+                       'inner_html': 'inner_html', 'outer_html': 'outer_html',
+                       'text_content': 'text_content'}
+    DEFAULT_SNAPSHOT = ('tag_name', 'text', 'visible', 'enabled', 'location', 'size', 'classes')
+
+    _snapshot_records = {}
+
+    _USER_EDITABLE_METHODS = frozenset(_[0] for _ in getmembers(UserEditable, predicate=isroutine))
+
     _content_editable = None
+    _validated_epoch = None  # browser epoch in which the element was last known not to be stale
     _selector_builder = None
     _element_matcher = None
     _locator = None
@@ -146,6 +164,7 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
                 self.el.click()
 
         self._element_call(method, self.wait_for_enabled)
+        self.browser.new_epoch()
         self.browser.after_hooks.run()
 
     def js_click(self):
@@ -156,6 +175,7 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
         browser.element(name='new_user_button').js_click()
         """
         self.fire_event('click')
+        self.browser.new_epoch()
         self.browser.after_hooks.run()
 
     def double_click(self):
@@ -169,6 +189,7 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
         """
         self._element_call(lambda: ActionChains(self.driver).double_click(self.el)
                            .perform(), self.wait_for_present)
+        self.browser.new_epoch()
         self.browser.after_hooks.run()
 
     def js_double_click(self):
@@ -179,6 +200,7 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
         browser.element(name='new_user_button').js_double_click()
         """
         self.fire_event('dblclick')
+        self.browser.new_epoch()
         self.browser.after_hooks.run()
 
     def right_click(self, *modifiers):
@@ -211,6 +233,7 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
                 action.context_click(self.el).perform()
 
         self._element_call(_right_click, self.wait_for_present)
+        self.browser.new_epoch()
         self.browser.after_hooks.run()
 
     def hover(self):
@@ -224,6 +247,7 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
         """
         self._element_call(lambda: ActionChains(self.driver).move_to_element(self.el)
                            .perform(), self.wait_for_present)
+        self.browser.new_epoch()
         self.browser.after_hooks.run()
 
     def drag_and_drop_on(self, other):
@@ -244,6 +268,7 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
         value = self._element_call(lambda: ActionChains(self.driver)
                                    .drag_and_drop(self.el, other.wd).perform(),
                                    self.wait_for_present)
+        self.browser.new_epoch()
         self.browser.after_hooks.run()
         return value
 
@@ -516,10 +541,13 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
         """
 
         def func():
+            # not displayed elements count as obscured, scrolling them does not move the page
+            self.scroll.to()
+            state = self._actionability()
+            if state is not None:
+                return state['obscured']
             if not self.present:
                 return True
-
-            self.scroll.to()
             return self._execute_js('elementObscured', self)
 
         return self._element_call(func)
@@ -542,6 +570,52 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
         else:
             return str(self.attribute_value('style')).strip()
 
+    def snapshot(self, *fields, styles=()):
+        """
+        Returns the given properties of the element, read with a single script
+
+        Fields can be any of text, tag_name, visible, enabled, focused, location, size, height,
+        width, classes, inner_html, outer_html and text_content, as well as attributes of the
+        element (e.g. 'id', 'href', 'data_foo'). Defaults to tag_name, text, visible, enabled,
+        location, size and classes. Fields are also read by name, which fields that are not
+        valid identifiers (e.g. 'class' or 'data-id') need; dashes are replaced by underscores
+        in attribute names, so 'data-id' can be read as data_id too.
+
+        :param fields: names of the properties to read
+        :param styles: computed style properties to read, returned as a read-only mapping
+                       in the 'styles' field
+        :rtype: namedtuple
+        :raises: ValueError if styles are read along with a field named 'styles'
+
+        :Example:
+
+        state = browser.button(id='new_user_button').snapshot('text', 'enabled', 'value')
+        state.text     #=> 'Create'
+        state.enabled  #=> True
+
+        browser.div(id='foo').snapshot('id', styles=['color']).styles['color']
+        #=> 'rgb(0, 0, 0)'
+
+        browser.label(id='first_label').snapshot('for', 'data-id')['for']  #=> 'new_user_first_name'
+        """
+        styles = list(styles)
+        fields = tuple(dict.fromkeys(fields)) or (() if styles else self.DEFAULT_SNAPSHOT)
+        if styles and 'styles' in fields:
+            raise ValueError("the 'styles' field can not be read along with computed styles")
+        specs = [self._snapshot_field(name) for name in fields]
+        script_fields = [{'name': name, 'kind': kind, 'attribute': attribute}
+                         for name, kind, attribute, _ in specs]
+
+        result = self._element_call(lambda: self._execute_js('elementSnapshot', self.el,
+                                                             script_fields, styles))
+
+        values = [self._snapshot_value(name, kind, typ, result['fields'][name])
+                  for name, kind, _, typ in specs]
+        if styles:
+            fields += ('styles',)
+            values.append(MappingProxyType(dict(result['styles'])))
+        return self._snapshot_record(fields)(*values)
+
     def to_subtype(self):
         """
         Cast this Element instance to a more specific subtype
@@ -605,10 +679,19 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
 
     def reset(self):
         self.el = None
+        self._validated_epoch = None
 
     def locate(self):
         self._ensure_context()
-        self.locate_in_context()
+        try:
+            self.locate_in_context()
+        except (StaleElementReferenceException, LocatorException):
+            if not getattr(self.query_scope, '_validated', False):
+                raise
+            # the scope was replaced without nerodia noticing, validate it again
+            self.browser.new_epoch()
+            self._ensure_context()
+            self.locate_in_context()
         return self
 
     def build(self):
@@ -648,48 +731,37 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
                                           'located'.format(nerodia.default_timeout, self))
 
     def wait_for_present(self):
-        pres = self.present
+        pres = self._present_check()
         if not nerodia.relaxed_locate or pres:
             return pres
 
         try:
             if not isinstance(self.query_scope, Browser):
                 self.query_scope.wait_for_present()
-            self.wait_until(lambda e: e.present)
+            self.wait_until(lambda e: e._present_check())
         except TimeoutError as e:
             raise self._unknown_exception('element located, but {}'.format(e))
 
     def wait_for_enabled(self):
-        from .button import Button
-        from .input import Input
-        from .option import Option
-        from .select import Select
-        if not nerodia.relaxed_locate:
-            return self._assert_enabled()
+        self._wait_for_enabled()
 
-        self.wait_for_exists()
-        if not any(isinstance(self, klass) for klass in [Input, Button, Select, Option]) \
-                and not self._content_editable:
+    def wait_for_writable(self):
+        state = self._wait_for_enabled()
+        # user editable elements can be written to while they stay content editable
+        editable = self._content_editable
+        if editable:
+            writable = self.content_editable if state is None else state['content_editable']
+        elif hasattr(type(self), 'readonly'):
+            writable = not (self.readonly if state is None else state['readonly'])
+        else:
             return
-        if self.enabled:
+        if writable:
             return
-
-        try:
-            self.wait_until(lambda e: e.enabled)
-        except TimeoutError:
-            self._raise_disabled()
-
-    def wait_for_writable(self):
-        self.wait_for_enabled()
         if not nerodia.relaxed_locate:
-            if hasattr(self, 'readonly') and self.readonly:
-                self._raise_writable()
-
-        if not hasattr(self, 'readonly') or not self.readonly:
-            return
+            self._raise_writable()
 
         try:
-            self.wait_until(lambda e: not getattr(e, 'readonly', None) or not e.readonly)
+            self.wait_until(lambda e: e.content_editable if editable else not e.readonly)
         except TimeoutError:
             self._raise_writable()
 
@@ -704,6 +776,8 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
 
     def locate_in_context(self):
         self.el = self.locator.locate(self.selector_builder.built)
+        if self.el is not None:
+            self._validated_epoch = self.browser._epoch
         return self.el
 
     # private
@@ -744,11 +818,127 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
         if isinstance(self.query_scope, Browser) or \
                 (self.query_scope._located is False and isinstance(self.query_scope, IFrame)):
             self.query_scope.browser.locate()
-        elif self.query_scope._located and self.query_scope.stale:
+        elif self.query_scope._located and self.query_scope._stale_in_epoch:
             self.query_scope.locate()
         if isinstance(self.query_scope, IFrame):
             self.query_scope.switch_to()
 
+    @property
+    def _validated(self):
+        """
+        Returns True if the element was validated as not stale in the browser's current epoch
+        :rtype: bool
+        """
+        return self._validated_epoch is not None and self._validated_epoch == self.browser._epoch
+
+    @property
+    def _stale_in_epoch(self):
+        """
+        Returns True if the element is stale, without checking elements already validated in
+        the browser's current epoch
+        :rtype: bool
+        """
+        epoch = self.browser.epoch
+        if self._validated_epoch == epoch:
+            self._ensure_context()  # still switch to the frame the element is in
+            return False
+        stale = self.stale
+        self._validated_epoch = None if stale else epoch
+        return stale
+
+    def _wait_for_enabled(self):
+        """
+        Waits for the element to be enabled
+        Returns the actionability state it was verified with, None if it had to wait or was not
+        checked
+        """
+        from .button import Button
+        from .input import Input
+        from .option import Option
+        from .select import Select
+        if not nerodia.relaxed_locate:
+            return self._assert_enabled()
+
+        self.wait_for_exists()
+        if not any(isinstance(self, klass) for klass in [Input, Button, Select, Option]) \
+                and not self._content_editable:
+            return None
+        state = self._actionability()
+        enabled = self.enabled if state is None else state['enabled']
+        if enabled:
+            return state
+
+        try:
+            self.wait_until(lambda e: e.enabled)
+        except TimeoutError:
+            self._raise_disabled()
+
+    def _actionability(self):
+        """
+        Returns whether the element is attached, displayed, enabled, readonly, content editable
+        and obscured, read with a single script
+        Returns None when the browser can not run the script, so each is checked on its own
+        :rtype: dict or None
+        """
+        try:
+            state = self._execute_js('actionability', self.el)
+        except JavascriptException:
+            return None
+        if not state['attached']:
+            raise StaleElementReferenceException('element is not attached to the page document')
+        return state
+
+    @classmethod
+    def _snapshot_field(cls, name):
+        fget = getattr(getattr(cls, name, None), 'fget', None)
+        if hasattr(fget, 'attribute'):
+            typ, attribute = fget.attribute
+            return name, 'attribute', attribute, typ
+        elif name in cls.SNAPSHOT_FIELDS:
+            return name, cls.SNAPSHOT_FIELDS[name], None, None
+        elif name.startswith(SelectorBuilder.WILDCARD_PREFIXES):
+            return name, 'attribute', name.replace('_', '-'), None
+        return name, 'attribute', name, None
+
+    @staticmethod
+    def _snapshot_value(name, kind, typ, value):
+        if kind == 'rect':
+            if name == 'location':
+                return Point(round(value['x']), round(value['y']))
+            elif name == 'size':
+                return Dimension(value['width'], value['height'])
+            return value[name]
+        elif kind == 'classes':
+            return tuple(value)
+        elif kind in ('inner_html', 'outer_html', 'text_content'):
+            # as the properties of the same names return them
+            return value.strip()
+        elif typ is not None:
+            return convert_attr(typ, value)
+        return value
+
+    @classmethod
+    def _snapshot_record(cls, fields):
+        record = cls._snapshot_records.get(fields)
+        if record is None:
+            positions = {name: idx for idx, name in enumerate(fields)}
+
+            def __getitem__(self, key):
+                if isinstance(key, six.string_types):
+                    try:
+                        key = positions[key]
+                    except KeyError:
+                        raise KeyError(key)
+                return tuple.__getitem__(self, key)
+
+            # fields that are not identifiers get positional names, and are read by name
+            base = namedtuple('ElementSnapshot', [name.replace('-', '_') for name in fields],
+                              rename=True)
+            record = type('ElementSnapshot', (base,), {'__slots__': (),
+                                                       '__getitem__': __getitem__})
+            cls._snapshot_records[fields] = record
+        return record
+
     def _assert_enabled(self):
         if not self._element_call(lambda: self.el.is_enabled()):
             raise ObjectDisabledException('object is disabled {}'.format(self))
@@ -759,6 +949,23 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
             raise TypeError('expected nerodia.Element, '
                             'got {}:{}'.format(obj, obj.__class__.__name__))
 
+    def _present_check(self):
+        """
+        Returns if the element exists and is displayed, read with the actionability probe
+        Falls back to #present when the browser can not run the probe
+        """
+        for _ in range(2):
+            try:
+                self.assert_exists()
+                state = self._actionability()
+            except (UnknownObjectException, UnknownFrameException):
+                return False
+            except StaleElementReferenceException:
+                self.reset()
+                continue
+            return self.present if state is None else state['displayed']
+        return False
+
     def _display_check(self):
         """
         Removes duplication in #present? & #visible? and makes setting deprecation notice easier
@@ -776,7 +983,8 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
             self.reset()
 
     def _element_call(self, method, precondition=None):
-        caller = stack()[1][3]
+        # the caller is only needed for debug logging, avoid inspecting the frame otherwise
+        caller = sys._getframe(1).f_code.co_name if nerodia.logger.isEnabledFor(DEBUG) else None
         already_locked = self.browser.timer.locked
         if not already_locked:
             from ..wait.timer import Timer
@@ -784,30 +992,35 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
         try:
             return self._element_call_check(precondition, method, caller)
         finally:
-            nerodia.logger.debug('<- `Completed {}#{}`'.format(self, caller))
+            if caller is not None:
+                nerodia.logger.debug('<- `Completed {}#{}`'.format(self, caller))
             if not already_locked:
                 self.browser.timer.reset()
 
     def _check_condition(self, condition, caller):
-        nerodia.logger.debug('<- `Verifying precondition {}#{} for '
-                             '{}`'.format(self, condition, caller))
+        if caller is not None:
+            nerodia.logger.debug('<- `Verifying precondition {}#{} for '
+                                 '{}`'.format(self, condition, caller))
         try:
             if not condition:
                 self.assert_exists()
             else:
                 condition()
-            nerodia.logger.debug('<- `Verified precondition '
-                                 '{}#{!r}`'.format(self, condition or 'assert_exists'))
+            if caller is not None:
+                nerodia.logger.debug('<- `Verified precondition '
+                                     '{}#{!r}`'.format(self, condition or 'assert_exists'))
         except self._unknown_exception:
             if condition is None:
-                nerodia.logger.debug('<- `Unable to satisfy precondition '
-                                     '{}#{}`'.format(self, condition))
+                if caller is not None:
+                    nerodia.logger.debug('<- `Unable to satisfy precondition '
+                                         '{}#{}`'.format(self, condition))
                 self._check_condition(self.wait_for_exists, caller)
             else:
                 raise
 
     def _element_call_check(self, precondition, method, caller):
-        nerodia.logger.debug('-> `Executing {}#{}`'.format(self, caller))
+        if caller is not None:
+            nerodia.logger.debug('-> `Executing {}#{}`'.format(self, caller))
         while True:
             try:
                 self._check_condition(precondition, caller)
@@ -838,15 +1051,11 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
             except NoSuchWindowException:
                 raise NoMatchingWindowFoundException('browser window was closed')
 
-    def __getattribute__(self, name):
-        if search(SelectorBuilder.WILDCARD_ATTRIBUTE, name):
-            return self.attribute_value(name.replace('_', '-'))
-        else:
-            return object.__getattribute__(self, name)
-
     def __getattr__(self, name):
-        if name in (_[0] for _ in getmembers(UserEditable, predicate=isroutine)) and \
-                self.content_editable:
+        # only called for missing attributes, so regular attribute access stays at full speed
+        if name.startswith(SelectorBuilder.WILDCARD_PREFIXES) and name.partition('_')[2]:
+            return self.attribute_value(name.replace('_', '-'))
+        elif name in self._USER_EDITABLE_METHODS and self.content_editable:
             self._content_editable = True
             setattr(self, name, six.create_bound_method(
                 six.get_unbound_function(getattr(UserEditable, name)), self))
@@ -1,11 +1,13 @@
 import six
 
 from .html_elements import HTMLElement
+from ..form_filler import FormFiller
 from ..meta_elements import MetaHTMLElement
 
 
 @six.add_metaclass(MetaHTMLElement)
-class Form(HTMLElement):
+class Form(FormFiller, HTMLElement):
     def submit(self):
         self._element_call(lambda: self.el.submit(), self.wait_for_present)
+        self.browser.new_epoch()
         self.browser.after_hooks.run()
@@ -40,9 +40,15 @@ class IFrame(HTMLElement):
         """ Executes JavaScript in context of frame """
         from nerodia.elements.element import Element
         args = [e.wait_until(lambda e: e.exists).wd if isinstance(e, Element) else e for e in args]
+        if self.browser._batch is not None:
+            # batches run in the browser's context, scripts in frames can not be queued
+            self.browser._batch.flush()
         if function_name:
             nerodia.logger.info(f'Executing Script on Frame: {function_name}')
-        returned = self.driver.execute_script(script, *args)
+        else:
+            self.browser.new_epoch()
+        returned = self.driver.execute_script(self.browser._tagging(script, function_name),
+                                              *args)
 
         return self.browser._wrap_elements_in(self, returned)
 
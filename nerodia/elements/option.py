@@ -6,6 +6,9 @@ from ..meta_elements import MetaHTMLElement
 
 @six.add_metaclass(MetaHTMLElement)
 class Option(HTMLElement):
+    # text is the label, as Option#text returns it
+    SNAPSHOT_FIELDS = dict(HTMLElement.SNAPSHOT_FIELDS, text='label')
+
     # alias
     def select(self):
         self.click()
@@ -1,10 +1,13 @@
 import re
+from collections import namedtuple
 
 import six
+from selenium.common.exceptions import JavascriptException
 
 import nerodia
 from nerodia.exception import Error, NoValueFoundException, ObjectDisabledException, \
     UnknownObjectException
+from nerodia.js_regexp import JSRegExp, escape, js_regexp
 from nerodia.wait.wait import TimeoutError
 from .html_elements import HTMLElement
 from ..meta_elements import MetaHTMLElement
@@ -15,6 +18,89 @@ try:
 except ImportError:
     from re import _pattern_type as Pattern
 
+# An option matching a term, with its text and selected state when the browser resolved them
+OptionMatch = namedtuple('OptionMatch', ['option', 'text', 'selected'])
+
+# State of an option in an OptionsSnapshot; label is the option's text when it has no label
+OptionState = namedtuple('OptionState', ['index', 'value', 'text', 'label', 'selected',
+                                         'disabled'])
+
+
+class OptionsSnapshot(object):
+    """
+    State of all options of a select list, read with a single script
+    """
+
+    COLUMNS = ('value', 'text', 'label', 'selected', 'disabled')
+
+    def __init__(self, table):
+        self._rows = tuple(OptionState(index, *row)
+                           for index, row in enumerate(zip(*(table[c] for c in self.COLUMNS))))
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, idx):
+        return self._rows[idx]
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    @property
+    def selected(self):
+        """
+        Returns the selected options
+        :rtype: tuple[OptionState]
+        """
+        return tuple(row for row in self._rows if row.selected)
+
+    @property
+    def value(self):
+        """
+        Returns the value of the first selected option, None if no option is selected
+        :rtype: str or None
+        """
+        selected = self.selected
+        return selected[0].value if selected else None
+
+    @property
+    def text(self):
+        """
+        Returns the text of the first selected option, None if no option is selected
+        :rtype: str or None
+        """
+        selected = self.selected
+        return selected[0].text if selected else None
+
+    def matching(self, term, how='text'):
+        """
+        Returns the options whose text, label or value equals the given string, or contains a
+        match for the given regex; the label of an option without one is its text
+
+        :param term: string or regex to match against the options
+        :param how: 'text', 'label' or 'value'
+        :rtype: tuple[OptionState]
+        """
+        if isinstance(term, Pattern):
+            return tuple(row for row in self._rows
+                         if getattr(row, how) is not None and re.search(term, getattr(row, how)))
+        elif isinstance(term, six.string_types):
+            return tuple(row for row in self._rows if getattr(row, how) == term)
+        raise TypeError('expected str or Pattern, got {}:{}'.format(term, term.__class__))
+
+    def is_selected(self, term):
+        """
+        Returns True if any option whose text or label matches the given value is selected
+
+        :param term: string or regex to match against the options
+        :rtype: bool
+        :raises: UnknownObjectException if no option matches
+        """
+        matches = self.matching(term, 'text') + self.matching(term, 'label')
+        if not matches:
+            raise UnknownObjectException('Unable to locate option matching {}'.format(term))
+        return any(row.selected for row in matches)
+
 
 @six.add_metaclass(MetaHTMLElement)
 class Select(HTMLElement):
@@ -79,6 +165,67 @@ class Select(HTMLElement):
                                  ids=['select_all'])
         return [self._js_select_by(t, 'multiple') for t in self._flatten(terms)][0]
 
+    def select_many(self, *terms):
+        """
+        Selects the options matching each of the given terms in a multi-select, resolving all
+        of them with a single scan of the options
+
+        Each term selects the options whose value matches it, or else their text, or else their
+        label. The selections are applied together, followed by a single input and change event,
+        and only once every term has matched.
+
+        :param terms: strings or regexes, or lists of them, to match against the options
+        :return: the text of the first option matching each term
+        :rtype: list[str]
+        :raises: NoValueFoundException listing all terms that matched no option
+
+        :Example:
+
+        browser.select_list(name='new_user_languages').select_many('Danish', re.compile('^Sw'))
+        #=> ['Danish', 'Swedish']
+        """
+        from nerodia.locators.element.matcher import Matcher
+        if not self.multiple:
+            raise Error('you can only use #select_many on multi-selects')
+        terms = list(self._flatten(terms))
+        types = [six.text_type, six.binary_type, Pattern]
+        for term in terms:
+            if type(term) not in types:
+                raise TypeError('expected {!r}, got {}:{}'.format(types, term, term.__class__))
+
+        ways = ['value', 'text', 'label']
+        expected = [Matcher._browser_value('text', term) for term in terms]
+        in_browser = None not in expected
+        state = {}
+
+        def func(sel):
+            result = sel._find_options_in_browser(ways, expected, apply=True) \
+                if in_browser else None
+            if result is None:
+                result = {'matches': [sel._matching_options_in_python(ways, term)
+                                      for term in terms], 'disabled': [], 'applied': False}
+            state.update(result)
+            return not all(result['matches']) and nerodia.relaxed_locate
+
+        try:
+            Wait.until_not(func, object=self)
+        except TimeoutError:
+            pass
+
+        missing = [term for term, matches in zip(terms, state['matches']) if not matches]
+        if missing:
+            self._raise_no_value_found(', '.join('{}'.format(term) for term in missing))
+        if state['disabled']:
+            term = terms[state['disabled'][0]]
+            raise ObjectDisabledException('option matching {} on {} is '
+                                          'disabled'.format(term, self))
+        if not state['applied']:
+            for match in (match for matches in state['matches'] for match in matches):
+                if not match.option.is_selected:
+                    match.option.click()
+        return [matches[0].text if matches[0].text is not None else matches[0].option.text
+                for matches in state['matches']]
+
     def select_value(self, value):
         """
         Selects the option(s) whose value attribute matches the given string
@@ -102,36 +249,38 @@ class Select(HTMLElement):
         :rtype: bool
         :raises: UnknownObjectException
         """
-        by_text = self.options(text=term)
-        if any(option.is_selected for option in by_text):
-            return True
-
-        by_label = self.options(label=term)
-        if any(option.is_selected for option in by_label):
-            return True
-
-        if len(by_text) + len(by_label) != 0:
-            return False
-
-        raise UnknownObjectException('Unable to locate option matching {}'.format(term))
+        return self.options_snapshot().is_selected(term)
 
     @property
-    def value(self):
+    def text(self):
         """
-        Returns the value of the first selected option in the select list
+        Returns the label of the first selected option in the select list, which is its text
+        when it has no label, as Option#text does
         Returns None if no option is selected
         :rtype: str or None
         """
-        selected = self.selected_options
-        return selected[0].value if selected else None
+        selected = self.options_snapshot().selected
+        if not selected:
+            return None
+        row = selected[0]
+        return row.label if row.label is not None else row.text
 
-    @property
-    def text(self):
-        # Returns the text of the first selected option in the select list
-        # Returns nil if no option is selected
-        # :rtype: str or None
-        selected = self.selected_options
-        return selected[0].text if selected else None
+    def options_snapshot(self):
+        """
+        Returns the index, value, text, label, selected and disabled state of all options,
+        read with a single script
+
+        :rtype: OptionsSnapshot
+
+        :Example:
+
+        options = browser.select_list(name='new_user_country').options_snapshot()
+        options.text                  #=> 'Norway'
+        options.is_selected('Sweden') #=> False
+        [o.value for o in options if not o.disabled]
+        """
+        return OptionsSnapshot(self._element_call(lambda: self._execute_js('optionsSnapshot',
+                                                                           self.el)))
 
     @property
     def selected_options(self):
@@ -154,25 +303,45 @@ class Select(HTMLElement):
 
     def _js_select_by(self, term, number):
         if isinstance(term, Pattern):
-            js_rx = term.pattern
-            js_rx = js_rx.replace('\\A', '^', 1)
-            js_rx = js_rx.replace('\\Z', '$', 1)
-            js_rx = js_rx.replace('\\z', '$', 1)
-            js_rx = re.sub(r'\(\?#.+\)', '', js_rx)
-            js_rx = re.sub(r'\(\?-\w+:', '(', js_rx)
+            regexp = js_regexp(term)
         elif type(term) in [six.text_type, six.binary_type]:
-            js_rx = '^{}$'.format(term)
+            # needs neither the u flag nor lookbehind, which older browsers do not support
+            regexp = JSRegExp('^{}$'.format(escape(term)), '')
         else:
             raise TypeError('expected String or Regexp, got {}'.format(term))
 
         for way in ['text', 'label', 'value']:
-            self._element_call(lambda: self._execute_js('selectOptions{}'.format(way.capitalize()),
-                                                        self, js_rx, str(number)))
+            if regexp is not None:
+                try:
+                    self._js_select_options(way, regexp, number)
+                except JavascriptException as e:
+                    nerodia.logger.debug('Unable to match {} in browser, matching in Python: '
+                                         '{}'.format(term, e.msg))
+                    regexp = None
+            if regexp is None:
+                self._js_select_matching_in_python(way, term, number)
             if self._is_matching_option(way, term):
                 return self.selected_options[0].text
 
         self._raise_no_value_found(term)
 
+    def _js_select_options(self, way, regexp, number):
+        self._element_call(lambda: self._execute_js('selectOptions{}'.format(way.capitalize()),
+                                                    self, regexp.source, str(number),
+                                                    regexp.flags))
+
+    def _js_select_matching_in_python(self, way, term, number):
+        """
+        Selects the options matched in Python, by their exact text, label or value, for terms
+        the browser can not match
+        """
+        matches = self.options_snapshot().matching(term, way)
+        if number == 'single':
+            matches = matches[:1]
+        if matches:
+            source = '^(?:{})$'.format('|'.join(escape(getattr(row, way)) for row in matches))
+            self._js_select_options(way, JSRegExp(source, ''), number)
+
     def _is_matching_option(self, how, what):
         for opt in self.selected_options:
             value = getattr(opt, how)
@@ -196,13 +365,9 @@ class Select(HTMLElement):
 
         def func(sel):
             if type(term) in types:
-                collection = sel.options(value=term) if how == 'value' else []
-                if not list(collection):
-                    collection = sel.options(text=term)
-                if not list(collection):
-                    collection = sel.options(label=term)
-                if collection:
-                    found.append(collection)
+                matches = sel._matching_options(how, term)
+                if matches:
+                    found.append(matches)
                     return False
                 else:
                     return not found and nerodia.relaxed_locate
@@ -217,13 +382,53 @@ class Select(HTMLElement):
         except TimeoutError:
             self._raise_no_value_found(term)
 
+    def _matching_options(self, how, term):
+        """
+        Returns the options whose value (when selecting by value), text or label matches the
+        term, trying each in turn; resolved with a single script unless the term can only be
+        matched in Python
+        """
+        from nerodia.locators.element.matcher import Matcher
+        ways = ['value', 'text', 'label'] if how == 'value' else ['text', 'label']
+        expected = Matcher._browser_value('text', term)
+        result = None if expected is None else self._find_options_in_browser(ways, [expected])
+        if result is None:
+            return self._matching_options_in_python(ways, term)
+        return result['matches'][0]
+
+    def _find_options_in_browser(self, ways, expected, apply=False):
+        """
+        Returns the options matching each of the expected values, resolved with a single script
+        Returns None when the browser can not run it, e.g. because it lacks regexp features
+        """
+        try:
+            result = self._element_call(lambda: self._execute_js('findOptions', self.el, ways,
+                                                                 expected, apply))
+        except JavascriptException as e:
+            nerodia.logger.debug('Unable to match options in browser, matching in Python: '
+                                 '{}'.format(e.msg))
+            return None
+        result['matches'] = [[OptionMatch(match['option'], match['text'], match['selected'])
+                              for match in matches] for matches in result['matches']]
+        return result
+
+    def _matching_options_in_python(self, ways, term):
+        for way in ways:
+            collection = list(self.options(**{way: term}))
+            if collection:
+                return [OptionMatch(option, None, None) for option in collection]
+        return []
+
     def _raise_no_value_found(self, term):
         raise NoValueFoundException('{} not found in {}'.format(term, self))
 
-    def _select_matching(self, elements):
+    def _select_matching(self, matches):
         if not self.multiple:
-            elements = elements[:1]
-        for element in elements:
-            if not element.is_selected:
-                element.click()
-        return '' if elements[0].stale else elements[0].text
+            matches = matches[:1]
+        for match in matches:
+            if not (match.option.is_selected if match.selected is None else match.selected):
+                match.option.click()
+        first = matches[0]
+        if first.option.stale:
+            return ''
+        return first.option.text if first.text is None else first.text
@@ -28,19 +28,60 @@ class Table(RowContainer, HTMLElement):
         Represents table rows as dictionaries
         :rtype: list[dict]
         """
-        all_rows = self.rows().locate()
-        if len(all_rows) > 0:
-            header_row = all_rows[0]
-        else:
+        return self.row_dicts()
+
+    def row_dicts(self, expand_spans=False, converters=None):
+        """
+        Represents the rows after the first as dictionaries keyed by the header cells (<th>) of
+        the first row, read with a single script
+
+        Each header is paired with the cell at its position in the row, so header rows with
+        leading data cells (e.g. an empty corner cell) line up with their columns.
+
+        :param expand_spans: whether cells spanning several columns or rows are repeated in each
+                             position they cover
+        :param converters: callables converting the text of the data cells (<td>) of a column,
+                           by header text or column index (e.g. {'Price': float})
+        :rtype: list[dict]
+
+        :Example:
+
+        browser.table(id='inventory').row_dicts(converters={'Count': int})
+        #=> [{'Item': 'Apples', 'Count': 3}]
+        """
+        rows = self._cell_rows(expand_spans)
+        if len(rows) == 0:
             raise Error('no rows in table')
-        headers = [cell.text for cell in header_row.ths()]
-        result = []
+        header_row, data_rows = rows[0], rows[1:]
+        headers = [(idx, text) for idx, (text, header) in enumerate(header_row) if header]
+        if converters:
+            # the first header cell of a text names its column
+            positions = {text: idx for idx, text in reversed(headers)}
+            converters = {positions.get(key, key): converter
+                          for key, converter in converters.items()}
 
-        for row in list(all_rows)[1:]:
-            self._cell_size_check(header_row, row)
-            result.append(dict(zip(headers, [cell.text for cell in row.cells()])))
+        result = []
+        for index, row in enumerate(data_rows):
+            if len(row) != len(header_row):
+                raise Error('row at index {} has {} cells, while header row has '
+                            '{}'.format(index, len(row), len(header_row)))
+            texts = self._convert(row, converters)
+            result.append({text: texts[idx] for idx, text in headers})
         return result
 
+    @property
+    def header_texts(self):
+        """
+        Returns the text of the header cells of the first row, or of all of its cells when it
+        has no <th> cells, read with a single script
+        :rtype: list[str]
+        """
+        rows = self._cell_rows()
+        if len(rows) == 0:
+            return []
+        headers = [text for text, header in rows[0] if header]
+        return headers or [text for text, _ in rows[0]]
+
     def headers(self, row=None):
         """
         Returns first row of Table with proper subtype
@@ -28,3 +28,7 @@ class UnknownFrameException(Error):
 
 class LocatorException(Error):
     pass
+
+
+class UntranslatableRegexpException(Error):
+    pass
@@ -0,0 +1,145 @@
+from collections.abc import Mapping
+from numbers import Number
+
+import six
+from selenium.common.exceptions import StaleElementReferenceException
+
+import nerodia
+from nerodia.exception import Error, NoValueFoundException, ObjectDisabledException, \
+    ObjectReadOnlyException, UnknownObjectException
+from nerodia.js_regexp import translate
+from nerodia.js_snippet import JSSnippet
+from nerodia.wait.wait import TimeoutError, Wait
+
+try:
+    from re import Pattern
+except ImportError:
+    from re import _pattern_type as Pattern
+
+FILL_PROBLEMS = {'missing': (UnknownObjectException, 'unable to locate'),
+                 'disabled': (ObjectDisabledException, 'disabled'),
+                 'readonly': (ObjectReadOnlyException, 'readonly'),
+                 'no_value': (NoValueFoundException, 'no option or value matching'),
+                 'unsupported': (Error, 'unable to set')}
+
+
+class FormFiller(JSSnippet):
+    def fill(self, fields, native_typing=False):
+        """
+        Sets the values of several form fields at once
+
+        Fields are given by name, by nerodia element or by selector, and resolved in this
+        container. All of them are checked for being present, enabled and not readonly with a
+        single script, and once they all are, that script sets their values and fires the input
+        and change events a user would. Nothing is set unless every field can be written to.
+
+        Text fields and text areas take strings (or numbers), select lists take strings, regexes
+        or lists of them matched like Select#select, radio groups take the value or label text of
+        the radio to select, and checkboxes take True or False, or the values of the checkboxes
+        of a group to check. File fields are always typed into.
+
+        :param fields: mapping or (field, value) pairs, fields being names, elements or selector
+                       dicts
+        :param native_typing: type into text fields with real keystrokes, either all of them with
+                              True or the given fields
+        :raises: UnknownObjectException, ObjectDisabledException, ObjectReadOnlyException or
+                 NoValueFoundException for the fields that can not be set once waiting times out
+
+        :Example:
+
+        browser.form(id='new_user').fill({'new_user_first_name': 'John',
+                                          'new_user_country': 'Norway',
+                                          'new_user_interests': ['Cars', 'Dancing'],
+                                          browser.checkbox(id='terms'): True},
+                                         native_typing=['new_user_first_name'])
+        """
+        fields = list(fields.items() if isinstance(fields, Mapping) else fields)
+        values = [self._fill_value(field, value) for field, value in fields]
+        targets = [None] * len(fields)
+        state = {}
+
+        def func(_):
+            try:
+                state.update(self._fill_fields(fields, values, targets, native_typing))
+            except StaleElementReferenceException:
+                # locate every field again on the next try
+                targets[:] = [None] * len(fields)
+                if not nerodia.relaxed_locate:
+                    raise
+                return True
+            problems = [problem for _, problem, _ in state['problems']]
+            return bool(problems) and 'unsupported' not in problems and nerodia.relaxed_locate
+
+        try:
+            Wait.until_not(func, object=self)
+        except TimeoutError:
+            pass
+
+        if state['problems']:
+            self._raise_fill_problems(fields, state['problems'])
+        for index, element, kind in state['typed']:
+            if kind != 'file':
+                element.el.clear()
+            element.el.send_keys(values[index]['text'])
+
+        self.browser.new_epoch()
+        self.browser.after_hooks.run()
+
+    # private
+
+    def _fill_fields(self, fields, values, targets, native_typing):
+        """ Locates the fields not located yet into targets and probes or sets all of them """
+        for index, (field, _) in enumerate(fields):
+            if targets[index] is None or targets[index]['missing']:
+                targets[index] = self._fill_target(field)
+        scope = None if self is self.browser else self
+        return self._execute_js(
+            'fillFields', scope,
+            [{'element': target['element'], 'name': target['name'], 'value': value,
+              'native': self._is_typed_natively(field, native_typing)}
+             for (field, _), target, value in zip(fields, targets, values)],
+            True)
+
+    def _fill_target(self, field):
+        from nerodia.elements.element import Element
+        if isinstance(field, six.string_types):
+            # named fields are looked up by the script
+            return {'element': None, 'name': field, 'missing': False}
+        element = field if isinstance(field, Element) else self.element(field)
+        found = element.el if element.exists else None
+        return {'element': found, 'name': None, 'missing': found is None}
+
+    @staticmethod
+    def _fill_value(field, value):
+        if isinstance(value, bool):
+            return {'checked': value}
+        elif isinstance(value, (six.string_types, Number)):
+            return {'text': str(value), 'terms': [{'equals': str(value)}]}
+        elif isinstance(value, Pattern):
+            regexp = translate(value)
+            return {'terms': [{'pattern': regexp.source, 'flags': regexp.flags}]}
+        elif isinstance(value, (list, tuple)):
+            terms = [FormFiller._fill_value(field, term) for term in value]
+            if all('terms' in term for term in terms):
+                return {'terms': [t for term in terms for t in term['terms']]}
+        raise TypeError('expected str, number, bool, Pattern or a list of them for {!r}, got '
+                        '{!r}:{}'.format(field, value, value.__class__))
+
+    @staticmethod
+    def _is_typed_natively(field, native_typing):
+        if isinstance(native_typing, bool):
+            return native_typing
+        return any(field is typed or isinstance(field, six.string_types) and field == typed
+                   for typed in native_typing)
+
+    def _raise_fill_problems(self, fields, problems):
+        messages = []
+        for index, problem, kind in problems:
+            field = fields[index][0]
+            description = 'field named {!r}'.format(field) \
+                if isinstance(field, six.string_types) else field
+            if kind is not None:
+                description = '{} {}'.format(kind, description)
+            messages.append('{} {}'.format(FILL_PROBLEMS[problem][1], description))
+        exception = FILL_PROBLEMS[problems[0][1]][0]
+        raise exception('unable to fill {}: {}'.format(self, '; '.join(messages)))
@@ -0,0 +1,273 @@
+"""
+Translation of Python regular expressions to equivalent JavaScript RegExps, so they can be
+matched in the browser
+
+Translated expressions always use the u flag, so they match code points like Python does and
+character classes can use Unicode properties. Anchors, dots and character class escapes are
+rewritten to behave like Python's instead of relying on the m and s flags, whose JavaScript
+meaning differs (e.g. JavaScript also breaks lines at carriage returns).
+"""
+import re
+import unicodedata
+from collections import namedtuple
+from functools import lru_cache
+
+from nerodia.exception import UntranslatableRegexpException
+
+JSRegExp = namedtuple('JSRegExp', ['source', 'flags'])
+
+UNTRANSLATABLE_FLAGS = ((re.VERBOSE, 'the VERBOSE flag'), (re.LOCALE, 'the LOCALE flag'))
+
+# Characters that keep their escape under the u flag; other escaped characters are literals
+SYNTAX_CHARACTERS = frozenset('^$\\.*+?()[]{}|/')
+
+QUANTIFIER = re.compile(r'\{(\d*)(?:(,)(\d*))?\}')
+GLOBAL_FLAGS = re.compile(r'\(\?[aiLmsux]+\)')
+OCTAL = re.compile(r'[0-3][0-7]{2}')
+
+WORD = r'_\p{L}\p{N}'
+SPACE = r'\t-\r\x1c- \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000'
+ASCII_SPACE = r'\t-\r '
+
+# (inside a set, outside a set) for each class escape; None has no equivalent inside a set
+UNICODE_CLASSES = {'d': (r'\p{Nd}', r'\p{Nd}'), 'D': (r'\P{Nd}', r'\P{Nd}'),
+                   'w': (WORD, '[{}]'.format(WORD)), 'W': (None, '[^{}]'.format(WORD)),
+                   's': (SPACE, '[{}]'.format(SPACE)), 'S': (None, '[^{}]'.format(SPACE))}
+ASCII_CLASSES = {'d': (r'\d', r'\d'), 'D': (r'\D', r'\D'), 'w': (r'\w', r'\w'),
+                 'W': (r'\W', r'\W'), 's': (ASCII_SPACE, '[{}]'.format(ASCII_SPACE)),
+                 'S': (None, '[^{}]'.format(ASCII_SPACE))}
+
+UNICODE_BOUNDARIES = {
+    'b': '(?:(?<=[{0}])(?![{0}])|(?<![{0}])(?=[{0}]))'.format(WORD),
+    'B': '(?:(?<=[{0}])(?=[{0}])|(?<![{0}])(?![{0}]))'.format(WORD)}
+ASCII_BOUNDARIES = {'b': r'\b', 'B': r'\B'}
+
+
+def translate(regexp):
+    """
+    Returns the JavaScript RegExp equivalent to the given compiled regular expression
+
+    Translations are memoized, so a pattern is only translated once.
+
+    :param regexp: compiled regular expression
+    :rtype: JSRegExp
+    :raises: UntranslatableRegexpException if the expression uses a construct JavaScript has no
+             equivalent for
+
+    :Example:
+
+    translate(re.compile(r'\\Aname', re.IGNORECASE))  #=> JSRegExp(source='^name', flags='iu')
+    """
+    js_regexp, reason = _translate(regexp.pattern, regexp.flags)
+    if js_regexp is None:
+        raise UntranslatableRegexpException('Unable to translate {!r} to a JavaScript RegExp: '
+                                            '{}'.format(regexp.pattern, reason))
+    return js_regexp
+
+
+def escape(text):
+    """
+    Escapes the special characters of text for a JavaScript RegExp source, with or without the
+    u flag
+
+    :param text: text to match literally
+    :rtype: str
+    """
+    return ''.join('\\' + char if char in SYNTAX_CHARACTERS else char for char in text)
+
+
+def js_regexp(regexp):
+    """
+    Returns the JavaScript RegExp equivalent to the given compiled regular expression, or None
+    if it can not be translated
+
+    :param regexp: compiled regular expression
+    :rtype: JSRegExp or None
+    """
+    return _translate(regexp.pattern, regexp.flags)[0]
+
+
+@lru_cache(maxsize=512)
+def _translate(pattern, flags):
+    """ Returns a (JSRegExp, None) pair, or (None, reason) when there is no equivalent """
+    if not isinstance(pattern, str):
+        return None, 'bytes patterns are not supported'
+    for flag, name in UNTRANSLATABLE_FLAGS:
+        if flags & flag:
+            return None, '{} is not supported'.format(name)
+    try:
+        source = _Translator(pattern, flags).translate()
+    except _Untranslatable as e:
+        return None, str(e)
+    return JSRegExp(source, 'iu' if flags & re.IGNORECASE else 'u'), None
+
+
+class _Untranslatable(Exception):
+    pass
+
+
+class _Translator(object):
+    def __init__(self, pattern, flags):
+        self.pattern = pattern
+        self.pos = 0
+        self.ascii = bool(flags & re.ASCII)
+        self.multiline = bool(flags & re.MULTILINE)
+        self.dotall = bool(flags & re.DOTALL)
+
+    def translate(self):
+        out = []
+        while self.pos < len(self.pattern):
+            char = self._next()
+            if char == '\\':
+                out.append(self._escape(in_set=False))
+            elif char == '[':
+                out.append(self._set())
+            elif char == '(':
+                out.append(self._group())
+            elif char == '.':
+                out.append(r'[\s\S]' if self.dotall else r'[^\n]')
+            elif char == '^':
+                out.append(r'(?:^|(?<=\n))' if self.multiline else '^')
+            elif char == '$':
+                out.append(r'(?=\n|$)' if self.multiline else r'(?=\n?$)')
+            elif char in '*+?':
+                out.append(char + self._lazy())
+            elif char == '{' and self._is_quantifier():
+                out.append(self._quantifier())
+            elif char in '|)':
+                out.append(char)
+            else:
+                out.append(self._literal(char))
+        return ''.join(out)
+
+    # private
+
+    def _next(self):
+        char = self.pattern[self.pos]
+        self.pos += 1
+        return char
+
+    def _peek(self, text):
+        return self.pattern.startswith(text, self.pos)
+
+    def _read_until(self, end):
+        stop = self.pattern.index(end, self.pos)
+        text, self.pos = self.pattern[self.pos:stop], stop + len(end)
+        return text
+
+    def _lazy(self):
+        if self._peek('+'):
+            raise _Untranslatable('possessive quantifiers are not supported')
+        if self._peek('?'):
+            self.pos += 1
+            return '?'
+        return ''
+
+    def _is_quantifier(self):
+        match = QUANTIFIER.match(self.pattern, self.pos - 1)
+        return match is not None and bool(match.group(1) or match.group(2))
+
+    def _quantifier(self):
+        match = QUANTIFIER.match(self.pattern, self.pos - 1)
+        self.pos = match.end()
+        low, comma, high = match.groups()
+        # Python allows omitting the lower bound, JavaScript reads {,n} as literal text
+        return '{{{}{}{}}}'.format(low or '0', comma or '', high or '') + self._lazy()
+
+    def _group(self):
+        if not self._peek('?'):
+            return '('
+        for prefix in ('?:', '?=', '?!', '?<=', '?<!'):
+            if self._peek(prefix):
+                self.pos += len(prefix)
+                return '(' + prefix
+        if self._peek('?P<'):
+            self.pos += 3
+            return '(?<{}>'.format(self._read_until('>'))
+        if self._peek('?P='):
+            self.pos += 3
+            return r'\k<{}>'.format(self._read_until(')'))
+        if self._peek('?#'):
+            self._read_until(')')
+            return ''
+        global_flags = GLOBAL_FLAGS.match(self.pattern, self.pos - 1)
+        if global_flags:
+            # already part of the flags of the compiled expression
+            self.pos = global_flags.end()
+            return ''
+        if self._peek('?>'):
+            raise _Untranslatable('atomic groups are not supported')
+        if self._peek('?('):
+            raise _Untranslatable('conditional groups are not supported')
+        raise _Untranslatable('inline flags scoped to a group are not supported')
+
+    def _set(self):
+        out = ['[']
+        if self._peek('^'):
+            out.append(self._next())
+        if self._peek(']'):
+            # a leading ] is a literal in Python, while [] is an empty set in JavaScript
+            self.pos += 1
+            out.append(r'\]')
+        while not self._peek(']'):
+            char = self._next()
+            if char == '\\':
+                out.append(self._escape(in_set=True))
+            elif char == '[':
+                out.append(r'\[')
+            else:
+                out.append(char)
+        self.pos += 1
+        out.append(']')
+        return ''.join(out)
+
+    def _escape(self, in_set):
+        char = self._next()
+        classes = ASCII_CLASSES if self.ascii else UNICODE_CLASSES
+        if char in classes:
+            translated = classes[char][0 if in_set else 1]
+            if translated is None:
+                raise _Untranslatable('\\{} is not supported inside a set'.format(char))
+            return translated
+        elif char == 'b' and in_set:
+            return _code_point(0x08)
+        elif char in 'bB':
+            return (ASCII_BOUNDARIES if self.ascii else UNICODE_BOUNDARIES)[char]
+        elif char == 'A':
+            return '^'
+        elif char == 'Z':
+            return '$'
+        elif char == 'a':
+            return _code_point(0x07)
+        elif char in 'fnrtv':
+            return '\\' + char
+        elif char in 'xuU':
+            digits = {'x': 2, 'u': 4, 'U': 8}[char]
+            code, self.pos = self.pattern[self.pos:self.pos + digits], self.pos + digits
+            return _code_point(int(code, 16))
+        elif char == 'N':
+            self.pos += 1
+            return _code_point(ord(unicodedata.lookup(self._read_until('}'))))
+        elif char == '0':
+            code = char
+            while len(code) < 3 and self.pos < len(self.pattern) and \
+                    self.pattern[self.pos] in '01234567':
+                code += self._next()
+            return _code_point(int(code, 8))
+        elif char.isdigit():
+            if OCTAL.match(self.pattern, self.pos - 1):
+                self.pos += 2
+                return _code_point(int(self.pattern[self.pos - 3:self.pos], 8))
+            if self.pos < len(self.pattern) and self.pattern[self.pos].isdigit():
+                char += self._next()
+            return '\\' + char
+        elif char in SYNTAX_CHARACTERS or char == '-' and in_set:
+            return '\\' + char
+        return char
+
+    def _literal(self, char):
+        return '\\' + char if char in SYNTAX_CHARACTERS else char
+
+
+def _code_point(code):
+    return '\\u{{{:x}}}'.format(code)
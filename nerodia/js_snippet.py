@@ -1,17 +1,152 @@
+import re
 from os import path
+from threading import Lock
+
+SNIPPETS_PATH = path.abspath(path.join(path.dirname(__file__), 'js_snippets'))
+HELPERS_PATH = path.join(SNIPPETS_PATH, 'helpers')
+
+COMMENT_LINE = re.compile(r'^\s*//')
+INCLUDE = re.compile(r'^\s*// include: (\w+(?:, \w+)*)\s*$', re.MULTILINE)
+
+
+class SnippetRegistry(object):
+    """
+    Loads the JavaScript snippets executed by nerodia once and keeps them wrapped and ready to
+    be sent to the browser
+
+    Snippets are read lazily from the registered directories, nerodia's own js_snippets first.
+    A snippet starting with an '// include: name, ...' comment gets the helpers of
+    js_snippets/helpers/<name>.js declared in the script before it, so helpers shared by
+    several snippets are kept in one place.
+    When minify is set, indentation, blank lines and whole-line comments are removed from
+    nerodia's own snippets and helpers before sending them. Snippets registered by users, from
+    their source or from their directories, are sent as they are, as removing indentation could
+    change template literals and multi-line strings.
+    """
+
+    def __init__(self, directories=(SNIPPETS_PATH,), minify=True):
+        self.directories = list(directories)
+        self._minify = minify
+        self._registered = {}
+        self._loaded = {}
+        self._bundled = set()
+        self._scripts = {}
+        self._lock = Lock()
+
+    @property
+    def minify(self):
+        return self._minify
+
+    @minify.setter
+    def minify(self, value):
+        with self._lock:
+            self._minify = value
+            self._scripts.clear()
+
+    def register(self, name, source):
+        """
+        Registers a snippet from its source, replacing any snippet of the same name
+
+        :param name: name the snippet is executed by
+        :param source: JavaScript function expression, called with the arguments of the script
+        :type source: str
+
+        :Example:
+
+        nerodia.js_snippet.snippets.register('isChecked', 'function(e) { return e.checked; }')
+        """
+        with self._lock:
+            self._registered[name] = source
+            self._scripts.pop(name, None)
+
+    def register_directory(self, directory):
+        """
+        Registers a directory of <name>.js snippets, looked up after the ones already registered
+
+        :param directory: path of the directory
+        :type directory: str
+        """
+        with self._lock:
+            self.directories.append(path.abspath(directory))
+
+    def __getitem__(self, name):
+        """
+        Returns the wrapped script of the given snippet
+
+        :param name: name of the snippet
+        :rtype: str
+        """
+        script = self._scripts.get(name)
+        if script is None:
+            source = self._source(name)
+            helpers = [self._helpers(helper) for helper in self._includes(source)]
+            if self._minify:
+                helpers = [self._minified(text) for text in helpers]
+                if name in self._bundled and name not in self._registered:
+                    source = self._minified(source)
+            with self._lock:
+                script = self._scripts[name] = '{}return ({}).apply(null, arguments)'.format(
+                    ''.join('{}\n'.format(text) for text in helpers), source)
+        return script
+
+    def __contains__(self, name):
+        return name in self._registered or self._find(name) is not None
+
+    def clear(self):
+        """ Forgets all loaded scripts, so snippet files are read from disk again """
+        with self._lock:
+            self._loaded.clear()
+            self._bundled.clear()
+            self._scripts.clear()
+
+    # private
+
+    def _source(self, name):
+        source = self._registered.get(name) or self._loaded.get(name)
+        if source is None:
+            filepath = self._find(name)
+            if filepath is None:
+                from nerodia.exception import Error
+                raise Error('Can not excute script as {!r} does not exist'.format(
+                    path.join(self.directories[0], '{}.js'.format(name))))
+            with open(filepath, 'r') as myfile:
+                source = self._loaded.setdefault(name, myfile.read())
+            if path.dirname(filepath) == SNIPPETS_PATH:
+                self._bundled.add(name)
+        return source
+
+    def _helpers(self, name):
+        key = path.join('helpers', name)
+        source = self._loaded.get(key)
+        if source is None:
+            with open(path.join(HELPERS_PATH, '{}.js'.format(name)), 'r') as myfile:
+                source = self._loaded.setdefault(key, myfile.read())
+        return source
+
+    @staticmethod
+    def _includes(source):
+        match = INCLUDE.search(source)
+        return match.group(1).split(', ') if match else []
+
+    def _find(self, name):
+        for directory in self.directories:
+            filepath = path.join(directory, '{}.js'.format(name))
+            if path.isfile(filepath):
+                return filepath
+        return None
+
+    @staticmethod
+    def _minified(source):
+        lines = (line.strip() for line in source.splitlines())
+        return '\n'.join(line for line in lines if line and not COMMENT_LINE.match(line))
+
+
+snippets = SnippetRegistry()
 
 
 class JSSnippet(object):
     # private
 
     def _execute_js(self, function_name, *args):
-        filepath = path.abspath(path.join(path.dirname(__file__),
-                                          'js_snippets',
-                                          '{}.js'.format(function_name)))
-        if not path.isfile(filepath):
-            from nerodia.exception import Error
-            raise Error('Can not excute script as {!r} does not exist'.format(filepath))
-
-        with open(filepath, 'r') as myfile:
-            script = 'return ({}).apply(null, arguments)'.format(myfile.read())
-            return self.query_scope.execute_script(script, *args, function_name=function_name)
+        return self.query_scope.execute_script(snippets[function_name], *args,
+                                               function_name=function_name)
@@ -0,0 +1,31 @@
+function(){
+    // include: domHelpers
+    var element = arguments[0];
+
+    function isObscured(element) {
+        var box = element.getBoundingClientRect();
+        var e = document.elementFromPoint(box.left + box.width / 2, box.top + box.height / 2);
+        for (; e; e = e.parentElement) {
+            if (e === element) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    var attached = element.isConnected === undefined ?
+        document.documentElement.contains(element) : element.isConnected;
+    if (!attached) {
+        return {attached: false};
+    }
+    var displayed = isShown(element);
+    return {
+        attached: true,
+        displayed: displayed,
+        enabled: !isDisabled(element),
+        readonly: element.readOnly === true || element.hasAttribute('readonly'),
+        content_editable: element.isContentEditable === true,
+        // at the current scroll position
+        obscured: !displayed || isObscured(element)
+    };
+}
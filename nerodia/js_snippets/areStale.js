@@ -0,0 +1,5 @@
+function(){
+    return arguments[0].some(function(e) {
+        return !(e.isConnected === undefined ? e.ownerDocument.contains(e) : e.isConnected);
+    });
+}
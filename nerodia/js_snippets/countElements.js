@@ -0,0 +1,19 @@
+function(){
+    var using = arguments[0];
+    var value = arguments[1];
+    var scope = arguments[2] || document;
+    var limit = arguments[3];
+
+    if (using === 'css') {
+        if (limit === 1) {
+            return scope.querySelector(value) === null ? 0 : 1;
+        }
+        return scope.querySelectorAll(value).length;
+    }
+    if (limit === 1) {
+        var first = document.evaluate(value, scope, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null);
+        return first.singleNodeValue === null ? 0 : 1;
+    }
+    return document.evaluate('count(' + value + ')', scope, null, XPathResult.NUMBER_TYPE,
+                             null).numberValue;
+}
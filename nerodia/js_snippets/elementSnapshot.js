@@ -0,0 +1,61 @@
+function(){
+    // include: domHelpers
+    var elements = arguments[0];
+    var fields = arguments[1];
+    var styles = arguments[2];
+
+    function rect(element) {
+        var box = element.getBoundingClientRect();
+        return {x: box.left + window.pageXOffset, y: box.top + window.pageYOffset,
+                width: box.width, height: box.height};
+    }
+
+    function fetch(element, field) {
+        switch (field.kind) {
+            case 'text':
+                return visibleText(element);
+            case 'label':
+                // the label of an option, its text when it has no label attribute
+                return element.label;
+            case 'tag_name':
+                return element.tagName.toLowerCase();
+            case 'visible':
+                return isShown(element);
+            case 'enabled':
+                return !isDisabled(element);
+            case 'focused':
+                return element === document.activeElement;
+            case 'rect':
+                return rect(element);
+            case 'classes':
+                return (element.getAttribute('class') || '').split(/\s+/).filter(function(name) {
+                    return name.length > 0;
+                });
+            case 'inner_html':
+                return element.innerHTML;
+            case 'outer_html':
+                return element.outerHTML;
+            case 'text_content':
+                return element.textContent;
+            default:
+                return attribute(element, field.attribute);
+        }
+    }
+
+    function snapshot(element) {
+        var result = {fields: {}, styles: {}};
+        fields.forEach(function(field) {
+            result.fields[field.name] = fetch(element, field);
+        });
+        if (styles.length > 0) {
+            var computed = window.getComputedStyle(element);
+            styles.forEach(function(name) {
+                result.styles[name] = computed.getPropertyValue(name);
+            });
+        }
+        return result;
+    }
+
+    // a list of elements is read in one go for ElementCollection#pluck
+    return Array.isArray(elements) ? elements.map(snapshot) : snapshot(elements);
+}
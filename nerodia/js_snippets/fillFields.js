@@ -0,0 +1,227 @@
+function(){
+    // include: domHelpers
+    var scope = arguments[0];
+    var fields = arguments[1];
+    var apply = arguments[2];
+
+    var UNSETTABLE_TYPES = ['button', 'hidden', 'image', 'reset', 'submit'];
+    var TYPED_KINDS = ['text', 'textarea', 'editable'];
+
+    // controls of a form include those associated with it through their form attribute
+    function named(name) {
+        var controls = scope === null ? document.querySelectorAll('[name]') :
+            scope.tagName.toUpperCase() === 'FORM' ? scope.elements :
+            scope.querySelectorAll('[name]');
+        return Array.prototype.filter.call(controls, function(control) {
+            return control.getAttribute('name') === name;
+        });
+    }
+
+    function kindOf(element) {
+        var tag = element.tagName.toUpperCase();
+        if (tag === 'SELECT' || tag === 'TEXTAREA') {
+            return tag.toLowerCase();
+        }
+        if (tag === 'INPUT') {
+            var type = (element.type || 'text').toLowerCase();
+            if (UNSETTABLE_TYPES.indexOf(type) !== -1) {
+                return null;
+            }
+            return type === 'checkbox' || type === 'radio' || type === 'file' ? type : 'text';
+        }
+        return element.isContentEditable ? 'editable' : null;
+    }
+
+    function matcher(expected) {
+        var regexp = expected.pattern === undefined ? null :
+            new RegExp(expected.pattern, expected.flags);
+        return function(value) {
+            return value !== null && (regexp === null ? value === expected.equals :
+                regexp.test(value));
+        };
+    }
+
+    function matchesAny(terms, value) {
+        return terms.some(function(expected) { return matcher(expected)(value); });
+    }
+
+    function labelText(element) {
+        var labels = element.labels || [];
+        return labels.length === 0 ? null : labels[0].textContent.replace(/\s+/g, ' ').trim();
+    }
+
+    // the first of value, text and label that matches any option wins, as in Select#select
+    function matchingOptions(select, expected) {
+        var options = Array.prototype.slice.call(select.options);
+        var ways = [function(o) { return o.value; }, function(o) { return o.text; },
+                    function(o) { return o.getAttribute('label'); }];
+        var matches = matcher(expected);
+        for (var i = 0; i < ways.length; i++) {
+            var result = options.filter(function(option) { return matches(ways[i](option)); });
+            if (result.length > 0) {
+                return result;
+            }
+        }
+        return [];
+    }
+
+    // the radio of a group whose value, or else label text, matches the term
+    function matchingRadio(radios, expected) {
+        var matches = matcher(expected);
+        return radios.filter(function(radio) { return matches(radio.value); })[0] ||
+            radios.filter(function(radio) { return matches(labelText(radio)); })[0] || null;
+    }
+
+    // resolves the elements of a field and what should be done to them, or the problem
+    function plan(field) {
+        var elements = field.element === null ?
+            (field.name === null ? [] : named(field.name)) : [field.element];
+        if (elements.length === 0) {
+            return {problem: 'missing'};
+        }
+        var kind = kindOf(elements[0]);
+        var value = field.value;
+        if (kind === 'radio') {
+            elements = elements.filter(function(element) { return kindOf(element) === 'radio'; });
+            var radio = value.checked === true && elements.length === 1 ? elements[0] :
+                value.terms !== undefined && value.terms.length === 1 ?
+                matchingRadio(elements, value.terms[0]) : undefined;
+            if (radio === undefined) {
+                return {problem: 'unsupported', kind: kind};
+            }
+            if (radio === null) {
+                return {problem: 'no_value', kind: kind};
+            }
+            return {kind: kind, element: radio, targets: [[radio, true]]};
+        }
+        if (kind === 'checkbox') {
+            elements = elements.filter(function(element) {
+                return kindOf(element) === 'checkbox';
+            });
+            return {kind: kind, element: elements[0], targets: elements.map(function(element) {
+                return [element, value.checked === undefined ?
+                    matchesAny(value.terms, element.value) : value.checked];
+            })};
+        }
+        if (kind === 'select') {
+            var select = elements[0];
+            if (value.terms === undefined || value.terms.length > 1 && !select.multiple) {
+                return {problem: 'unsupported', kind: kind};
+            }
+            var options = [];
+            for (var i = 0; i < value.terms.length; i++) {
+                var found = matchingOptions(select, value.terms[i]);
+                if (found.length === 0) {
+                    return {problem: 'no_value', kind: kind};
+                }
+                if (found.some(function(option) { return option.disabled; })) {
+                    return {problem: 'disabled', kind: kind};
+                }
+                options = options.concat(select.multiple ? found : found.slice(0, 1));
+            }
+            return {kind: kind, element: select, options: options};
+        }
+        if (kind === null || value.text === undefined) {
+            return {problem: 'unsupported', kind: kind};
+        }
+        return {kind: kind, element: elements[0]};
+    }
+
+    function probe(step) {
+        if (step.problem !== undefined) {
+            return step.problem;
+        }
+        var element = step.element;
+        // only the checkboxes and radios whose state changes need to be enabled
+        var disabled = step.targets === undefined ? isDisabled(element) :
+            step.targets.some(function(target) {
+                return target[0].checked !== target[1] && isDisabled(target[0]);
+            });
+        if (disabled) {
+            return 'disabled';
+        }
+        if ((step.kind === 'text' || step.kind === 'textarea') && element.readOnly) {
+            return 'readonly';
+        }
+        return null;
+    }
+
+    function dispatch(element, types) {
+        types.forEach(function(type) {
+            var event = document.createEvent('HTMLEvents');
+            event.initEvent(type, true, false);
+            element.dispatchEvent(event);
+        });
+    }
+
+    // the setter of the prototype, so frameworks tracking the value property notice the change
+    function setValue(element, text) {
+        var prototype = Object.getPrototypeOf(element);
+        var descriptor = Object.getOwnPropertyDescriptor(prototype, 'value');
+        if (descriptor && descriptor.set) {
+            descriptor.set.call(element, text);
+        } else {
+            element.value = text;
+        }
+    }
+
+    function perform(step, value) {
+        var element = step.element;
+        switch (step.kind) {
+            case 'text':
+            case 'textarea':
+                if (element.value !== value.text) {
+                    setValue(element, value.text);
+                    dispatch(element, ['input', 'change']);
+                }
+                break;
+            case 'editable':
+                element.textContent = value.text;
+                dispatch(element, ['input', 'change']);
+                break;
+            case 'select':
+                var changed = false;
+                Array.prototype.forEach.call(element.options, function(option) {
+                    var selected = step.options.indexOf(option) !== -1;
+                    if (option.selected !== selected && (selected || element.multiple)) {
+                        option.selected = selected;
+                        changed = true;
+                    }
+                });
+                if (changed) {
+                    dispatch(element, ['input', 'change']);
+                }
+                break;
+            default:
+                // a click toggles the state and fires click, input and change like a user would
+                step.targets.forEach(function(target) {
+                    if (target[0].checked !== target[1]) {
+                        target[0].click();
+                    }
+                });
+        }
+    }
+
+    var steps = fields.map(plan);
+    var problems = [];
+    steps.forEach(function(step, index) {
+        var problem = probe(step);
+        if (problem !== null) {
+            problems.push([index, problem, step.kind === undefined ? null : step.kind]);
+        }
+    });
+
+    // values are only set once every field can be written to
+    var typed = [];
+    if (apply && problems.length === 0) {
+        steps.forEach(function(step, index) {
+            if (step.kind === 'file' ||
+                    fields[index].native && TYPED_KINDS.indexOf(step.kind) !== -1) {
+                typed.push([index, step.element, step.kind]);
+            } else {
+                perform(step, fields[index].value);
+            }
+        });
+    }
+    return {problems: problems, typed: typed, applied: apply && problems.length === 0};
+}
@@ -0,0 +1,74 @@
+function(){
+    var select = arguments[0];
+    var ways = arguments[1];
+    var terms = arguments[2];
+    var apply = arguments[3];
+
+    // option.text is the text content with whitespace normalized, as normalize-space() does
+    function found(option, way) {
+        return way === 'text' ? option.text : option.getAttribute(way);
+    }
+
+    function matcher(expected) {
+        var regexp = expected.pattern === undefined ? null :
+            new RegExp(expected.pattern, expected.flags);
+        return function(option, way) {
+            var value = found(option, way);
+            if (value === null) {
+                return false;
+            }
+            return regexp === null ? value === expected.equals : regexp.test(value);
+        };
+    }
+
+    // the first of value, text and label that matches any option wins, as in Select#select
+    var options = Array.prototype.slice.call(select.querySelectorAll('option'));
+    var matched = terms.map(function(expected) {
+        var matches = matcher(expected);
+        for (var i = 0; i < ways.length; i++) {
+            var way = ways[i];
+            var result = options.filter(function(option) { return matches(option, way); });
+            if (result.length > 0) {
+                return result;
+            }
+        }
+        return [];
+    });
+
+    var disabled = [];
+    matched.forEach(function(result, index) {
+        if (result.some(function(option) { return option.disabled; })) {
+            disabled.push(index);
+        }
+    });
+
+    // selections are only applied when every term matched enabled options
+    var applied = false;
+    if (apply && disabled.length === 0 && matched.every(function(r) { return r.length > 0; })) {
+        var changed = false;
+        matched.forEach(function(result) {
+            result.forEach(function(option) {
+                changed = changed || !option.selected;
+                option.selected = true;
+            });
+        });
+        if (changed) {
+            ['input', 'change'].forEach(function(type) {
+                var event = document.createEvent('HTMLEvents');
+                event.initEvent(type, true, false);
+                select.dispatchEvent(event);
+            });
+        }
+        applied = true;
+    }
+
+    return {
+        matches: matched.map(function(result) {
+            return result.map(function(option) {
+                return {option: option, text: option.text, selected: option.selected};
+            });
+        }),
+        disabled: disabled,
+        applied: applied
+    };
+}
@@ -0,0 +1,98 @@
+// Helpers shared by the snippets that include them, in the same scope as the snippet
+
+var BOOLEAN_PROPERTIES = ['allowfullscreen', 'allowpaymentrequest', 'allowusermedia', 'async',
+    'autofocus', 'autoplay', 'checked', 'compact', 'complete', 'controls', 'declare', 'default',
+    'defaultchecked', 'defaultselected', 'defer', 'disabled', 'ended', 'formnovalidate',
+    'hidden', 'indeterminate', 'iscontenteditable', 'ismap', 'itemscope', 'loop', 'multiple',
+    'muted', 'nohref', 'nomodule', 'noresize', 'noshade', 'novalidate', 'nowrap', 'open',
+    'paused', 'playsinline', 'pubdate', 'readonly', 'required', 'reversed', 'scoped',
+    'seamless', 'seeking', 'selected', 'truespeed', 'typemustmatch', 'willvalidate'];
+var PROPERTY_ALIASES = {'class': 'className', 'readonly': 'readOnly'};
+
+// Mirrors the Selenium getAttribute atom used by WebElement#get_attribute
+function attribute(element, name) {
+    var lower = name.toLowerCase();
+    var tag = element.tagName.toUpperCase();
+    if (lower === 'style') {
+        return element.style.cssText;
+    }
+    if ((lower === 'selected' || lower === 'checked') &&
+            (tag === 'OPTION' || (tag === 'INPUT' && /^(checkbox|radio)$/i.test(element.type)))) {
+        return (tag === 'OPTION' ? element.selected : element.checked) ? 'true' : null;
+    }
+    if ((tag === 'IMG' && lower === 'src') || (tag === 'A' && lower === 'href')) {
+        var link = element.getAttribute(lower);
+        return link ? element[lower] : link;
+    }
+    var property = PROPERTY_ALIASES[lower] || name;
+    if (BOOLEAN_PROPERTIES.indexOf(lower) !== -1) {
+        return element.getAttribute(name) !== null || element[property] === true ? 'true' : null;
+    }
+    var value;
+    try { value = element[property]; } catch (e) { value = null; }
+    if (value === null || value === undefined || typeof value === 'object' ||
+            typeof value === 'function') {
+        value = element.getAttribute(name);
+    }
+    return value === null || value === undefined ? null : String(value);
+}
+
+// Element#matches is only available as msMatchesSelector in IE11
+function matchesSelector(element, selector) {
+    var matches = element.matches || element.msMatchesSelector || element.webkitMatchesSelector;
+    return matches.call(element, selector);
+}
+
+function isDisabled(element) {
+    return matchesSelector(element, ':disabled');
+}
+
+function isShown(element) {
+    var tag = element.tagName.toUpperCase();
+    if (tag === 'OPTION' || tag === 'OPTGROUP') {
+        var select = element.parentElement;
+        while (select !== null && !/^(SELECT|DATALIST)$/.test(select.tagName.toUpperCase())) {
+            select = select.parentElement;
+        }
+        return select === null || select.tagName.toUpperCase() === 'SELECT' && isShown(select);
+    }
+    if (tag === 'INPUT' && element.type.toLowerCase() === 'hidden' || tag === 'NOSCRIPT') {
+        return false;
+    }
+    for (var e = element; e && e.nodeType === 1; e = e.parentElement) {
+        var style = window.getComputedStyle(e);
+        if (style.display === 'none' || style.opacity === '0') {
+            return false;
+        }
+    }
+    var visibility = window.getComputedStyle(element).visibility;
+    if (visibility === 'hidden' || visibility === 'collapse') {
+        return false;
+    }
+    return hasSize(element);
+}
+
+function hasSize(element) {
+    var rect = element.getBoundingClientRect();
+    if (rect.width > 0 && rect.height > 0) {
+        return true;
+    }
+    for (var i = 0; i < element.children.length; i++) {
+        if (hasSize(element.children[i])) {
+            return true;
+        }
+    }
+    return false;
+}
+
+function visibleText(element) {
+    if (!isShown(element)) {
+        return '';
+    }
+    var text = element.innerText === undefined ? element.textContent : element.innerText;
+    return (text || '').replace(/\u00a0/g, ' ').split('\n').map(function(line) {
+        return line.replace(/[ \t\r\f\v]+/g, ' ').trim();
+    }).filter(function(line) {
+        return line.length > 0;
+    }).join('\n');
+}
@@ -0,0 +1,65 @@
+function(){
+    // include: domHelpers
+    var elements = arguments[0];
+    var filters = arguments[1];
+    var limit = arguments[2];
+    var reverse = arguments[3];
+
+    function fetch(element, filter) {
+        switch (filter.key) {
+            case 'text':
+            case 'visible_text':
+                return visibleText(element);
+            case 'tag_name':
+                return element.tagName.toLowerCase();
+            case 'visible':
+                return isShown(element);
+            case 'href':
+            case 'class':
+                return (attribute(element, filter.key) || '').trim();
+            case 'style':
+                return window.getComputedStyle(element).getPropertyValue(filter.name);
+            default:
+                return attribute(element, filter.name);
+        }
+    }
+
+    function matches(found, expected) {
+        if (expected.pattern !== undefined) {
+            return found !== null && new RegExp(expected.pattern, expected.flags).test(found);
+        }
+        return found === expected.equals;
+    }
+
+    function matchesFilter(element, filter) {
+        var found = fetch(element, filter);
+        if (filter.key === 'class') {
+            var classes = found.split(/\s+/);
+            return filter.values.every(function(expected) {
+                return classes.some(function(name) { return matches(name, expected); });
+            });
+        }
+        return filter.values.every(function(expected) { return matches(found, expected); });
+    }
+
+    var indices = [];
+    var hidden = [];
+    var inspected = 0;
+    while (inspected < elements.length && (limit == null || indices.length < limit)) {
+        var i = reverse ? elements.length - 1 - inspected : inspected;
+        var element = elements[i];
+        inspected++;
+        var matched = filters.every(function(filter) { return matchesFilter(element, filter); });
+        if (!matched) {
+            continue;
+        }
+        indices.push(i);
+        filters.forEach(function(filter) {
+            if (filter.key === 'text' && filter.values[0].pattern !== undefined &&
+                    !matches(element.textContent.trim(), filter.values[0])) {
+                hidden.push(i);
+            }
+        });
+    }
+    return {indices: indices, hidden: hidden, inspected: inspected};
+}
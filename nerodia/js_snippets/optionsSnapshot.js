@@ -0,0 +1,14 @@
+function(){
+    var options = arguments[0].querySelectorAll('option');
+    var table = {value: [], text: [], label: [], selected: [], disabled: []};
+    for (var i = 0; i < options.length; i++) {
+        var option = options[i];
+        table.value.push(option.value);
+        table.text.push(option.text);
+        // the label property falls back to the text, as Option#text and the select scripts do
+        table.label.push(option.label);
+        table.selected.push(option.selected);
+        table.disabled.push(option.disabled);
+    }
+    return table;
+}
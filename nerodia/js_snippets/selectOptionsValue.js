@@ -1,6 +1,7 @@
 function(){
+    var regexp = new RegExp(arguments[1], arguments[3]);
     for(var i=0; i<arguments[0].options.length; i++) {
-        if ( arguments[0].options[i].value.match(arguments[1]) ) {
+        if ( arguments[0].options[i].value.match(regexp) ) {
             arguments[0].options[i].selected = true;
             if ( arguments[2] == 'single' ) {
                 break;
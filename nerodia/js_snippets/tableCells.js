@@ -0,0 +1,27 @@
+function(){
+    // include: domHelpers
+    var container = arguments[0];
+
+    // rows of the table or section itself in document order, as the row locators find them,
+    // while its rows collection puts those of thead first and those of tfoot last
+    var rows = [];
+    Array.prototype.forEach.call(container.children, function(child) {
+        var tag = child.tagName.toUpperCase();
+        if (tag === 'TR') {
+            rows.push(child);
+        } else if (tag === 'THEAD' || tag === 'TBODY' || tag === 'TFOOT') {
+            Array.prototype.forEach.call(child.children, function(row) {
+                if (row.tagName.toUpperCase() === 'TR') {
+                    rows.push(row);
+                }
+            });
+        }
+    });
+
+    return rows.map(function(row) {
+        return Array.prototype.map.call(row.cells, function(cell) {
+            return [visibleText(cell), cell.tagName.toUpperCase() === 'TH', cell.colSpan,
+                    cell.rowSpan];
+        });
+    });
+}
@@ -8,3 +8,9 @@ W3C_FINDERS = {
     'partial_link_text': By.PARTIAL_LINK_TEXT,
     'xpath': By.XPATH
 }
+
+# Lookups a selector of a single id or name is located with, built as {how: what}
+NATIVE_FINDERS = {
+    'id': By.ID,
+    'name': By.NAME
+}
@@ -4,6 +4,9 @@ from importlib import import_module
 
 class ClassHelpers(object):
 
+    # locator modules by locator namespace and element class name
+    _locator_modules = {}
+
     @property
     def selector_builder(self):
         if not self._selector_builder:
@@ -40,8 +43,16 @@ class ClassHelpers(object):
 
     @property
     def _import_module(self):
+        key = (self.browser.locator_namespace.__name__, self._element_class_name)
+        module = self._locator_modules.get(key)
+        if module is None:
+            module = self._locator_modules[key] = self._find_module(*key)
+        return module
+
+    @staticmethod
+    def _find_module(namespace, class_name):
         from ..module_mapping import map_module
-        modules = [self.browser.locator_namespace.__name__, map_module(self._element_class_name)]
+        modules = [namespace, map_module(class_name)]
         try:
             return import_module('{}.{}'.format(*modules))
         except ImportError:
@@ -4,7 +4,7 @@ from time import sleep
 from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
 
 from nerodia.exception import LocatorException
-from nerodia.locators import W3C_FINDERS
+from nerodia.locators import NATIVE_FINDERS, W3C_FINDERS
 from nerodia.locators.class_helpers import ClassHelpers
 
 
@@ -24,18 +24,26 @@ class Locator(object):
     def locate(self, built):
         try:
             self.built = copy(built)
+            fast_path = self.built.pop('fast_path', None)
             self.driver_scope = self._locator_scope.wd
             self.filter = 'first'
+            if fast_path in NATIVE_FINDERS:
+                return self.driver_scope.find_element(NATIVE_FINDERS[fast_path],
+                                                      self.built[fast_path])
             return self._matching_elements
         except (NoSuchElementException):
             return None
 
     def locate_all(self, built):
         self.built = copy(built)
+        fast_path = self.built.pop('fast_path', None)
         self.driver_scope = self._locator_scope.wd
         self.filter = 'all'
         if 'index' in self.built:
             raise ValueError("can't locate all elements by 'index'")
+        if fast_path in NATIVE_FINDERS:
+            return self.driver_scope.find_elements(NATIVE_FINDERS[fast_path],
+                                                   self.built[fast_path])
 
         return list(ClassHelpers._flatten(self._matching_elements))
 
@@ -1,7 +1,11 @@
 import re
 from itertools import islice
 
+from selenium.common.exceptions import JavascriptException
+
 import nerodia
+from nerodia.js_regexp import js_regexp
+from nerodia.js_snippet import JSSnippet
 from nerodia.locators.class_helpers import ClassHelpers
 
 try:
@@ -9,8 +13,11 @@ try:
 except ImportError:
     from re import _pattern_type as Pattern
 
+BROWSER_MATCH_KEYS = ['tag_name', 'text', 'visible_text', 'visible', 'class', 'href']
+
 
-class Matcher(object):
+class Matcher(JSSnippet):
+    inspected = 0  # number of candidate elements evaluated by the last match
 
     def __init__(self, query_scope, selector=None):
         self.query_scope = query_scope
@@ -47,26 +54,92 @@ class Matcher(object):
 
     def _matching_elements(self, elements, values_to_match, filter='first'):
         if filter == 'first':
-            idx = self._element_index(elements, values_to_match)
-            counter = 0
-
-            # Generator + slice to avoid fetching values for elements that will be discarded
-            matches = []
-            for element in elements:
-                counter += 1
-                if self._elements_match(element, values_to_match) is not False:
-                    matches.append(element)
-            try:
-                val = list(islice(matches, idx + 1))[idx]
-                nerodia.logger.debug('Iterated through {} elements to locate '
-                                     '{}'.format(counter, self.selector))
-                return val
-            except IndexError:
-                return None
+            idx, reverse = self._element_index(values_to_match)
+            matches = self._matches_in_browser(elements, values_to_match, limit=idx + 1,
+                                               reverse=reverse)
+            if matches is None:
+                # Generator + slice to avoid fetching values for elements that will be discarded
+                matches = self._lazy_matches(elements, values_to_match, reverse)
+            val = next(islice(matches, idx, None), None)
+            nerodia.logger.debug('Iterated through {} elements to locate '
+                                 '{}'.format(self.inspected, self.selector))
+            return val
         else:
+            matches = self._matches_in_browser(elements, values_to_match)
+            if matches is None:
+                matches = [el for el in elements if self._elements_match(el, values_to_match)]
+                self.inspected = len(elements)
             nerodia.logger.debug('Iterated through {} elements to locate all '
-                                 '{}'.format(len(elements), self.selector))
-            return [el for el in elements if self._elements_match(el, values_to_match)]
+                                 '{}'.format(self.inspected, self.selector))
+            return matches
+
+    def _lazy_matches(self, elements, values_to_match, reverse=False):
+        self.inspected = 0
+        for element in (reversed(elements) if reverse else elements):
+            self.inspected += 1
+            if self._elements_match(element, values_to_match) is not False:
+                yield element
+
+    def _matches_in_browser(self, elements, values_to_match, limit=None, reverse=False):
+        """
+        Evaluates the values to match against the elements with a single script, stopping once
+        the limit of matches has been found
+        Returns None when the values can only be matched element by element in Python
+        """
+        if not elements or not values_to_match or not self._can_match_in_browser:
+            return None
+
+        filters = self._browser_filters(values_to_match)
+        if filters is None:
+            return None
+
+        try:
+            result = self._execute_js('matchElements', elements, filters, limit, reverse)
+        except JavascriptException as e:
+            nerodia.logger.debug('Unable to match {} in browser, matching in Python: '
+                                 '{}'.format(self.selector, e.msg))
+            return None
+        if not isinstance(result, dict):
+            return None
+
+        self.inspected = result.get('inspected', len(elements))
+        for idx in result.get('hidden', []):
+            self._deprecate_text_regexp(elements[idx], values_to_match)
+        return [elements[idx] for idx in result.get('indices', [])]
+
+    @property
+    def _can_match_in_browser(self):
+        # Matchers customizing how a single element is matched need to stay in Python
+        hooks = ('_elements_match', '_fetch_value', '_matches_values', '_validate_tag')
+        return nerodia.match_in_browser and \
+            all(getattr(self.__class__, hook) is getattr(Matcher, hook) for hook in hooks)
+
+    def _browser_filters(self, values_to_match):
+        filters = []
+        for how, expected in values_to_match.items():
+            if how in ['class', 'class_name']:
+                how = 'class'
+                expected = list(ClassHelpers._flatten([expected]))
+            else:
+                expected = [expected]
+
+            values = [self._browser_value(how, value) for value in expected]
+            if None in values:
+                return None
+            key = how if how in BROWSER_MATCH_KEYS else 'attribute'
+            filters.append({'key': key, 'name': how, 'values': values})
+        return filters
+
+    @staticmethod
+    def _browser_value(how, value):
+        if isinstance(value, Pattern):
+            regexp = js_regexp(value)
+            return regexp and {'pattern': regexp.source, 'flags': regexp.flags}
+        elif isinstance(value, bool):
+            return {'equals': value} if how == 'visible' else None
+        elif isinstance(value, str) and how != 'visible':
+            return {'equals': value}
+        return None
 
     def _elements_match(self, element, values_to_match):
         def check_match(how, expected):
@@ -110,13 +183,15 @@ class Matcher(object):
                 how.replace('_', '-')
             return element.get_attribute(how)
 
-    def _element_index(self, elements, values_to_match):
+    @staticmethod
+    def _element_index(values_to_match):
+        """
+        Returns the position of the wanted match and whether to scan the elements in reverse
+        """
         idx = values_to_match.pop('index', 0)
         if idx >= 0:
-            return idx
-
-        elements.reverse()
-        return abs(idx) - 1
+            return idx, False
+        return abs(idx) - 1, True
 
     def _validate_tag(self, element, expected):
         return self._matches_values(self._fetch_value(element, 'tag_name'), expected)
@@ -1,3 +1,4 @@
+import logging
 import re
 from collections import defaultdict
 from importlib import import_module
@@ -6,9 +7,10 @@ import six
 
 import nerodia
 from nerodia.exception import LocatorException
-from nerodia.locators import W3C_FINDERS
+from nerodia.locators import NATIVE_FINDERS, W3C_FINDERS
 from nerodia.locators.class_helpers import ClassHelpers
 from nerodia.locators.element.regexp_disassembler import RegexpDisassembler
+from nerodia.locators.element.selector_cache import SelectorCache
 from nerodia.locators.element.xpath_support import XpathSupport
 
 try:
@@ -34,8 +36,12 @@ WHATS = {
 
 class SelectorBuilder(object):
     WILDCARD_ATTRIBUTE = re.compile(r'^(aria|data)_(.+)$')
+    WILDCARD_PREFIXES = ('aria_', 'data_')
     VALID_WHATS = defaultdict(lambda: STRING_REGEX_TYPES + [bool], WHATS)
 
+    # Shared by all selector builders; set cache.enabled = False to always build from scratch
+    cache = SelectorCache()
+
     xpath_builder = None
     selector = None
     built = None
@@ -49,7 +55,8 @@ class SelectorBuilder(object):
         self.selector = selector
         self._deprecated_locators()
         self._normalize_selector()
-        rep = repr(selector)
+        log = nerodia.logger.isEnabledFor(logging.INFO)
+        rep = repr(selector) if log else None
         from nerodia.browser import Browser
         scope = None
         if 'scope' not in self.selector and not isinstance(self.query_scope, Browser):
@@ -57,13 +64,14 @@ class SelectorBuilder(object):
 
         self.built = self.selector
         if len(self.wd_locators) == 0:
-            self.built = self._build_wd_selector(self.selector)
+            self.built = self.cache.fetch(self._cache_key, self._build)
         if 'index' in self.built and self.built['index'] == 0:
             self.built.pop('index')
         if scope is not None:
             self.built['scope'] = scope
 
-        nerodia.logger.info('Converted {} to {}'.format(rep, self.built))
+        if log:
+            nerodia.logger.info('Converted {} to {}'.format(rep, self.built))
 
         return self.built
 
@@ -78,7 +86,7 @@ class SelectorBuilder(object):
             raise LocatorException('Can not locate element with {}'.format(self.wd_locators))
 
         if self._merge_scope:
-            self.selector['scope'] = self.query_scope.selector_builder.built
+            self.selector['scope'] = self._scope_built
 
         if 'class' in self.selector or 'class_name' in self.selector:
             classes = [self.selector.get('class')]
@@ -111,8 +119,11 @@ class SelectorBuilder(object):
         if isinstance(self.query_scope, (Browser, IFrame)):
             return False
 
-        scope_invalid_locators = [x for x in self.query_scope.selector_builder.built.keys() if
-                                  x != self._wd_locator]
+        # only XPath can be scoped to the first match of another selector
+        if self._wd_locator != 'xpath':
+            return False
+
+        scope_invalid_locators = [x for x in self._scope_built.keys() if x != self._wd_locator]
 
         return len(scope_invalid_locators) == 0
 
@@ -176,11 +187,81 @@ class SelectorBuilder(object):
             xpath = getattr(mod, 'XPath', XPath)
         except ImportError:
             xpath = XPath
+        if xpath is XPath and self._locator_strategy == 'css':
+            return CSS
         return xpath
 
+    @property
+    def _locator_strategy(self):
+        return getattr(self.query_scope.browser, 'locator_strategy', 'xpath')
+
+    def _build(self):
+        return self._build_fast_path(self.selector) or self._build_wd_selector(self.selector)
+
     def _build_wd_selector(self, selector):
         return self._implementation_class().build(selector)
 
+    def _build_fast_path(self, selector):
+        fast_path = self._fast_path(selector)
+        if fast_path is None:
+            return None
+        if fast_path in NATIVE_FINDERS:
+            built = {fast_path: selector[fast_path]}
+        else:
+            # built from a copy, so the selector can still be built as XPath for merging scopes
+            built = CSS().build(dict(selector))
+        built['fast_path'] = fast_path
+        return built
+
+    # Selectors that map directly onto a native lookup are located without any filtering, a
+    # single id or name with either locator strategy, a tag name or input type with CSS
+    def _fast_path(self, selector):
+        if self._implementation_class not in (XPath, CSS) or selector.get('index', 0) != 0:
+            return None
+
+        keys = set(selector) - {'index'}
+        if not all(isinstance(selector[key], six.string_types) for key in keys):
+            return None
+
+        if keys == {'id'}:
+            return 'id'
+        elif keys == {'name'}:
+            return 'name'
+        elif self._implementation_class is XPath or not CSS()._can_build(selector):
+            return None
+        elif keys == {'tag_name'}:
+            return 'tag_name'
+        elif keys == {'tag_name', 'type'} and selector['tag_name'] == 'input':
+            return 'input_type'
+        return None
+
+    @property
+    def _scope_built(self):
+        """
+        Returns the built selector of the query scope, rebuilt as XPath when the scope was
+        located through a fast path, so it can still be merged with an XPath selector
+        """
+        scope_builder = self.query_scope.selector_builder
+        built = scope_builder.built
+        if 'fast_path' not in built or self._wd_locator != 'xpath':
+            return built
+        selector = {key: value for key, value in scope_builder.selector.items()
+                    if key != 'index'}
+        built = XPath().build(selector)
+        if 'scope' in scope_builder.built:
+            built['scope'] = scope_builder.built['scope']
+        return built
+
+    @property
+    def _cache_key(self):
+        return SelectorCache.key(self.__class__, self._implementation_class,
+                                 self._cache_scope_key, self.selector)
+
+    # Extensions implement this when the built selector depends on the query scope
+    @property
+    def _cache_scope_key(self):
+        return None
+
     @property
     def _wd_locator(self):
         return self._implementation_class.LOCATOR
@@ -491,3 +572,128 @@ class XPath(object):
         if attribute in Element.CASE_INSENSITIVE_ATTRIBUTES and attribute in self.valid_attributes:
             return True
         return False
+
+
+class CSS(XPath):
+    """
+    Builds CSS selectors for tag, id, class and attribute selectors,
+    delegating to XPath for anything that can not be expressed in CSS
+    """
+    LOCATOR = 'css'
+
+    XPATH_ONLY = ['text', 'label_element', 'adjacent', 'scope', 'href']
+    IDENTIFIER = re.compile(r'^-?[_a-zA-Z][_a-zA-Z0-9-]*$')
+
+    def build(self, selector):
+        if not self._can_build(selector):
+            return super(CSS, self).build(selector)
+
+        self.selector = selector
+        self.valid_attributes = self._build_valid_attributes()
+
+        self.built = {}
+
+        for key in self.selector.copy():
+            if key in self.CAN_NOT_BUILD:
+                self.built[key] = self.selector.pop(key)
+
+        if 'index' in self.selector:
+            self.built['index'] = self.selector.pop('index')
+
+        css = self._css_tag_string
+        css += self._css_class_string
+        css += self._css_attribute_string
+
+        self.built['css'] = css or '*'
+
+        return self.built
+
+    # private
+
+    def _can_build(self, selector):
+        self.selector = selector
+        self.valid_attributes = self._build_valid_attributes()
+        for key, value in selector.items():
+            if key in self.CAN_NOT_BUILD:
+                continue
+            elif key in self.XPATH_ONLY:
+                return False
+            elif key == 'index':
+                # XPath can locate by position without fetching every element
+                if value != 0:
+                    return False
+            elif key == 'tag_name':
+                if not isinstance(value, six.string_types) or not self._is_identifier(value):
+                    return False
+            elif key == 'class':
+                for class_name in ClassHelpers._flatten([value]):
+                    if isinstance(class_name, bool):
+                        continue
+                    if not isinstance(class_name, six.string_types) or \
+                            re.search(r'\s', class_name) or class_name in ('', '!'):
+                        return False
+            elif not self._is_identifier(self._attribute_name(key)) or \
+                    not isinstance(value, tuple(six.string_types) + (bool,)):
+                return False
+            elif isinstance(value, six.string_types) and key != 'type' and \
+                    self._case_insensitive_attribute(key):
+                # XPath lowercases these values, the CSS i flag is not supported everywhere
+                # (e.g. IE11); browsers already compare the type of HTML elements ignoring case
+                return False
+        return True
+
+    @property
+    def _css_tag_string(self):
+        return self.selector.pop('tag_name', '')
+
+    @property
+    def _css_class_string(self):
+        class_name = self.selector.pop('class', None)
+        if class_name is None:
+            return ''
+
+        css = ''
+        for value in ClassHelpers._flatten([class_name]):
+            if value is True:
+                css += '[class]'
+            elif value is False:
+                css += ':not([class])'
+            elif value.startswith('!'):
+                css += ':not({})'.format(self._class_selector(value[1:]))
+            else:
+                css += self._class_selector(value)
+        return css
+
+    @property
+    def _css_attribute_string(self):
+        css = ''
+        for key in self.selector.copy():
+            value = self.selector.pop(key)
+            name = self._attribute_name(key)
+            if value is True:
+                css += '[{}]'.format(name)
+            elif value is False:
+                css += ':not([{}])'.format(name)
+            elif name == 'id' and self._is_identifier(value):
+                css += '#{}'.format(value)
+            else:
+                css += '[{}={}]'.format(name, self._escape(value))
+        return css
+
+    def _class_selector(self, class_name):
+        if self._is_identifier(class_name):
+            return '.{}'.format(class_name)
+        return '[class~={}]'.format(self._escape(class_name))
+
+    def _is_identifier(self, value):
+        return self.IDENTIFIER.search(value) is not None
+
+    @staticmethod
+    def _attribute_name(key):
+        return key.replace('__', '_') if '__' in key else key.replace('_', '-')
+
+    @staticmethod
+    def _escape(value):
+        value = value.replace('\\', '\\\\').replace('"', '\\"')
+        value = re.sub(r'[\n\r\f]', lambda match: '\\{:x} '.format(ord(match.group())), value)
+        return '"{}"'.format(value)
@@ -0,0 +1,98 @@
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+try:
+    from re import Pattern
+except ImportError:
+    from re import _pattern_type as Pattern
+
+PRIMITIVES = (str, bytes, int, float, bool, type)
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class SelectorCache(object):
+    """
+    Process-wide, bounded LRU cache of selectors built by SelectorBuilder implementations
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._built = OrderedDict()
+        self._lock = Lock()
+
+    def fetch(self, key, build):
+        """
+        Returns a copy of the selector built for the given key, calling build on a miss
+
+        :param key: hashable key as returned by SelectorCache.key, None to bypass the cache
+        :param build: method returning the built selector
+        :rtype: dict
+        """
+        if not self.enabled or key is None:
+            return build()
+
+        with self._lock:
+            if key in self._built:
+                self._built.move_to_end(key)
+                self.hits += 1
+                return self._copy(self._built[key])
+
+        built = build()
+        with self._lock:
+            self.misses += 1
+            self._built[key] = self._copy(built)
+            while len(self._built) > self.maxsize:
+                self._built.popitem(last=False)
+        return built
+
+    def clear(self):
+        """ Removes all cached selectors and resets the counters """
+        with self._lock:
+            self._built.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def info(self):
+        """
+        Returns the cache statistics
+        :rtype: CacheInfo
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._built))
+
+    def __len__(self):
+        return len(self._built)
+
+    @classmethod
+    def key(cls, *parts):
+        """
+        Returns a hashable key for the given parts, or None if any of them can not be frozen
+        Regular expressions are keyed by their pattern and flags; elements and other objects
+        are never keyed since selectors built from them are not reusable
+        """
+        try:
+            return tuple(cls._freeze(part) for part in parts)
+        except TypeError:
+            return None
+
+    # private
+
+    @classmethod
+    def _freeze(cls, value):
+        if isinstance(value, dict):
+            return dict, tuple((k, cls._freeze(v)) for k, v in value.items())
+        elif isinstance(value, (list, tuple)):
+            return type(value), tuple(cls._freeze(v) for v in value)
+        elif isinstance(value, Pattern):
+            return Pattern, value.pattern, value.flags
+        elif value is None or isinstance(value, PRIMITIVES):
+            return type(value), value
+        raise TypeError('can not freeze {!r}'.format(value))
+
+    @staticmethod
+    def _copy(built):
+        return {k: list(v) if isinstance(v, list) else v for k, v in built.items()}
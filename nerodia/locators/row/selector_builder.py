@@ -1,24 +1,25 @@
-from importlib import import_module
-
 from ..element.selector_builder import SelectorBuilder as ElementSelectorBuilder, \
     XPath as ElementXPath
 
 
 class SelectorBuilder(ElementSelectorBuilder):
+    _scope_tag_name = None
 
     def _build_wd_selector(self, selector):
-        scope_tag_name = self.query_scope.selector.get('tag_name', self.query_scope.tag_name)
-        try:
-            mod = import_module(self.__module__)
-            xpath = getattr(mod, 'XPath', XPath)
-        except ImportError:
-            xpath = XPath
-        return xpath().build(selector, scope_tag_name)
+        return self._implementation_class().build(selector, self._cache_scope_key)
 
     @property
     def _merge_scope(self):
         return False
 
+    @property
+    def _cache_scope_key(self):
+        # rows are located differently for tables than for table sections
+        if self._scope_tag_name is None:
+            self._scope_tag_name = self.query_scope.selector.get('tag_name',
+                                                                 self.query_scope.tag_name)
+        return self._scope_tag_name
+
 
 class XPath(ElementXPath):
 
@@ -47,30 +47,23 @@ def create_attributes(name, parents, dct, generated):
 
 
 def make_attr(typ, val):
-    if typ == bool:
-        def attr_bool(self):
-            return self.attribute_value(val) == 'true'
-
-        return attr_bool
+    def attr(self):
+        return convert_attr(typ, self.attribute_value(val))
 
-    elif typ == int:
-        def attr_int(self):
-            value = self.attribute_value(val)
-            return value and int(value)
+    attr.__name__ = 'attr_{}'.format(typ.__name__)
+    # allows reading the attribute along with others, i.e. Element#snapshot
+    attr.attribute = (typ, val)
+    return attr
 
-        return attr_int
 
+def convert_attr(typ, value):
+    if typ == bool:
+        return value == 'true'
+    elif typ == int:
+        return value and int(value)
     elif typ == float:
-        def attr_float(self):
-            value = self.attribute_value(val)
-            if value == 'NaN':
-                value = None
-            return value and float(value)
-
-        return attr_float
-
+        if value == 'NaN':
+            value = None
+        return value and float(value)
     else:
-        def attr_str(self):
-            return str(self.attribute_value(val) or '')
-
-        return attr_str
+        return str(value or '')
@@ -13,9 +13,75 @@ class RowContainer(object):
         A table as a 2D array of strings with the text of each cell
         :rtype: list[list[str]]
         """
+        return self.cell_texts()
+
+    def cell_texts(self, expand_spans=False, converters=None):
+        """
+        Returns the visible text of each cell, row by row, read with a single script
+
+        :param expand_spans: whether cells spanning several columns or rows are repeated in each
+                             position they cover, so that rows line up by column
+        :param converters: callables converting the text of the data cells (<td>) of a column,
+                           by column index (e.g. {2: float})
+        :rtype: list[list]
+
+        :Example:
+
+        browser.table(id='inventory').cell_texts(expand_spans=True, converters={1: int})
+        #=> [['Item', 'Count'], ['Apples', 3]]
+        """
+        return [self._convert(row, converters) for row in self._cell_rows(expand_spans)]
+
+    def stream_rows(self, size=500, fields=('text',)):
+        """
+        Yields a record for each row, reading them in chunks of size rows with a single script
+        each, so only one chunk is held in memory at a time
+
+        See ElementCollection#iter_chunks for the records and fields
+
+        :param size: number of rows read at a time
+        :param fields: names of the row properties to read
+        :rtype: iter[namedtuple]
+
+        :Example:
+
+        for row in browser.table(id='log').stream_rows(fields=('text', 'data_level')):
+            print(row.index, row.text)
+        """
+        for chunk in self.rows().iter_chunks(size, fields):
+            for row in chunk:
+                yield row
+
+    # private
+
+    def _cell_rows(self, expand_spans=False):
+        """
+        Returns the (text, is_header) pairs of the cells of each row
+        """
         self.wait_for_exists()
+        rows = self._element_call(lambda: self._execute_js('tableCells', self.el))
+        if expand_spans:
+            return self._expand_spans(rows)
+        return [[(text, header) for text, header, _, _ in row] for row in rows]
+
+    @staticmethod
+    def _expand_spans(rows):
+        grid = [[] for _ in rows]
+        for row_index, row in enumerate(rows):
+            column = 0
+            for text, header, colspan, rowspan in row:
+                while column < len(grid[row_index]) and grid[row_index][column] is not None:
+                    column += 1
+                # a rowspan of 0 spans the remaining rows
+                last_row = len(rows) if rowspan == 0 else min(row_index + rowspan, len(rows))
+                for covered in grid[row_index:last_row]:
+                    covered.extend([None] * (column + colspan - len(covered)))
+                    covered[column:column + colspan] = [(text, header)] * colspan
+                column += colspan
+        return [[cell or (None, False) for cell in row] for row in grid]
 
-        rows = []
-        for row in self.rows():
-            rows.append([cell.text for cell in row])
-        return rows
+    @staticmethod
+    def _convert(row, converters):
+        converters = converters or {}
+        return [converters[idx](text) if idx in converters and not header and text is not None
+                else text for idx, (text, header) in enumerate(row)]
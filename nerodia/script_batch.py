@@ -0,0 +1,151 @@
+from selenium.common.exceptions import JavascriptException
+
+import nerodia
+from nerodia.exception import Error
+
+# Snippets whose results nerodia never inspects, so they can be queued in a batch
+DEFERRABLE_SNIPPETS = frozenset(['backgroundColor', 'fireEvent', 'focus', 'selectText',
+                                 'setText', 'setValue'])
+
+CALL = '    results.push((function() {{\n{}\n}}).apply(null, arguments[{}]));\n'
+
+SCRIPT = 'var results = [];\n' \
+         'try {{\n' \
+         '{}' \
+         '}} catch (e) {{\n' \
+         '    return {{results: results, error: String(e && e.message || e)}};\n' \
+         '}}\n' \
+         'return {{results: results, error: null}};'
+
+
+class DeferredResult(object):
+    """
+    Result of a script queued in a ScriptBatch, available once the batch has been flushed
+    """
+
+    def __init__(self, function_name=None):
+        self.function_name = function_name
+        self.done = False
+        self._value = None
+        self._error = None
+
+    @property
+    def result(self):
+        """
+        Returns the value returned by the script
+
+        :raises: nerodia.exception.Error if the batch has not been flushed or the script did
+                 not run, selenium.common.exceptions.JavascriptException if the script failed
+        """
+        if self._error is not None:
+            raise self._error
+        if not self.done:
+            raise Error('Script {} has not been executed yet'.format(self._name))
+        return self._value
+
+    def __repr__(self):
+        state = 'done' if self.done else 'failed' if self._error else 'pending'
+        return '#<{}: {} {}>'.format(self.__class__.__name__, self._name, state)
+
+    # private
+
+    @property
+    def _name(self):
+        return self.function_name or 'script'
+
+    def _resolve(self, value):
+        self._value = value
+        self.done = True
+
+    def _fail(self, error):
+        self._error = error
+
+
+class ScriptBatch(object):
+    """
+    Queue of scripts executed together with a single call to the browser
+
+    While attached, any other command sent to the driver first flushes the queue, so scripts
+    run in the order they were executed in relation to clicks, navigation and frame or window
+    switches, and in the document they were executed in.
+    """
+
+    def __init__(self, browser):
+        self.browser = browser
+        self._calls = []
+        self._driver = None
+        self._own_execute = None
+
+    def __len__(self):
+        return len(self._calls)
+
+    def queue(self, script, args, function_name=None):
+        """
+        Queues the script with its arguments
+
+        :param script: script to execute
+        :param args: arguments, with Elements already replaced by their WebElements
+        :param function_name: name of the snippet, None for user scripts
+        :rtype: DeferredResult
+        """
+        deferred = DeferredResult(function_name)
+        self._calls.append((script, list(args), deferred))
+        return deferred
+
+    def attach(self):
+        """ Makes every command sent to the driver flush the queue before it is executed """
+        driver = self.browser.driver
+        # commands of elements go through the wrapped driver of an EventFiringWebDriver
+        self._driver = getattr(driver, 'wrapped_driver', driver)
+        # an execute set on the driver instance is put back as it was by detach
+        self._own_execute = vars(self._driver).get('execute')
+        execute = self._driver.execute
+
+        def flushing_execute(command, params=None):
+            if self._calls:
+                self.flush()
+            return execute(command, params)
+
+        self._driver.execute = flushing_execute
+
+    def detach(self):
+        """ Stops flushing the queue before driver commands """
+        if self._driver is not None:
+            if self._own_execute is None:
+                vars(self._driver).pop('execute', None)
+            else:
+                self._driver.execute = self._own_execute
+            self._driver = self._own_execute = None
+
+    def flush(self):
+        """
+        Executes all queued scripts, in order, with a single script and resolves their results
+        Scripts after one that raises are not executed
+
+        :raises: selenium.common.exceptions.JavascriptException if a script failed
+        """
+        calls, self._calls = self._calls, []
+        if not calls:
+            return
+
+        nerodia.logger.info('Executing {} batched scripts on Browser'.format(len(calls)))
+        script = SCRIPT.format(''.join(CALL.format(call[0], idx) for idx, call in enumerate(calls)))
+        if any(deferred.function_name is None for _, _, deferred in calls):
+            self.browser.new_epoch()
+        tagging = self.browser._tagging(script, *[deferred.function_name
+                                                  for _, _, deferred in calls])
+        returned = self.browser.driver.execute_script(tagging, *[args for _, args, _ in calls])
+
+        results = returned['results']
+        for (_, _, deferred), value in zip(calls, results):
+            deferred._resolve(self.browser._wrap_elements_in(self.browser, value))
+        if returned['error'] is None:
+            return
+
+        error = JavascriptException('batched {} failed: {}'.format(
+            calls[len(results)][2]._name, returned['error']))
+        calls[len(results)][2]._fail(error)
+        for _, _, deferred in calls[len(results) + 1:]:
+            deferred._fail(Error('Script {} was not executed, an earlier script in its batch '
+                                 'failed'.format(deferred._name)))
+        raise error
@@ -45,7 +45,7 @@ setup_args = {
                  'nerodia.locators.text_field',
                  'nerodia.wait'],
     'package_data': {
-        'nerodia': ['js_snippets/*.js']
+        'nerodia': ['js_snippets/*.js', 'js_snippets/helpers/*.js']
     },
     'zip_safe': False
 }
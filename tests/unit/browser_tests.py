@@ -30,3 +30,171 @@ class TestWebDriverArgs(object):
         Browser(driver, executable_path='spam')
         mock.assert_called_once()
         assert mock.call_args_list[0][1].get('executable_path') == 'spam'
+
+
+class TestEpoch(object):
+    @pytest.fixture
+    def browser(self, mocker):
+        from selenium.webdriver.remote.webdriver import WebDriver
+        yield Browser(mocker.MagicMock(spec=WebDriver))
+
+    def test_changes_on_navigation(self, browser):
+        epochs = [browser.epoch]
+        for navigate in (lambda: browser.goto('http://example.com'), browser.back,
+                         browser.forward, browser.refresh):
+            navigate()
+            epochs.append(browser.epoch)
+        assert len(set(epochs)) == 5
+
+    def test_changes_on_user_scripts_only(self, browser):
+        epoch = browser.epoch
+        browser.execute_script('return 1;', function_name='snippet')
+        assert browser.epoch == epoch
+        browser.execute_script('document.body.innerHTML = "";')
+        assert browser.epoch == epoch + 1
+
+    def test_confirms_with_page_marker_once_per_action(self, browser):
+        from nerodia.wait.timer import Timer
+        browser.epoch_marker = True
+        browser.driver.execute_script.return_value = False
+        epoch = browser.epoch
+        assert browser.driver.execute_script.call_args[0][1:] == (epoch - 1, epoch)
+
+        browser.timer = Timer(timeout=5)
+        browser.driver.execute_script.return_value = True
+        assert browser.epoch == epoch
+        assert browser.epoch == epoch
+        assert browser.driver.execute_script.call_count == 2
+
+
+class TestBatch(object):
+    @pytest.fixture
+    def browser(self, mocker):
+        from selenium.webdriver.remote.webdriver import WebDriver
+        yield Browser(mocker.MagicMock(spec=WebDriver))
+
+    def test_runs_queued_scripts_with_one_call(self, browser):
+        browser.driver.execute_script.return_value = {'results': [1, None], 'error': None}
+
+        with browser.batch() as batch:
+            first = browser.execute_script('return arguments[0];', 1)
+            second = browser.execute_script('x', 'a', function_name='focus')
+            assert len(batch) == 2
+            assert not browser.driver.execute_script.called
+            assert not first.done
+
+        assert browser.driver.execute_script.call_count == 1
+        script, *args = browser.driver.execute_script.call_args[0]
+        assert args == [[1], ['a']]
+        assert script.index('return arguments[0];') < script.index('\nx\n')
+        assert first.result == 1
+        assert second.result is None
+
+    def test_flushes_before_scripts_whose_results_are_needed(self, browser):
+        browser.driver.execute_script.side_effect = [{'results': [None], 'error': None}, 3]
+
+        with browser.batch():
+            queued = browser.execute_script('x')
+            assert browser.execute_script('y', function_name='countElements') == 3
+            assert queued.done
+
+        assert browser.driver.execute_script.call_count == 2
+
+    def test_fails_the_failing_script_and_skips_the_rest(self, browser):
+        from selenium.common.exceptions import JavascriptException
+        from nerodia.exception import Error
+        browser.driver.execute_script.return_value = {'results': [1], 'error': 'boom'}
+
+        with pytest.raises(JavascriptException):
+            with browser.batch():
+                first, second, third = [browser.execute_script(s) for s in 'xyz']
+
+        assert first.result == 1
+        with pytest.raises(JavascriptException):
+            second.result
+        with pytest.raises(Error):
+            third.result
+        assert browser._batch is None
+
+    def test_flushes_before_other_driver_commands(self, browser):
+        calls = []
+        browser.driver.execute.side_effect = lambda command, params=None: calls.append(command)
+        browser.driver.execute_script.side_effect = \
+            lambda *args: calls.append('script') or {'results': [None], 'error': None}
+
+        with browser.batch():
+            queued = browser.execute_script('x')
+            browser.driver.execute('switchToFrame', {'id': 0})
+            assert queued.done
+            browser.driver.execute('elementClick')
+
+        assert calls == ['script', 'switchToFrame', 'elementClick']
+
+    def test_stops_flushing_after_the_block(self, browser):
+        execute = browser.driver.execute
+        with browser.batch():
+            assert browser.driver.execute is not execute
+        assert browser.driver.execute is execute
+
+    def test_restores_execute_set_on_the_driver(self, browser):
+        def execute(command, params=None):
+            pass
+
+        browser.driver.execute = execute
+        with browser.batch():
+            assert browser.driver.execute is not execute
+        assert browser.driver.execute is execute
+
+    def test_discards_queue_when_block_raises(self, browser):
+        with pytest.raises(ValueError):
+            with browser.batch():
+                browser.execute_script('x')
+                raise ValueError()
+        assert not browser.driver.execute_script.called
+
+
+class TestWrapElements(object):
+    @pytest.fixture
+    def browser(self, mocker):
+        from selenium.webdriver.remote.webdriver import WebDriver
+        yield Browser(mocker.MagicMock(spec=WebDriver))
+
+    def test_returns_tag_names_with_the_script_result(self, mocker, browser):
+        from selenium.webdriver.remote.webelement import WebElement
+        from nerodia.browser import TAGGED_ELEMENT
+        from nerodia.elements.html_elements import Div
+        from nerodia.elements.option import Option
+        elements = [mocker.MagicMock(spec=WebElement) for _ in range(2)]
+        browser.driver.execute_script.return_value = {
+            'options': [{TAGGED_ELEMENT: elements[0], 'tag_name': 'option'}],
+            'parent': {TAGGED_ELEMENT: elements[1], 'tag_name': 'div'}, 'count': 1}
+
+        result = browser.execute_script('return arguments[0];', 'foo')
+
+        script, arg = browser.driver.execute_script.call_args[0]
+        assert '\nreturn arguments[0];\n' in script
+        assert arg == 'foo'
+        assert isinstance(result['options'][0], Option)
+        assert isinstance(result['parent'], Div)
+        assert result['parent'].wd is elements[1]
+        assert result['count'] == 1
+        assert not any(e.tag_name.lower.called for e in elements)
+
+    def test_runs_snippets_without_elements_untagged(self, browser):
+        browser.driver.execute_script.return_value = 3
+
+        assert browser.execute_script('return 3;', function_name='countElements') == 3
+        assert browser.driver.execute_script.call_args[0] == ('return 3;',)
+
+    def test_tags_scripts_of_unknown_snippets(self, browser):
+        browser.execute_script('return 3;', function_name='findOptions')
+        script = browser.driver.execute_script.call_args[0][0]
+        assert script != 'return 3;'
+        assert 'seen.get(value)' in script
+
+    def test_asks_untagged_elements_for_their_tag_name(self, mocker, browser):
+        from selenium.webdriver.remote.webelement import WebElement
+        from nerodia.elements.html_elements import Span
+        element = mocker.MagicMock(spec=WebElement)
+        element.tag_name = 'SPAN'
+        assert isinstance(Browser._wrap_elements_in(browser, [element])[0], Span)
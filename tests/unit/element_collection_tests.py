@@ -0,0 +1,266 @@
+import pytest
+from selenium.webdriver.remote.webelement import WebElement
+
+from nerodia.element_collection import ElementCollection
+from nerodia.elements.html_elements import DivCollection
+
+
+@pytest.fixture
+def divs(browser_mock):
+    browser_mock.browser = browser_mock
+    yield DivCollection(browser_mock, {'tag_name': 'div'})
+
+
+class TestCount(object):
+    def test_counts_in_the_browser(self, browser_mock, divs):
+        browser_mock.execute_script.return_value = 10000
+
+        assert len(divs) == 10000
+        assert browser_mock.execute_script.call_count == 1
+        args = browser_mock.execute_script.call_args
+        assert args[0][1:] == ('xpath', ".//*[local-name()='div']", None, None)
+        assert args[1]['function_name'] == 'countElements'
+
+    def test_counts_id_lookups_as_css(self, browser_mock):
+        browser_mock.browser = browser_mock
+        browser_mock.execute_script.return_value = 1
+
+        assert len(ElementCollection(browser_mock, {'id': 'foo'})) == 1
+        assert browser_mock.execute_script.call_args[0][1:3] == ('css', '#foo')
+
+    def test_checks_existence_with_a_limit(self, browser_mock, divs):
+        browser_mock.execute_script.return_value = 1
+
+        assert divs.exists
+        assert not divs.is_empty
+        assert browser_mock.execute_script.call_args[0][4] == 1
+
+    def test_counts_located_elements_when_matching(self, mocker, browser_mock):
+        browser_mock.browser = browser_mock
+        elements = [mocker.MagicMock(spec=WebElement) for _ in range(3)]
+        mocker.patch.object(ElementCollection, '_elements', new_callable=mocker.PropertyMock,
+                            return_value=elements)
+        divs = DivCollection(browser_mock, {'tag_name': 'div', 'visible': True})
+
+        assert len(divs) == 3
+        assert not browser_mock.execute_script.called
+        assert divs._els == []
+
+
+class TestPluck(object):
+    @pytest.fixture
+    def located(self, mocker):
+        elements = [mocker.MagicMock(spec=WebElement) for _ in range(2)]
+        mocker.patch.object(ElementCollection, '_elements', new_callable=mocker.PropertyMock,
+                            return_value=elements)
+        yield elements
+
+    def test_reads_all_elements_with_one_script(self, browser_mock, divs, located):
+        browser_mock.execute_script.return_value = [
+            {'fields': {'text': 'foo', 'hidden': None, 'data-id': '1'}, 'styles': {}},
+            {'fields': {'text': 'bar', 'hidden': 'true', 'data-id': None}, 'styles': {}}]
+
+        values = divs.pluck('text', 'hidden', 'data-id')
+
+        assert browser_mock.execute_script.call_count == 1
+        args = browser_mock.execute_script.call_args
+        assert args[1]['function_name'] == 'elementSnapshot'
+        assert args[0][1] == located
+        assert [f['attribute'] for f in args[0][2]] == [None, 'hidden', 'data-id']
+        assert values == {'text': ['foo', 'bar'], 'hidden': [False, True],
+                          'data-id': ['1', None]}
+
+    def test_texts_and_attribute_values(self, browser_mock, divs, located):
+        browser_mock.execute_script.return_value = [{'fields': {'text': 'foo'}, 'styles': {}}]
+        assert divs.texts == ['foo']
+
+        browser_mock.execute_script.return_value = [{'fields': {'data_id': '1'}, 'styles': {}}]
+        assert divs.attribute_values('data_id') == ['1']
+        assert browser_mock.execute_script.call_args[0][2][0]['attribute'] == 'data-id'
+
+    def test_reads_the_label_of_options_as_text(self, browser_mock, located):
+        from nerodia.elements.html_elements import OptionCollection
+        browser_mock.browser = browser_mock
+        browser_mock.execute_script.return_value = [{'fields': {'text': 'Sverige'}, 'styles': {}}]
+
+        assert OptionCollection(browser_mock, {'tag_name': 'option'}).texts == ['Sverige']
+        assert browser_mock.execute_script.call_args[0][2][0]['kind'] == 'label'
+
+    def test_does_not_run_a_script_without_elements(self, mocker, browser_mock, divs):
+        mocker.patch.object(ElementCollection, '_elements', new_callable=mocker.PropertyMock,
+                            return_value=[])
+        assert divs.pluck('text', 'id') == {'text': [], 'id': []}
+        assert not browser_mock.execute_script.called
+
+    def test_retries_when_elements_go_stale(self, mocker, browser_mock, divs, located):
+        from selenium.common.exceptions import StaleElementReferenceException
+        mocker.patch('nerodia.element_collection.sleep')
+        browser_mock.execute_script.side_effect = [
+            StaleElementReferenceException(), [{'fields': {'text': 'foo'}, 'styles': {}}]]
+
+        assert divs.texts == ['foo']
+
+
+class TestElementClass(object):
+    def test_resolves_element_class_once_per_collection_class(self, mocker, browser_mock, divs):
+        from nerodia.elements.html_elements import Div
+        assert divs._element_class is Div
+
+        spy = mocker.patch('nerodia.element_collection.import_module')
+        assert DivCollection(browser_mock, {'tag_name': 'div'})._element_class is Div
+        assert not spy.called
+
+    def test_memoizes_locator_modules(self, mocker, browser_mock, divs):
+        from nerodia.locators.element import selector_builder
+        assert divs._import_module.SelectorBuilder is selector_builder.SelectorBuilder
+
+        spy = mocker.patch('nerodia.locators.class_helpers.import_module')
+        assert divs._import_module.SelectorBuilder is selector_builder.SelectorBuilder
+        assert not spy.called
+
+
+class TestSnapshot(object):
+    @pytest.fixture
+    def snapshot(self, mocker, browser_mock):
+        from nerodia.elements.html_elements import HTMLElementCollection
+        browser_mock.browser = browser_mock
+        elements = [mocker.MagicMock(spec=WebElement) for _ in range(4)]
+        mocker.patch.object(ElementCollection, '_elements', new_callable=mocker.PropertyMock,
+                            return_value=elements)
+        browser_mock.execute_script.return_value = ['div', 'span', 'div', 'p']
+        snapshot = HTMLElementCollection(browser_mock, {'class_name': 'foo'}).snapshot()
+        browser_mock.execute_script.reset_mock()
+        yield snapshot
+
+    def test_indexes_slices_and_reverses_without_wire_calls(self, snapshot, browser_mock):
+        from nerodia.elements.html_elements import Div
+        assert len(snapshot) == 4
+        assert isinstance(snapshot[2], Div)
+        assert snapshot[2].selector == {'class_name': 'foo', 'index': 1, 'tag_name': 'div'}
+        assert snapshot[-1].cache is snapshot.wd[3]
+
+        assert snapshot[1:].tag_names == ('span', 'div', 'p')
+        assert snapshot[::-1].indices == (3, 2, 1, 0)
+        assert list(reversed(snapshot))[0] is snapshot[3]
+        assert snapshot.reverse()[1:][0] is snapshot[2]
+        assert len(snapshot[10:]) == 0
+        assert not browser_mock.execute_script.called
+
+    def test_checks_staleness_with_one_script(self, browser_mock, snapshot):
+        browser_mock.execute_script.return_value = False
+
+        assert snapshot[:2].is_stale() is False
+        assert browser_mock.execute_script.call_count == 1
+        args = browser_mock.execute_script.call_args
+        assert args[1]['function_name'] == 'areStale'
+        assert args[0][1] == list(snapshot.wd[:2])
+
+    def test_is_stale_when_references_are_stale(self, browser_mock, snapshot):
+        from selenium.common.exceptions import StaleElementReferenceException
+        browser_mock.execute_script.side_effect = StaleElementReferenceException()
+        assert snapshot.is_stale() is True
+
+
+class TestWhere(object):
+    @pytest.fixture
+    def snapshot(self, mocker, browser_mock):
+        browser_mock.browser = browser_mock
+        elements = [mocker.MagicMock(spec=WebElement) for _ in range(4)]
+        mocker.patch.object(ElementCollection, '_elements', new_callable=mocker.PropertyMock,
+                            return_value=elements)
+        yield DivCollection(browser_mock, {'tag_name': 'div'}).snapshot()
+
+    def test_filters_with_one_script(self, browser_mock, snapshot):
+        from re import IGNORECASE, compile
+        browser_mock.execute_script.return_value = {'indices': [0, 2], 'hidden': [],
+                                                    'inspected': 3}
+
+        matched = snapshot[1:].where(text=compile('^x', IGNORECASE), visible=True,
+                                     class_name=['a', 'b'], data_state='open',
+                                     style={'display': 'block'})
+
+        assert browser_mock.execute_script.call_count == 1
+        args = browser_mock.execute_script.call_args
+        assert args[1]['function_name'] == 'matchElements'
+        assert args[0][1] == list(snapshot.wd[1:])
+        assert args[0][2] == [
+            {'key': 'visible_text', 'name': 'visible_text',
+             'values': [{'pattern': '^x', 'flags': 'iu'}]},
+            {'key': 'visible', 'name': 'visible', 'values': [{'equals': True}]},
+            {'key': 'class', 'name': 'class', 'values': [{'equals': 'a'}, {'equals': 'b'}]},
+            {'key': 'attribute', 'name': 'data-state', 'values': [{'equals': 'open'}]},
+            {'key': 'style', 'name': 'display', 'values': [{'equals': 'block'}]}]
+        assert matched.indices == (1, 3)
+        assert matched[1].cache is snapshot.wd[3]
+        assert matched[1] is snapshot[3]
+
+    def test_filters_collections_through_a_snapshot(self, mocker, browser_mock):
+        browser_mock.browser = browser_mock
+        elements = [mocker.MagicMock(spec=WebElement) for _ in range(3)]
+        mocker.patch.object(ElementCollection, '_elements', new_callable=mocker.PropertyMock,
+                            return_value=elements)
+        browser_mock.execute_script.return_value = {'indices': [1], 'hidden': [],
+                                                    'inspected': 3}
+
+        matched = DivCollection(browser_mock, {'tag_name': 'div'}).where(id='foo')
+
+        args = browser_mock.execute_script.call_args
+        assert args[1]['function_name'] == 'matchElements'
+        assert args[0][2] == [{'key': 'attribute', 'name': 'id', 'values': [{'equals': 'foo'}]}]
+        assert matched.indices == (1,)
+        assert matched[0].cache is elements[1]
+
+    def test_filters_with_javascript_expression(self, browser_mock, snapshot):
+        browser_mock.execute_script.return_value = [1]
+
+        matched = snapshot.reverse().where_js('element.children.length > 2')
+
+        script = browser_mock.execute_script.call_args[0][0]
+        assert '(element.children.length > 2)' in script
+        assert browser_mock.execute_script.call_args[1]['function_name'] == 'whereJs'
+        assert matched.indices == (2,)
+
+    def test_rejects_conditions_it_can_not_translate(self, snapshot):
+        from re import VERBOSE, compile
+        from nerodia.exception import UntranslatableRegexpException
+        with pytest.raises(UntranslatableRegexpException, match='VERBOSE'):
+            snapshot.where(text=compile('x', VERBOSE))
+        with pytest.raises(TypeError):
+            snapshot.where(id=3)
+
+
+class TestIterChunks(object):
+    @staticmethod
+    def rows(*texts):
+        return [{'fields': {'text': text}, 'styles': {}} for text in texts]
+
+    def test_locates_once_and_reads_chunks_of_the_elements(self, mocker, browser_mock):
+        browser_mock.browser = browser_mock
+        elements = [mocker.MagicMock(spec=WebElement) for _ in range(3)]
+        located = mocker.patch.object(ElementCollection, '_elements',
+                                      new_callable=mocker.PropertyMock, return_value=elements)
+        browser_mock.execute_script.side_effect = [self.rows('a', 'b'), self.rows('c')]
+        divs = DivCollection(browser_mock, {'tag_name': 'div'})
+
+        chunks = list(divs.iter_chunks(2))
+
+        assert [[(r.index, r.text) for r in chunk] for chunk in chunks] == \
+            [[(0, 'a'), (1, 'b')], [(2, 'c')]]
+        assert [c[0][1] for c in browser_mock.execute_script.call_args_list] == \
+            [elements[:2], elements[2:]]
+        assert located.call_count == 1
+
+    def test_rejects_an_index_field(self, divs):
+        with pytest.raises(ValueError):
+            next(divs.iter_chunks(fields=('index', 'text')))
+
+    def test_slices_located_elements_when_matching(self, mocker, browser_mock):
+        browser_mock.browser = browser_mock
+        elements = [mocker.MagicMock(spec=WebElement) for _ in range(3)]
+        mocker.patch.object(ElementCollection, '_elements', new_callable=mocker.PropertyMock,
+                            return_value=elements)
+        browser_mock.execute_script.side_effect = [self.rows('a', 'b'), self.rows('c')]
+        divs = DivCollection(browser_mock, {'tag_name': 'div', 'visible': True})
+
+        assert [len(chunk) for chunk in divs.iter_chunks(2)] == [2, 1]
+        assert browser_mock.execute_script.call_args[0][1] == elements[2:]
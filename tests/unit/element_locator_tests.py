@@ -65,6 +65,27 @@ class TestLocate(object):
         exp_one.assert_called_once_with('xpath', locator['xpath'])
         assert not mtcher.match.called
 
+    def test_locates_fast_path_without_using_match(self, mocker, browser_mock, driver_mock):
+        browser_mock.wd = driver_mock
+        el = wd_element(mocker)
+        locator = {'css': 'ul', 'fast_path': 'tag_name'}
+        mtcher = matcher(mocker, browser_mock, {'tag_name': 'ul'})
+        exp_one = expect_one(driver_mock, el)
+
+        assert locate_one(mtcher, locator) == el
+        exp_one.assert_called_once_with('css selector', 'ul')
+        assert not mtcher.match.called
+
+    def test_locates_id_and_name_with_native_lookups(self, mocker, browser_mock, driver_mock):
+        browser_mock.wd = driver_mock
+        el = wd_element(mocker)
+        mtcher = matcher(mocker, browser_mock, {'name': 'q'})
+        exp_one = expect_one(driver_mock, el)
+
+        assert locate_one(mtcher, {'name': 'q', 'fast_path': 'name'}) == el
+        exp_one.assert_called_once_with('name', 'q')
+        assert not mtcher.match.called
+
     def test_locates_none_if_not_found(self, mocker, browser_mock, driver_mock):
         browser_mock.wd = driver_mock
         el = wd_element(mocker)
@@ -0,0 +1,272 @@
+import logging
+
+import pytest
+from selenium.webdriver.remote.webelement import WebElement
+
+import nerodia
+from nerodia.elements.element import Element
+
+
+@pytest.fixture
+def element(mocker, browser_mock):
+    wd = mocker.MagicMock(spec=WebElement)
+    wd.text = 'foo'
+    browser_mock.browser = browser_mock
+    yield Element(browser_mock, {'element': wd})
+
+
+@pytest.fixture
+def debug_logging():
+    level = nerodia.logger.level
+    nerodia.logger.level = logging.DEBUG
+    yield
+    nerodia.logger.level = level
+
+
+class TestElementCall(object):
+    def test_does_not_inspect_frames_unless_debugging(self, mocker, element):
+        spy = mocker.patch('sys._getframe')
+        assert element.text == 'foo'
+        assert not spy.called
+
+    def test_logs_caller_when_debugging(self, element, debug_logging, caplog):
+        with caplog.at_level(logging.DEBUG, logger='nerodia'):
+            assert element.text == 'foo'
+        assert any('Executing' in msg and '#text' in msg for msg in caplog.messages)
+        assert any('Completed' in msg and '#text' in msg for msg in caplog.messages)
+
+
+class TestWildcardAttributes(object):
+    def test_reads_aria_and_data_attributes(self, mocker, element):
+        attribute_value = mocker.patch.object(Element, 'attribute_value', return_value='bar')
+        assert element.data_foo_bar == 'bar'
+        assert element.aria_label == 'bar'
+        assert attribute_value.call_args_list == [mocker.call('data-foo-bar'),
+                                                  mocker.call('aria-label')]
+
+    def test_raises_for_bare_prefix(self, element):
+        with pytest.raises(AttributeError):
+            element.data_
+
+    def test_does_not_intercept_attribute_access(self):
+        assert Element.__getattribute__ is object.__getattribute__
+
+    def test_does_not_reach_getattr_for_existing_attributes(self, mocker, element):
+        getattr_spy = mocker.patch.object(Element, '__getattr__', autospec=True,
+                                          side_effect=AttributeError)
+        element.selector
+        element.keyword
+        assert not getattr_spy.called
+
+    def test_binds_user_editable_methods_on_first_lookup(self, mocker, browser_mock):
+        from nerodia.elements.html_elements import HTMLElement
+        mocker.patch.object(HTMLElement, 'content_editable', new_callable=mocker.PropertyMock,
+                            return_value=True)
+        getattr_spy = mocker.spy(Element, '__getattr__')
+        browser_mock.browser = browser_mock
+        element = HTMLElement(browser_mock, {'element': mocker.MagicMock(spec=WebElement)})
+        first = element.append
+        assert element.append is first
+        assert getattr_spy.call_count == 1
+
+
+class TestSnapshot(object):
+    def test_reads_all_fields_with_one_script(self, mocker, browser_mock):
+        from nerodia.elements.html_elements import HTMLElement
+        from nerodia.window import Dimension, Point
+        browser_mock.browser = browser_mock
+        element = HTMLElement(browser_mock, {'element': mocker.MagicMock(spec=WebElement)})
+        browser_mock.execute_script.return_value = {
+            'fields': {'text': 'foo', 'location': {'x': 1.4, 'y': 2.6, 'width': 3, 'height': 4},
+                       'size': {'x': 1.4, 'y': 2.6, 'width': 3, 'height': 4},
+                       'classes': ['a', 'b'], 'tabindex': '3', 'hidden': None,
+                       'data_foo': 'bar', 'href': None},
+            'styles': {'color': 'red'}
+        }
+
+        snapshot = element.snapshot('text', 'location', 'size', 'classes', 'tabindex', 'hidden',
+                                    'data_foo', 'href', styles=['color'])
+
+        assert browser_mock.execute_script.call_count == 1
+        fields = browser_mock.execute_script.call_args[0][2]
+        assert [(f['name'], f['kind'], f['attribute']) for f in fields] == [
+            ('text', 'text', None), ('location', 'rect', None), ('size', 'rect', None),
+            ('classes', 'classes', None), ('tabindex', 'attribute', 'tabIndex'),
+            ('hidden', 'attribute', 'hidden'), ('data_foo', 'attribute', 'data-foo'),
+            ('href', 'attribute', 'href')]
+        assert snapshot.text == 'foo'
+        assert snapshot.location == Point(1, 3)
+        assert snapshot.size == Dimension(3, 4)
+        assert snapshot.classes == ('a', 'b')
+        assert snapshot.tabindex == 3
+        assert snapshot.hidden is False
+        assert snapshot.data_foo == 'bar'
+        assert snapshot.href is None
+        assert snapshot.styles['color'] == 'red'
+
+    def test_is_immutable(self, element, browser_mock):
+        browser_mock.execute_script.return_value = {'fields': {'tag_name': 'div'}, 'styles': {}}
+        snapshot = element.snapshot('tag_name')
+
+        assert not hasattr(snapshot, '__dict__')
+        with pytest.raises(AttributeError):
+            snapshot.tag_name = 'span'
+        assert type(snapshot) is type(element.snapshot('tag_name'))
+
+    def test_reads_fields_that_are_not_identifiers_by_name(self, element, browser_mock):
+        browser_mock.execute_script.return_value = {
+            'fields': {'class': 'a b', 'for': 'foo', 'data-id': '1', 'tag_name': 'label'},
+            'styles': {}}
+        snapshot = element.snapshot('class', 'for', 'data-id', 'tag_name', 'class')
+
+        assert snapshot == ('a b', 'foo', '1', 'label')
+        assert snapshot['class'] == 'a b'
+        assert snapshot['for'] == 'foo'
+        assert snapshot['data-id'] == snapshot.data_id == '1'
+        assert snapshot['tag_name'] == snapshot.tag_name == snapshot[3] == 'label'
+        with pytest.raises(KeyError):
+            snapshot['id']
+
+    def test_raises_for_a_styles_field_along_with_styles(self, element):
+        with pytest.raises(ValueError):
+            element.snapshot('styles', styles=['color'])
+
+    def test_strips_html_and_text_content(self, element, browser_mock):
+        browser_mock.execute_script.return_value = {
+            'fields': {'inner_html': ' <b>foo</b>\n', 'outer_html': '\n<p> </p> ',
+                       'text_content': '  foo '},
+            'styles': {}}
+        snapshot = element.snapshot('inner_html', 'outer_html', 'text_content')
+
+        assert snapshot == ('<b>foo</b>', '<p> </p>', 'foo')
+
+
+class TestActionability(object):
+    @pytest.fixture
+    def text_field(self, mocker, browser_mock):
+        from nerodia.elements.text_field import TextField
+        browser_mock.browser = browser_mock
+        wd = mocker.MagicMock(spec=WebElement)
+        yield TextField(browser_mock, {'element': wd})
+
+    @staticmethod
+    def state(**opts):
+        state = {'attached': True, 'displayed': True, 'enabled': True, 'readonly': False,
+                 'content_editable': False, 'obscured': False}
+        state.update(opts)
+        return state
+
+    def test_checks_writable_with_a_single_script(self, browser_mock, text_field):
+        browser_mock.execute_script.return_value = self.state()
+        text_field.set('foo')
+
+        assert browser_mock.execute_script.call_count == 1
+        assert browser_mock.execute_script.call_args[1]['function_name'] == 'actionability'
+        assert not text_field.el.is_enabled.called
+        assert not text_field.el.get_attribute.called
+        text_field.el.send_keys.assert_called_once_with('foo')
+
+    def test_raises_when_readonly(self, mocker, browser_mock, text_field):
+        from nerodia.exception import ObjectReadOnlyException
+        mocker.patch('nerodia.default_timeout', 0)
+        browser_mock.execute_script.return_value = self.state(readonly=True)
+        text_field.el.get_attribute.return_value = 'true'
+
+        with pytest.raises(ObjectReadOnlyException):
+            text_field.set('foo')
+        assert not text_field.el.send_keys.called
+
+    def test_relocates_when_detached(self, mocker, browser_mock, text_field):
+        relocated = mocker.MagicMock(spec=WebElement)
+        browser_mock.execute_script.side_effect = [self.state(attached=False), self.state()]
+        mocker.patch.object(type(text_field), 'locate',
+                            side_effect=lambda: setattr(text_field, 'el', relocated))
+
+        text_field.set('foo')
+        relocated.send_keys.assert_called_once_with('foo')
+
+    def test_checks_present_with_a_single_script(self, browser_mock, text_field):
+        browser_mock.execute_script.return_value = self.state()
+
+        assert text_field.wait_for_present() is True
+        assert browser_mock.execute_script.call_count == 1
+        assert not text_field.el.is_displayed.called
+
+    def test_waits_until_displayed(self, mocker, browser_mock, text_field):
+        mocker.patch('nerodia.wait.timer.sleep')
+        browser_mock.execute_script.side_effect = [self.state(displayed=False), self.state()]
+
+        text_field.wait_for_present()
+        assert browser_mock.execute_script.call_count == 2
+
+    def test_reads_obscured_after_scrolling(self, browser_mock, text_field):
+        browser_mock.execute_script.side_effect = [None, self.state(obscured=True)]
+
+        assert text_field.obscured is True
+        assert browser_mock.execute_script.call_args[1]['function_name'] == 'actionability'
+
+    def test_checks_content_editable_elements_are_writable(self, mocker, browser_mock):
+        from nerodia.elements.html_elements import Div
+        from nerodia.exception import ObjectReadOnlyException
+        mocker.patch('nerodia.default_timeout', 0)
+        div = Div(browser_mock, {'element': mocker.MagicMock(spec=WebElement)})
+        div._content_editable = True
+        browser_mock.execute_script.return_value = self.state(content_editable=True)
+        div.wait_for_writable()
+
+        browser_mock.execute_script.return_value = self.state(content_editable=False)
+        div.el.get_attribute.return_value = 'false'
+        with pytest.raises(ObjectReadOnlyException):
+            div.wait_for_writable()
+
+    def test_checks_each_precondition_when_the_script_fails(self, browser_mock, text_field):
+        from selenium.common.exceptions import JavascriptException
+        browser_mock.execute_script.side_effect = JavascriptException('matches is not a function')
+        text_field.el.is_enabled.return_value = True
+        text_field.el.get_attribute.return_value = None
+        text_field.set('foo')
+
+        assert text_field.el.is_enabled.called
+        text_field.el.get_attribute.assert_any_call('readOnly')
+        text_field.el.send_keys.assert_called_once_with('foo')
+
+
+class TestEpochValidation(object):
+    @pytest.fixture
+    def scope(self, mocker, browser_mock):
+        from nerodia.elements.html_elements import HTMLElement
+        browser_mock.browser = browser_mock
+        browser_mock._epoch = browser_mock.epoch = 0
+        scope = HTMLElement(browser_mock, {'id': 'foo'})
+        scope.cache = mocker.MagicMock(spec=WebElement)
+        yield scope
+
+    def test_checks_scope_staleness_once_per_epoch(self, mocker, browser_mock, scope):
+        from nerodia.elements.html_elements import HTMLElement
+        element = HTMLElement(scope, {'tag_name': 'span'})
+        mocker.patch.object(HTMLElement, 'locate_in_context')
+
+        element.locate()
+        element.locate()
+        assert scope.el.value_of_css_property.call_count == 1
+
+        browser_mock._epoch = browser_mock.epoch = 1
+        element.locate()
+        assert scope.el.value_of_css_property.call_count == 2
+
+    def test_relocates_scope_replaced_within_epoch(self, mocker, browser_mock, scope):
+        from selenium.common.exceptions import StaleElementReferenceException
+        from nerodia.elements.html_elements import HTMLElement
+        element = HTMLElement(scope, {'tag_name': 'span'})
+        scope._validated_epoch = 0
+        relocate = mocker.patch.object(HTMLElement, 'locate_in_context',
+                                       side_effect=[StaleElementReferenceException(), None])
+
+        def new_epoch():
+            browser_mock._epoch = browser_mock.epoch = 1
+        browser_mock.new_epoch.side_effect = new_epoch
+
+        element.locate()
+        assert browser_mock.new_epoch.called
+        assert scope.el.value_of_css_property.call_count == 1
+        assert relocate.call_count == 2
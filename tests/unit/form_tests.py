@@ -0,0 +1,121 @@
+from re import compile
+
+import pytest
+from selenium.webdriver.remote.webelement import WebElement
+
+from nerodia.elements.form import Form
+from nerodia.exception import NoValueFoundException, UnknownObjectException
+
+
+@pytest.fixture
+def form(mocker, browser_mock):
+    browser_mock.browser = browser_mock
+    browser_mock.after_hooks = mocker.MagicMock()
+    yield Form(browser_mock, {'element': mocker.MagicMock(spec=WebElement)})
+
+
+def filled(*problems, **kwargs):
+    return {'problems': list(problems), 'typed': kwargs.get('typed', []), 'applied': True}
+
+
+class TestFill(object):
+    def test_probes_and_sets_all_fields_with_one_script(self, browser_mock, form):
+        browser_mock.execute_script.return_value = filled()
+
+        form.fill({'first_name': 'John', 'age': 42, 'country': compile('^Nor'),
+                   'languages': ['en', 'no'], 'terms': True})
+
+        assert browser_mock.execute_script.call_count == 1
+        args = browser_mock.execute_script.call_args
+        assert args[1]['function_name'] == 'fillFields'
+        assert args[0][1] is form
+        assert [field['name'] for field in args[0][2]] == [
+            'first_name', 'age', 'country', 'languages', 'terms']
+        assert [field['value'] for field in args[0][2]] == [
+            {'text': 'John', 'terms': [{'equals': 'John'}]},
+            {'text': '42', 'terms': [{'equals': '42'}]},
+            {'terms': [{'pattern': '^Nor', 'flags': 'u'}]},
+            {'terms': [{'equals': 'en'}, {'equals': 'no'}]},
+            {'checked': True}]
+        assert args[0][3] is True
+        browser_mock.after_hooks.run.assert_called_once_with()
+
+    def test_types_natively_into_the_given_fields(self, mocker, browser_mock, form):
+        typed = mocker.MagicMock()
+        browser_mock.execute_script.return_value = filled(typed=[[1, typed, 'text']])
+
+        form.fill([('first_name', 'John'), ('last_name', 'Doe')], native_typing=['last_name'])
+
+        assert [field['native'] for field in browser_mock.execute_script.call_args[0][2]] == \
+            [False, True]
+        typed.el.clear.assert_called_once_with()
+        typed.el.send_keys.assert_called_once_with('Doe')
+
+    def test_reports_every_field_it_can_not_set(self, mocker, browser_mock, form):
+        mocker.patch('nerodia.default_timeout', 0)
+        browser_mock.execute_script.return_value = filled([0, 'missing', None],
+                                                          [1, 'no_value', 'select'])
+
+        with pytest.raises(UnknownObjectException) as e:
+            form.fill({'nickname': 'Jo', 'country': 'Narnia'})
+        assert "unable to locate field named 'nickname'" in str(e.value)
+        assert "no option or value matching select field named 'country'" in str(e.value)
+        assert not browser_mock.after_hooks.run.called
+
+    def test_waits_until_all_fields_can_be_set(self, mocker, browser_mock, form):
+        mocker.patch('nerodia.wait.timer.sleep')
+        browser_mock.execute_script.side_effect = [filled([0, 'no_value', 'select']), filled()]
+
+        form.fill({'country': 'Norway'})
+
+        assert browser_mock.execute_script.call_count == 2
+
+    def test_locates_element_fields_once_while_waiting(self, mocker, browser_mock, form):
+        from nerodia.elements.element import Element
+        mocker.patch('nerodia.wait.timer.sleep')
+        field = mocker.MagicMock(spec=Element)
+        field.el = mocker.MagicMock(spec=WebElement)
+        browser_mock.execute_script.side_effect = [filled([0, 'disabled', 'text']),
+                                                   filled([0, 'disabled', 'text']), filled()]
+        spy = mocker.spy(Form, '_fill_target')
+
+        form.fill([(field, 'John')])
+
+        assert browser_mock.execute_script.call_count == 3
+        assert [call[0][2][0]['element'] for call in browser_mock.execute_script.call_args_list] \
+            == [field.el] * 3
+        assert spy.call_count == 1
+
+    def test_locates_fields_again_when_stale(self, mocker, browser_mock, form):
+        from selenium.common.exceptions import StaleElementReferenceException
+        from nerodia.elements.element import Element
+        mocker.patch('nerodia.wait.timer.sleep')
+        field = mocker.MagicMock(spec=Element)
+        field.el = mocker.MagicMock(spec=WebElement)
+        browser_mock.execute_script.side_effect = [StaleElementReferenceException(), filled()]
+        spy = mocker.spy(Form, '_fill_target')
+
+        form.fill([(field, 'John')])
+
+        assert browser_mock.execute_script.call_count == 2
+        assert spy.call_count == 2
+
+    def test_does_not_wait_for_values_a_field_can_not_take(self, browser_mock, form):
+        from nerodia.exception import Error
+        browser_mock.execute_script.return_value = filled([0, 'unsupported', 'text'])
+
+        with pytest.raises(Error, match='unable to set text field'):
+            form.fill({'first_name': True})
+        assert browser_mock.execute_script.call_count == 1
+
+    def test_rejects_values_of_unknown_types(self, browser_mock, form):
+        with pytest.raises(TypeError):
+            form.fill({'first_name': None})
+        assert not browser_mock.execute_script.called
+
+    def test_no_value_is_reported_as_not_found(self, mocker, browser_mock, form):
+        mocker.patch('nerodia.default_timeout', 0)
+        browser_mock.execute_script.return_value = filled([0, 'no_value', 'radio'])
+
+        with pytest.raises(NoValueFoundException):
+            form.fill({'gender': 'other'})
@@ -0,0 +1,53 @@
+import re
+
+import pytest
+
+from nerodia.exception import UntranslatableRegexpException
+from nerodia.js_regexp import JSRegExp, _translate, js_regexp, translate
+
+WORD = r'[_\p{L}\p{N}]'
+
+
+class TestTranslate(object):
+    @pytest.mark.parametrize('pattern, flags, source', [
+        (r'\Afoo\Z', 0, '^foo$'),
+        (r'foo$', 0, r'foo(?=\n?$)'),
+        (r'^a$', re.MULTILINE, r'(?:^|(?<=\n))a(?=\n|$)'),
+        (r'a.b', 0, r'a[^\n]b'),
+        (r'a.b', re.DOTALL, r'a[\s\S]b'),
+        (r'\w+', 0, WORD + '+'),
+        (r'\w+\d', re.ASCII, r'\w+\d'),
+        (r'[]a]', 0, r'[\]a]'),
+        (r'x{,2}?', 0, 'x{0,2}?'),
+        (r'x{}}', 0, r'x\{\}\}'),
+        (r'(?P<n>o)(?P=n)', 0, r'(?<n>o)\k<n>'),
+        (r'(?i)(?#comment)abc', 0, 'abc'),
+        (r'\x41\xe9\N{SNOWMAN}\101\0', 0, r'\u{41}\u{e9}\u{2603}\u{41}\u{0}'),
+        (r'a\-b[\-\b]', 0, r'a-b[\-\u{8}]'),
+        (r'(a)\1(?<=a)', 0, r'(a)\1(?<=a)'),
+    ])
+    def test_translates_to_equivalent_javascript(self, pattern, flags, source):
+        assert translate(re.compile(pattern, flags)).source == source
+
+    def test_carries_flags(self):
+        assert translate(re.compile('a', re.IGNORECASE | re.MULTILINE | re.DOTALL)) == \
+            JSRegExp('a', 'iu')
+        assert translate(re.compile('(?i)a')).flags == 'iu'
+        assert translate(re.compile('a')).flags == 'u'
+
+    @pytest.mark.parametrize('pattern, flags, reason', [
+        ('a b', re.VERBOSE, 'VERBOSE'),
+        (b'a', 0, 'bytes'),
+        (r'(?i:a)b', 0, 'scoped'),
+        (r'[\W]', 0, 'inside a set'),
+    ])
+    def test_reports_untranslatable_constructs(self, pattern, flags, reason):
+        with pytest.raises(UntranslatableRegexpException, match=reason):
+            translate(re.compile(pattern, flags))
+        assert js_regexp(re.compile(pattern, flags)) is None
+
+    def test_memoizes_translations(self):
+        _translate.cache_clear()
+        translate(re.compile('memo'))
+        js_regexp(re.compile('memo'))
+        assert _translate.cache_info().hits == 1
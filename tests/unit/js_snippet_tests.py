@@ -0,0 +1,69 @@
+import pytest
+
+from nerodia.exception import Error
+from nerodia.js_snippet import JSSnippet, SnippetRegistry
+
+
+@pytest.fixture
+def registry(mocker):
+    registry = SnippetRegistry()
+    mocker.patch('nerodia.js_snippet.snippets', registry)
+    yield registry
+
+
+class TestSnippetRegistry(object):
+    def test_reads_each_snippet_once(self, mocker, registry):
+        spy = mocker.spy(SnippetRegistry, '_find')
+        script = registry['getElementTags']
+
+        assert script.startswith('return (function(){')
+        assert script.endswith(').apply(null, arguments)')
+        assert registry['getElementTags'] is script
+        assert spy.call_count == 1
+
+    def test_minifies_snippets(self, registry):
+        assert '\n    ' not in registry['matchElements']
+        assert '// Mirrors' not in registry['matchElements']
+
+        registry.minify = False
+        assert '// Mirrors' in registry['matchElements']
+
+    def test_declares_included_helpers_before_the_snippet(self, registry):
+        script = registry['tableCells']
+        helpers, _, snippet = script.partition('return (function(){')
+
+        assert 'function visibleText(element)' in helpers
+        assert 'function visibleText' not in snippet
+        assert 'visibleText(cell)' in snippet
+        assert 'function visibleText' not in registry['getElementTags']
+
+    def test_registers_custom_snippets(self, tmpdir, registry):
+        registry.register('isChecked', 'function(e) {\n    return e.checked;\n}')
+        assert registry['isChecked'] == \
+            'return (function(e) {\n    return e.checked;\n}).apply(null, arguments)'
+
+        tmpdir.join('isOpen.js').write('function(e) { return e.open; }')
+        registry.register_directory(str(tmpdir))
+        assert 'isOpen' in registry
+        assert 'e.open' in registry['isOpen']
+
+    def test_does_not_minify_custom_snippets(self, tmpdir, registry):
+        source = 'function() {\n    // keep\n    return `a\n    b`;\n}'
+        registry.register('multiline', source)
+        tmpdir.join('fromFile.js').write(source)
+        registry.register_directory(str(tmpdir))
+
+        assert registry['multiline'] == 'return ({}).apply(null, arguments)'.format(source)
+        assert registry['fromFile'] == 'return ({}).apply(null, arguments)'.format(source)
+
+    def test_raises_for_unknown_snippets(self, registry):
+        with pytest.raises(Error):
+            registry['doesNotExist']
+
+    def test_executes_registered_script(self, mocker, registry):
+        snippet = JSSnippet()
+        snippet.query_scope = mocker.MagicMock()
+        snippet._execute_js('getElementTags', [])
+
+        snippet.query_scope.execute_script.assert_called_once_with(
+            registry['getElementTags'], [], function_name='getElementTags')
@@ -1,4 +1,4 @@
-from re import compile
+from re import IGNORECASE, compile
 
 import pytest
 from selenium.webdriver.remote.webelement import WebElement
@@ -388,3 +388,110 @@ class TestMatchRegex(object):
         values_to_match = {'foo': compile(r'fo')}
 
         assert matcher.match(elements, values_to_match, 'all') == [elements[0], elements[2]]
+
+
+class TestMatchInBrowser(object):
+    def test_matches_all_elements_with_a_single_script(self, mocker, matcher):
+        elements = [wd_element(mocker, values={'tag_name': 'div'}),
+                    wd_element(mocker, values={'tag_name': 'span'}),
+                    wd_element(mocker, values={'tag_name': 'div'})]
+        matcher.query_scope.execute_script.return_value = {'indices': [0, 2], 'hidden': []}
+
+        values_to_match = {'tag_name': 'div', 'visible_text': compile(r'foo', IGNORECASE)}
+
+        assert matcher.match(elements, values_to_match, 'all') == [elements[0], elements[2]]
+        matcher.query_scope.execute_script.assert_called_once()
+        filters = matcher.query_scope.execute_script.call_args[0][2]
+        assert filters == [{'key': 'tag_name', 'name': 'tag_name', 'values': [{'equals': 'div'}]},
+                           {'key': 'visible_text', 'name': 'visible_text',
+                            'values': [{'pattern': 'foo', 'flags': 'iu'}]}]
+        assert not any(el.get_attribute.called for el in elements)
+
+    def test_returns_the_match_at_the_given_index(self, mocker, matcher):
+        elements = [wd_element(mocker, values={'tag_name': 'div'}),
+                    wd_element(mocker, values={'tag_name': 'span'}),
+                    wd_element(mocker, values={'tag_name': 'div'})]
+        matcher.query_scope.execute_script.return_value = {'indices': [0, 2], 'hidden': []}
+
+        values_to_match = {'class': ['foo', compile(r'bar')], 'index': 1}
+
+        assert matcher.match(elements, values_to_match, 'first') == elements[2]
+
+    def test_matches_attributes_by_name(self, mocker, matcher):
+        elements = [wd_element(mocker, values={}), wd_element(mocker, values={})]
+        matcher.query_scope.execute_script.return_value = {'indices': [1], 'hidden': []}
+
+        assert matcher.match(elements, {'data_foo': 'bar'}, 'all') == [elements[1]]
+        filters = matcher.query_scope.execute_script.call_args[0][2]
+        assert filters == [{'key': 'attribute', 'name': 'data_foo', 'values': [{'equals': 'bar'}]}]
+
+    def test_matches_in_python_when_regexp_can_not_be_translated(self, mocker, matcher):
+        elements = [wd_element(mocker, values={'text': 'foo'}),
+                    wd_element(mocker, values={'text': 'Foob'})]
+
+        values_to_match = {'text': compile(r'(?-i:F)oo', IGNORECASE)}
+
+        assert matcher.match(elements, values_to_match, 'first') == elements[1]
+        assert not matcher.query_scope.execute_script.called
+
+    def test_matches_in_python_when_disabled(self, mocker, matcher):
+        mocker.patch('nerodia.match_in_browser', False)
+        elements = [wd_element(mocker, values={'tag_name': 'div'}),
+                    wd_element(mocker, values={'tag_name': 'span'})]
+
+        assert matcher.match(elements, {'tag_name': 'span'}, 'first') == elements[1]
+        assert not matcher.query_scope.execute_script.called
+
+    def test_matches_in_python_when_script_fails(self, mocker, matcher):
+        from selenium.common.exceptions import JavascriptException
+        elements = [wd_element(mocker, values={'tag_name': 'div'}),
+                    wd_element(mocker, values={'tag_name': 'span'})]
+        matcher.query_scope.execute_script.side_effect = JavascriptException('unsupported')
+
+        assert matcher.match(elements, {'tag_name': 'span'}, 'all') == [elements[1]]
+
+    def test_does_not_execute_script_without_values_to_match(self, mocker, matcher):
+        elements = [wd_element(mocker, values={'tag_name': 'div'}),
+                    wd_element(mocker, values={'tag_name': 'span'})]
+
+        assert matcher.match(elements, {'index': 1}, 'first') == elements[1]
+        assert not matcher.query_scope.execute_script.called
+
+
+class TestMatchFirstLazily(object):
+    def test_stops_fetching_values_once_the_match_is_found(self, mocker, matcher):
+        mocker.patch('nerodia.match_in_browser', False)
+        elements = [wd_element(mocker, values={}, attrs={'id': 'foo'}) for _ in range(5)]
+
+        assert matcher.match(elements, {'id': 'foo', 'index': 1}, 'first') == elements[1]
+        assert matcher.inspected == 2
+        assert not any(el.get_attribute.called for el in elements[2:])
+
+    def test_scans_in_reverse_for_negative_index_without_reversing_elements(self, mocker, matcher):
+        mocker.patch('nerodia.match_in_browser', False)
+        elements = [wd_element(mocker, values={'tag_name': 'div'}),
+                    wd_element(mocker, values={'tag_name': 'span'}),
+                    wd_element(mocker, values={'tag_name': 'div'}),
+                    wd_element(mocker, values={'tag_name': 'span'})]
+        original = list(elements)
+
+        assert matcher.match(elements, {'tag_name': 'div', 'index': -2}, 'first') == elements[0]
+        assert elements == original
+        assert matcher.inspected == 4
+
+    def test_returns_none_when_there_are_not_enough_matches(self, mocker, matcher):
+        mocker.patch('nerodia.match_in_browser', False)
+        elements = [wd_element(mocker, values={'tag_name': 'div'}),
+                    wd_element(mocker, values={'tag_name': 'span'})]
+
+        assert matcher.match(elements, {'tag_name': 'div', 'index': 1}, 'first') is None
+        assert matcher.inspected == 2
+
+    def test_limits_the_browser_scan_to_the_wanted_match(self, mocker, matcher):
+        elements = [wd_element(mocker, values={'tag_name': 'div'}) for _ in range(4)]
+        matcher.query_scope.execute_script.return_value = {'indices': [3, 1], 'hidden': [],
+                                                           'inspected': 3}
+
+        assert matcher.match(elements, {'tag_name': 'div', 'index': -2}, 'first') == elements[1]
+        assert matcher.query_scope.execute_script.call_args[0][3:] == (2, True)
+        assert matcher.inspected == 3
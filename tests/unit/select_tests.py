@@ -0,0 +1,209 @@
+from re import compile
+
+import pytest
+from selenium.webdriver.remote.webelement import WebElement
+
+from nerodia.elements.option import Option
+from nerodia.elements.select import Select
+from nerodia.exception import NoValueFoundException
+
+
+@pytest.fixture
+def select_list(mocker, browser_mock):
+    browser_mock.browser = browser_mock
+    browser_mock.after_hooks = mocker.MagicMock()
+    select_list = Select(browser_mock, {'element': mocker.MagicMock(spec=WebElement)})
+    mocker.patch.object(Select, 'multiple', new_callable=mocker.PropertyMock, return_value=False)
+    yield select_list
+
+
+@pytest.fixture
+def option(mocker, browser_mock):
+    option = Option(browser_mock, {'element': mocker.MagicMock(spec=WebElement)})
+    mocker.patch.object(Option, 'stale', new_callable=mocker.PropertyMock, return_value=False)
+    mocker.patch.object(Option, 'click')
+    yield option
+
+
+def found(*matches, applied=False):
+    return {'matches': list(matches), 'disabled': [], 'applied': applied}
+
+
+class TestSelect(object):
+    def test_resolves_options_with_one_script(self, browser_mock, select_list, option):
+        browser_mock.execute_script.return_value = found(
+            [{'option': option, 'text': 'Norway', 'selected': False}])
+
+        assert select_list.select(compile('^Nor', 0)) == 'Norway'
+
+        assert browser_mock.execute_script.call_count == 1
+        args = browser_mock.execute_script.call_args
+        assert args[1]['function_name'] == 'findOptions'
+        assert args[0][2:] == (['value', 'text', 'label'], [{'pattern': '^Nor', 'flags': 'u'}],
+                               False)
+        option.click.assert_called_once_with()
+
+    def test_does_not_click_selected_options(self, browser_mock, select_list, option):
+        browser_mock.execute_script.return_value = found(
+            [{'option': option, 'text': 'Norway', 'selected': True}])
+
+        assert select_list.select('Norway') == 'Norway'
+        assert not option.click.called
+
+    def test_raises_when_nothing_matches(self, mocker, browser_mock, select_list):
+        mocker.patch('nerodia.default_timeout', 0)
+        browser_mock.execute_script.return_value = found([])
+
+        with pytest.raises(NoValueFoundException):
+            select_list.select('Narnia')
+
+    def test_matches_integers_in_python(self, mocker, browser_mock, select_list, option):
+        options = mocker.patch.object(Select, 'options', return_value=[option])
+        option.el.is_selected.return_value = False
+        mocker.patch.object(Option, 'text', new_callable=mocker.PropertyMock, return_value='1')
+
+        assert select_list.select(1) == '1'
+        options.assert_called_once_with(value=1)
+        assert not browser_mock.execute_script.called
+        option.click.assert_called_once_with()
+
+
+class TestJsSelect(object):
+    def test_selects_strings_as_escaped_regexps(self, mocker, browser_mock, select_list, option):
+        mocker.patch.object(Select, 'selected_options', new_callable=mocker.PropertyMock,
+                            return_value=[option])
+        mocker.patch.object(Option, 'text', new_callable=mocker.PropertyMock, return_value='a.b')
+        mocker.patch.object(Option, 'enabled', new_callable=mocker.PropertyMock,
+                            return_value=True)
+
+        assert select_list.js_select('a.b') == 'a.b'
+        args = browser_mock.execute_script.call_args
+        assert args[1]['function_name'] == 'selectOptionsText'
+        assert args[0][2:] == (r'^a\.b$', 'single', '')
+
+    def test_matches_in_python_when_the_browser_can_not(self, mocker, browser_mock,
+                                                        select_list, option):
+        from selenium.common.exceptions import JavascriptException
+        from nerodia.elements.select import OptionsSnapshot
+        mocker.patch.object(Select, 'selected_options', new_callable=mocker.PropertyMock,
+                            return_value=[option])
+        mocker.patch.object(Option, 'text', new_callable=mocker.PropertyMock,
+                            return_value='Norway')
+        mocker.patch.object(Option, 'enabled', new_callable=mocker.PropertyMock,
+                            return_value=True)
+        mocker.patch.object(Select, 'options_snapshot', return_value=OptionsSnapshot({
+            'value': ['dk', 'no'], 'text': ['Denmark', 'Norway'], 'label': ['Denmark', 'Norway'],
+            'selected': [False, False], 'disabled': [False, False]}))
+        browser_mock.execute_script.side_effect = [JavascriptException('invalid flags'), None]
+
+        assert select_list.js_select(compile(r'(?<=N)orway')) == 'Norway'
+        args = browser_mock.execute_script.call_args
+        assert args[1]['function_name'] == 'selectOptionsText'
+        assert args[0][2:] == ('^(?:Norway)$', 'single', '')
+
+    def test_matches_regexps_without_javascript_equivalent_in_python(self, mocker, select_list):
+        from re import VERBOSE
+        select_python = mocker.patch.object(Select, '_js_select_matching_in_python')
+        mocker.patch.object(Select, '_is_matching_option', return_value=False)
+
+        with pytest.raises(NoValueFoundException):
+            select_list.js_select(compile('a b', VERBOSE))
+        assert [call[0][0] for call in select_python.call_args_list] == \
+            ['text', 'label', 'value']
+
+    def test_finds_options_in_python_when_the_browser_can_not(self, mocker, browser_mock,
+                                                              select_list):
+        from selenium.common.exceptions import JavascriptException
+        browser_mock.execute_script.side_effect = JavascriptException('invalid flags')
+        in_python = mocker.patch.object(Select, '_matching_options_in_python',
+                                        return_value=['match'])
+
+        assert select_list._matching_options('text', compile('^Nor')) == ['match']
+        in_python.assert_called_once_with(['text', 'label'], compile('^Nor'))
+
+
+class TestSelectMany(object):
+    @pytest.fixture
+    def multi_select(self, mocker, select_list):
+        mocker.patch.object(Select, 'multiple', new_callable=mocker.PropertyMock,
+                            return_value=True)
+        yield select_list
+
+    def test_selects_all_terms_with_one_script(self, browser_mock, multi_select, option):
+        browser_mock.execute_script.return_value = found(
+            [{'option': option, 'text': 'Danish', 'selected': True}],
+            [{'option': option, 'text': 'Swedish', 'selected': True}], applied=True)
+
+        assert multi_select.select_many('Danish', [compile('^Sw')]) == ['Danish', 'Swedish']
+        assert browser_mock.execute_script.call_count == 1
+        args = browser_mock.execute_script.call_args[0]
+        assert args[3] == [{'equals': 'Danish'}, {'pattern': '^Sw', 'flags': 'u'}]
+        assert args[4] is True
+        assert not option.click.called
+
+    def test_reports_every_missing_term_at_once(self, mocker, browser_mock, multi_select,
+                                                option):
+        mocker.patch('nerodia.default_timeout', 0)
+        browser_mock.execute_script.return_value = found(
+            [], [{'option': option, 'text': 'Swedish', 'selected': False}], [])
+
+        with pytest.raises(NoValueFoundException, match='Danish, Finnish not found'):
+            multi_select.select_many('Danish', 'Swedish', 'Finnish')
+        assert not option.click.called
+
+    def test_raises_for_disabled_options(self, browser_mock, multi_select, option):
+        from nerodia.exception import ObjectDisabledException
+        result = found([{'option': option, 'text': 'Danish', 'selected': False}])
+        result['disabled'] = [0]
+        browser_mock.execute_script.return_value = result
+
+        with pytest.raises(ObjectDisabledException):
+            multi_select.select_many('Danish')
+
+    def test_requires_a_multi_select(self, select_list):
+        from nerodia.exception import Error
+        with pytest.raises(Error):
+            select_list.select_many('Danish')
+
+
+class TestOptionsSnapshot(object):
+    @pytest.fixture
+    def table(self, browser_mock):
+        browser_mock.execute_script.return_value = {
+            'value': ['no', 'se', 'dk'], 'text': ['Norway', 'Sweden', 'Denmark'],
+            'label': ['Norway', 'Sverige', 'Denmark'], 'selected': [False, True, False],
+            'disabled': [False, False, True]}
+
+    def test_reads_all_options_with_one_script(self, browser_mock, select_list, table):
+        options = select_list.options_snapshot()
+
+        assert browser_mock.execute_script.call_args[1]['function_name'] == 'optionsSnapshot'
+        assert len(options) == 3
+        assert options[2] == (2, 'dk', 'Denmark', 'Denmark', False, True)
+        assert [o.index for o in options.selected] == [1]
+
+    def test_answers_queries_from_the_snapshot(self, browser_mock, select_list, table):
+        assert select_list.options_snapshot().value == 'se'
+        assert select_list.text == 'Sverige'
+        assert select_list.is_selected('Sverige')
+        assert not select_list.is_selected(compile('^Nor'))
+        assert browser_mock.execute_script.call_count == 4
+
+    def test_matches_labels_falling_back_to_the_text(self, browser_mock, select_list, table):
+        options = select_list.options_snapshot()
+        assert [o.index for o in options.matching('Norway', 'label')] == [0]
+        assert select_list.is_selected('Sweden')
+
+    def test_text_is_none_without_selected_option(self, browser_mock, select_list):
+        browser_mock.execute_script.return_value = {
+            'value': ['no'], 'text': ['Norway'], 'label': ['Norway'], 'selected': [True],
+            'disabled': [False]}
+        assert select_list.text == 'Norway'
+
+        browser_mock.execute_script.return_value['selected'] = [False]
+        assert select_list.text is None
+
+    def test_raises_for_unknown_options(self, select_list, table):
+        from nerodia.exception import UnknownObjectException
+        with pytest.raises(UnknownObjectException):
+            select_list.is_selected('Finland')
@@ -0,0 +1,77 @@
+from re import IGNORECASE, compile
+
+import pytest
+
+from nerodia.elements.html_elements import HTMLElement
+from nerodia.locators.element.selector_builder import SelectorBuilder
+from nerodia.locators.element.selector_cache import SelectorCache
+
+ATTRIBUTES = HTMLElement.ATTRIBUTES
+
+
+@pytest.fixture
+def cache(mocker):
+    cache = SelectorCache(maxsize=2)
+    mocker.patch.object(SelectorBuilder, 'cache', cache)
+    yield cache
+
+
+def build(browser_mock, selector):
+    return SelectorBuilder(ATTRIBUTES, browser_mock).build(selector)
+
+
+class TestSelectorCache(object):
+    def test_builds_once_for_equal_selectors(self, browser_mock, cache, mocker):
+        spy = mocker.spy(SelectorBuilder, '_build_wd_selector')
+        first = build(browser_mock, {'tag_name': 'li', 'class_name': 'row', 'index': 3})
+        second = build(browser_mock, {'tag_name': 'li', 'class_name': 'row', 'index': 3})
+
+        assert first == second
+        assert spy.call_count == 1
+        assert cache.info == (1, 1, 2, 1)
+
+    def test_returns_copies_of_built_selectors(self, browser_mock, cache):
+        first = build(browser_mock, {'tag_name': 'li', 'visible': True})
+        first.pop('visible')
+        assert build(browser_mock, {'tag_name': 'li', 'visible': True})['visible'] is True
+
+    def test_keys_regular_expressions_by_pattern_and_flags(self, browser_mock, cache):
+        build(browser_mock, {'tag_name': 'div', 'visible_text': compile(r'foo')})
+        built = build(browser_mock, {'tag_name': 'div', 'visible_text': compile(r'foo', IGNORECASE)})
+
+        assert built['visible_text'].flags & IGNORECASE
+        assert cache.misses == 2
+        build(browser_mock, {'tag_name': 'div', 'visible_text': compile(r'foo')})
+        assert cache.hits == 1
+
+    def test_evicts_least_recently_used(self, browser_mock, cache):
+        build(browser_mock, {'tag_name': 'div'})
+        build(browser_mock, {'tag_name': 'span'})
+        build(browser_mock, {'tag_name': 'div'})
+        build(browser_mock, {'tag_name': 'p'})
+
+        assert len(cache) == 2
+        build(browser_mock, {'tag_name': 'div'})
+        assert cache.info.hits == 2
+        build(browser_mock, {'tag_name': 'span'})
+        assert cache.info.misses == 4
+
+    def test_can_be_disabled(self, browser_mock, cache, mocker):
+        cache.enabled = False
+        spy = mocker.spy(SelectorBuilder, '_build_wd_selector')
+        build(browser_mock, {'tag_name': 'div'})
+        build(browser_mock, {'tag_name': 'div'})
+
+        assert spy.call_count == 2
+        assert len(cache) == 0
+
+    def test_does_not_key_objects(self):
+        assert SelectorCache.key(SelectorBuilder, {'scope': object()}) is None
+        assert SelectorCache.key(SelectorBuilder, {'id': 'foo'}) is not None
+
+    def test_clear_resets_counters(self, browser_mock, cache):
+        build(browser_mock, {'tag_name': 'div'})
+        build(browser_mock, {'tag_name': 'div'})
+        cache.clear()
+
+        assert cache.info == (0, 0, 2, 0)
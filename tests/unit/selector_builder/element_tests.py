@@ -210,7 +210,7 @@ class TestBuild(object):
     def test_with_string_attribute(self, builder):
         items = {
             'selector': {'id': 'user_new'},
-            'built': {'xpath': ".//*[@id='user_new']"}
+            'built': {'id': 'user_new', 'fast_path': 'id'}
         }
         assert builder.build(items['selector']) == items['built']
 
@@ -728,3 +728,125 @@ class TestBuild(object):
         assert builder.build({'tag_name': 'table', 'hreflang': compile(r'en')}) == {'xpath': ".//*[local-name()='table'][contains(@hreflang, 'en')]"}
         assert builder.build({'tag_name': compile(r'a'), 'hreflang': 'en'}) == {'xpath': ".//*[contains(local-name(), 'a')][@hreflang='en']"}
         assert builder.build({'tag_name': compile(r'a'), 'hreflang': compile(r'en')}) == {'xpath': ".//*[contains(local-name(), 'a')][contains(@hreflang, 'en')]"}
+
+
+class TestBuildCSS(object):
+    @pytest.fixture
+    def builder(self, browser_mock):
+        browser_mock.browser.locator_strategy = 'css'
+        yield SelectorBuilder(ATTRIBUTES, browser_mock)
+
+    def test_tag_name(self, builder):
+        assert builder.build({'tag_name': 'div', 'title': 'foo'}) == {'css': 'div[title="foo"]'}
+
+    def test_without_any_elements(self, builder):
+        assert builder.build({}) == {'css': '*'}
+
+    def test_id(self, builder):
+        assert builder.build({'tag_name': 'div', 'id': 'foo'}) == {'css': 'div#foo'}
+        assert builder.build({'id': '1st', 'title': 'foo'}) == {'css': '[id="1st"][title="foo"]'}
+
+    def test_classes(self, builder):
+        selector = {'tag_name': 'div', 'class_name': ['foo', '!bar', '2x']}
+        assert builder.build(selector) == {'css': 'div.foo:not(.bar)[class~="2x"]'}
+
+    def test_class_presence_and_absence(self, builder):
+        assert builder.build({'class': True}) == {'css': '[class]'}
+        assert builder.build({'class': False}) == {'css': ':not([class])'}
+
+    def test_attributes(self, builder):
+        selector = {'tag_name': 'div', 'data_name': 'say "hi"', 'title': True, 'foo__bar': False}
+        built = {'css': 'div[data-name="say \\"hi\\""][title]:not([foo_bar])'}
+        assert builder.build(selector) == built
+
+    def test_case_insensitive_attributes(self, builder):
+        selector = {'tag_name': 'input', 'type': 'text', 'title': 'foo'}
+        assert builder.build(selector) == {'css': 'input[type="text"][title="foo"]'}
+        assert 'xpath' in builder.build({'tag_name': 'div', 'dir': 'ltr', 'title': 'foo'})
+
+    def test_keeps_filters_in_built(self, builder):
+        selector = {'tag_name': 'div', 'visible': True, 'visible_text': compile(r'foo')}
+        built = {'css': 'div', 'visible': True, 'visible_text': compile(r'foo')}
+        assert builder.build(selector) == built
+
+    @pytest.mark.parametrize('selector', [
+        {'tag_name': 'div', 'text': 'foo'},
+        {'tag_name': 'div', 'title': compile(r'foo')},
+        {'tag_name': 'div', 'index': 2},
+        {'tag_name': 'a', 'href': 'foo'},
+        {'class_name': 'foo bar'},
+        {'adjacent': 'child', 'index': 0},
+    ])
+    def test_falls_back_to_xpath(self, builder, selector):
+        assert list(builder.build(selector)) == ['xpath']
+
+    def test_does_not_merge_scope(self, element_mock):
+        element_mock.browser.locator_strategy = 'css'
+        builder = element_builder(element_mock, {'css': 'div#foo'})
+
+        built = builder.build({'tag_name': 'span', 'title': 'foo'})
+        assert built.pop('scope') is element_mock
+        assert built == {'css': 'span[title="foo"]'}
+
+    def test_uses_specialized_xpath(self, browser_mock):
+        from nerodia.locators.text_field.selector_builder import SelectorBuilder as TextFieldBuilder
+        browser_mock.browser.locator_strategy = 'css'
+        builder = TextFieldBuilder(ATTRIBUTES, browser_mock)
+        assert 'xpath' in builder.build({'tag_name': 'input'})
+
+
+class TestBuildFastPath(object):
+    @pytest.fixture
+    def builder(self, browser_mock):
+        browser_mock.browser.locator_strategy = 'css'
+        yield SelectorBuilder(ATTRIBUTES, browser_mock)
+
+    @pytest.mark.parametrize('selector, built', [
+        ({'id': 'foo'}, {'id': 'foo', 'fast_path': 'id'}),
+        ({'id': 'foo bar'}, {'id': 'foo bar', 'fast_path': 'id'}),
+        ({'name': 'q'}, {'name': 'q', 'fast_path': 'name'}),
+        ({'tag_name': 'ul', 'index': 0}, {'css': 'ul', 'fast_path': 'tag_name'}),
+        ({'tag_name': 'input', 'type': 'text'},
+         {'css': 'input[type="text"]', 'fast_path': 'input_type'}),
+    ])
+    def test_uses_native_lookups(self, builder, selector, built):
+        assert builder.build(selector) == built
+
+    @pytest.mark.parametrize('selector', [
+        {'id': True},
+        {'id': compile(r'foo')},
+        {'tag_name': 'ul', 'index': 2},
+        {'tag_name': 'div', 'type': 'text'},
+        {'tag_name': 'div', 'id': 'foo'},
+        {'tag_name': 'div', 'visible': True},
+    ])
+    def test_builds_other_selectors(self, builder, selector):
+        assert 'fast_path' not in builder.build(selector)
+
+    @pytest.mark.parametrize('selector, built', [
+        ({'id': 'foo'}, {'id': 'foo', 'fast_path': 'id'}),
+        ({'name': 'q'}, {'name': 'q', 'fast_path': 'name'}),
+        ({'tag_name': 'ul'}, {'xpath': ".//*[local-name()='ul']"}),
+    ])
+    def test_uses_id_and_name_lookups_with_the_xpath_strategy(self, browser_mock, selector,
+                                                              built):
+        builder = SelectorBuilder(ATTRIBUTES, browser_mock)
+        assert builder.build(selector) == built
+
+    def test_does_not_apply_to_specialized_builders(self, browser_mock):
+        from nerodia.locators.text_field.selector_builder import SelectorBuilder as TextFieldBuilder
+        browser_mock.browser.locator_strategy = 'css'
+        builder = TextFieldBuilder(ATTRIBUTES, browser_mock)
+        assert 'fast_path' not in builder.build({'tag_name': 'input', 'type': 'text'})
+
+    def test_merges_fast_path_scopes_as_xpath(self, browser_mock, element_mock):
+        from nerodia.locators.text_field.selector_builder import SelectorBuilder as TextFieldBuilder
+        browser_mock.browser.locator_strategy = 'css'
+        element_mock.browser.locator_strategy = 'css'
+        element_mock.selector_builder = SelectorBuilder(ATTRIBUTES, browser_mock)
+        element_mock.selector_builder.build({'id': 'foo'})
+
+        built = TextFieldBuilder(ATTRIBUTES, element_mock).build({'tag_name': 'input'})
+
+        assert 'scope' not in built
+        assert built['xpath'].startswith("(.//*[@id='foo'])[1]")
@@ -0,0 +1,75 @@
+import pytest
+from selenium.webdriver.remote.webelement import WebElement
+
+from nerodia.elements.table import Table
+from nerodia.exception import Error
+
+
+@pytest.fixture
+def table(mocker, browser_mock):
+    browser_mock.browser = browser_mock
+    yield Table(browser_mock, {'element': mocker.MagicMock(spec=WebElement)})
+
+
+def cells(*texts, header=False):
+    return [[text, header, 1, 1] for text in texts]
+
+
+class TestTableExtraction(object):
+    def test_reads_strings_with_one_script(self, browser_mock, table):
+        browser_mock.execute_script.return_value = [cells('Name', 'Age', header=True),
+                                                    cells('Ann', '32')]
+
+        assert table.strings == [['Name', 'Age'], ['Ann', '32']]
+        assert browser_mock.execute_script.call_count == 1
+        assert browser_mock.execute_script.call_args[1]['function_name'] == 'tableCells'
+
+    def test_reads_dicts_keyed_by_header_cells(self, browser_mock, table):
+        browser_mock.execute_script.return_value = [
+            cells('', header=False) + cells('Name', 'Age', header=True),
+            cells('1', 'Ann', '32'), cells('2', 'Bob', '')]
+
+        assert table.dicts == [{'Name': 'Ann', 'Age': '32'}, {'Name': 'Bob', 'Age': ''}]
+        assert table.header_texts == ['Name', 'Age']
+
+    def test_converts_the_column_of_a_header_cell(self, browser_mock, table):
+        browser_mock.execute_script.return_value = [
+            cells('', header=False) + cells('Name', 'Age', header=True),
+            cells('1', 'Ann', '32')]
+
+        assert table.row_dicts(converters={'Age': int}) == [{'Name': 'Ann', 'Age': 32}]
+        assert table.row_dicts(converters={1: str.upper}) == [{'Name': 'ANN', 'Age': '32'}]
+
+    def test_raises_for_rows_not_matching_the_header_row(self, browser_mock, table):
+        browser_mock.execute_script.return_value = [cells('Name', 'Age', header=True),
+                                                    cells('Ann')]
+        with pytest.raises(Error, match='row at index 0 has 1 cells'):
+            table.dicts
+
+        browser_mock.execute_script.return_value = []
+        with pytest.raises(Error, match='no rows in table'):
+            table.dicts
+
+    def test_expands_spans_and_converts_columns(self, browser_mock, table):
+        browser_mock.execute_script.return_value = [
+            [['Fruit', True, 1, 1], ['Price', True, 2, 1]],
+            [['Apple', False, 1, 2], ['1', False, 1, 1], ['2', False, 1, 1]],
+            [['3', False, 2, 1]]]
+
+        assert table.strings == [['Fruit', 'Price'], ['Apple', '1', '2'], ['3']]
+        assert table.cell_texts(expand_spans=True) == [['Fruit', 'Price', 'Price'],
+                                                       ['Apple', '1', '2'],
+                                                       ['Apple', '3', '3']]
+        assert table.cell_texts(expand_spans=True, converters={2: int})[2] == ['Apple', '3', 3]
+
+    def test_falls_back_to_first_row_for_headers(self, browser_mock, table):
+        browser_mock.execute_script.return_value = [cells('a', 'b')]
+        assert table.header_texts == ['a', 'b']
+
+    def test_streams_rows_in_chunks(self, mocker, table):
+        from nerodia.element_collection import ElementCollection
+        chunks = mocker.patch.object(ElementCollection, 'iter_chunks',
+                                     return_value=iter([['a', 'b'], ['c']]))
+
+        assert list(table.stream_rows(2)) == ['a', 'b', 'c']
+        chunks.assert_called_once_with(2, ('text',))